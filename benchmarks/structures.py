@@ -0,0 +1,92 @@
+"""
+(c) ΔQ Programming LLP, 2021
+This program is free software; you may redistribute and/or modify
+it under the terms of the Apache License v2.0.
+
+Benchmarks the time to decode and build the result objects of the 0.9.0
+list fixtures, and the memory the objects keep once the decoded JSON is
+released: as Munch objects, as records, as lazy objects (before any of their
+fields is read) and as normalised Munch objects. Run from the repository
+root:
+
+    python3 -m benchmarks.structures --items=2000
+"""
+import argparse
+import gc
+import json
+import os
+import time
+import tracemalloc
+
+from thothlibrary import ThothClient
+
+FIXTURES = os.path.join(os.path.dirname(__file__), '..', 'thothlibrary',
+                        'thoth-0_9_0', 'tests', 'fixtures')
+ENDPOINTS = ['works', 'books', 'contributions', 'contributors', 'fundings',
+             'imprints', 'institutions', 'issues', 'languages', 'prices',
+             'publications', 'publishers', 'serieses', 'subjects']
+
+
+def load_items(endpoint, items):
+    """
+    Reads a list fixture and repeats its items up to a number of items
+    @param endpoint: the name of the fixture and endpoint
+    @param items: the number of items to return
+    @return: the items as a JSON array
+    """
+    with open(os.path.join(FIXTURES, '{0}.json'.format(endpoint))) as fixture:
+        data = json.load(fixture)['data'][endpoint]
+    return json.dumps([data[index % len(data)] for index in range(items)])
+
+
+def measure(build, text, items):
+    """
+    Times the decoding and building of a result and measures the memory
+    held by the objects built
+    @param build: the function building the objects from the decoded items
+    @param text: the items as a JSON array
+    @param items: the number of items
+    @return: the time in milliseconds and the bytes held per item
+    """
+    gc.collect()
+    start = time.perf_counter()
+    build(json.loads(text))
+    elapsed = (time.perf_counter() - start) * 1000
+
+    gc.collect()
+    tracemalloc.start()
+    result = build(json.loads(text))
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return elapsed, size / items
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--items', type=int, default=2000)
+    parser.add_argument('--endpoints', nargs='*', default=ENDPOINTS)
+    args = parser.parse_args()
+
+    clients = {'munch': ThothClient(version='0.9.0'),
+               'record': ThothClient(version='0.9.0', records=True),
+               'lazy': ThothClient(version='0.9.0', lazy=True),
+               'norm': ThothClient(version='0.9.0', normalize=True)}
+
+    print('{0:<15}'.format('endpoint') + ''.join(
+        '{0:>12}'.format('{0} {1}'.format(mode, unit))
+        for unit in ('ms', 'B') for mode in clients))
+    for endpoint in args.endpoints:
+        text = load_items(endpoint, args.items)
+        results = [measure(lambda items, client=client:
+                           client._build_structure(endpoint, items), text,
+                           args.items)
+                   for client in clients.values()]
+        print('{0:<15}'.format(endpoint) +
+              ''.join('{0:>12.1f}'.format(ms) for ms, _ in results) +
+              ''.join('{0:>12.0f}'.format(size) for _, size in results))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+"""
+(c) ΔQ Programming LLP, 2021
+This program is free software; you may redistribute and/or modify
+it under the terms of the Apache License v2.0.
+
+Benchmarks the per-call latency of the GraphQL transport against a local stub
+server. Run from the repository root:
+
+    python3 -m benchmarks.transport --calls=500
+"""
+import argparse
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from thothlibrary import ThothClient
+
+FIXTURE = os.path.join(os.path.dirname(__file__), '..', 'thothlibrary',
+                       'thoth-0_9_0', 'tests', 'fixtures', 'works.json')
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """A GraphQL stub that answers every POST with a stored fixture"""
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    body = b''
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        """Reply to a GraphQL request"""
+        length = int(self.headers.get('Content-Length', 0))
+        self.rfile.read(length)
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, *args):
+        """Silence the default request logging"""
+
+
+def start_stub_server():
+    """
+    Starts the stub server in a background thread
+    @return: the server and its base URL
+    """
+    with open(FIXTURE, 'rb') as fixture:
+        StubHandler.body = fixture.read()
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    return server, 'http://127.0.0.1:{0}'.format(server.server_port)
+
+
+def _time_calls(calls, function):
+    """
+    Times a number of calls to a function
+    @param calls: the number of calls
+    @param function: the function to call
+    @return: the mean latency in milliseconds
+    """
+    start = time.perf_counter()
+    for _ in range(calls):
+        function()
+    return (time.perf_counter() - start) * 1000 / calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--calls', type=int, default=500)
+    args = parser.parse_args()
+
+    server, endpoint = start_stub_server()
+    graphql_endpoint = '{0}/graphql'.format(endpoint)
+    query = '{ works { workId } }'
+    payload = json.dumps({'query': query, 'variables': None}).encode('utf-8')
+    headers = {'Accept': 'application/json',
+               'Content-Type': 'application/json'}
+
+    def unpooled():
+        # the module-level call builds a throwaway session every time
+        response = requests.post(graphql_endpoint, data=payload,
+                                 headers=headers)
+        return response.content.decode('utf-8')
+
+    client = ThothClient(thoth_endpoint=endpoint)
+
+    def pooled():
+        return client.client.execute(query)
+
+    try:
+        # warm up both paths before measuring
+        unpooled()
+        pooled()
+
+        unpooled_ms = _time_calls(args.calls, unpooled)
+        pooled_ms = _time_calls(args.calls, pooled)
+    finally:
+        server.shutdown()
+
+    print('new connection per call: {0:.3f} ms/call'.format(unpooled_ms))
+    print('pooled keep-alive:       {0:.3f} ms/call'.format(pooled_ms))
+    print('speed-up:                {0:.2f}x'.format(unpooled_ms / pooled_ms))
+
+
+if __name__ == '__main__':
+    main()
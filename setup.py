@@ -39,6 +39,9 @@ setup(
         "ascii_magic==2.3.0",
         "graphqlclient==0.2.4",
     ],
+    extras_require={
+        "async": ["aiohttp==3.14.5"],
+    },
     long_description=LONG_DESCRIPTION,
     long_description_content_type="text/markdown",
     license="Apache 2.0",
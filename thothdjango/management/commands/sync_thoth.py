@@ -58,29 +58,29 @@ class Command(BaseCommand):
             publisher_model.publisher_name = publisher.publisherName
             publisher_model.save()
 
-            # we can handle a max of 9999 works at any one time
-            # Thoth does support pagination, but currently has no way of
-            # precisely querying the expected number of records
-            works = client.works(limit=9999, publishers='["{0}"]'.format(
+            # works are fetched page by page (the next page is requested
+            # while the current one is saved), so catalogues of any size are
+            # synchronised in constant memory
+            works = client.iter_works(publishers='["{0}"]'.format(
                 publisher.publisherId))
 
-            self._sync_works(publisher_model, thoth_sync, works)
+            work_ids = self._sync_works(publisher_model, thoth_sync, works)
 
-            self._verify_exists_in_thoth(thoth_sync, works)
+            self._verify_exists_in_thoth(thoth_sync, work_ids)
 
     @staticmethod
-    def _verify_exists_in_thoth(thoth_sync, works):
+    def _verify_exists_in_thoth(thoth_sync, work_ids):
         """
         Verifies that entries in our database are in remote Thoth servers
         :param thoth_sync: the Thoth instance
-        :param works: a list of works from a Thoth instance to check
+        :param work_ids: the set of work IDs found in the Thoth instance
         """
 
         works_in_db = Work.objects.filter(
             publisher__thoth_id=thoth_sync['publisher'])
 
         for work in works_in_db:
-            if any([x for x in works if str(x.workId) == str(work.thoth_id)]):
+            if str(work.thoth_id) in work_ids:
                 print("[Verified] {0} exists in Thoth".format(work))
             else:
                 print("[Unverified] Could not find {0} in Thoth. "
@@ -92,9 +92,14 @@ class Command(BaseCommand):
         Synchronizes works from the remote Thoth instance
         :param publisher_model: the publisher to use
         :param thoth_sync: the Thoth instance
-        :param works: a list of works from a Thoth instance to sync
+        :param works: an iterable of works from a Thoth instance to sync
+        :return: the set of synchronized work IDs
         """
+        work_ids = set()
+
         for work in works:
+            work_ids.add(str(work.workId))
+
             # build a work model
             work_model, created = Work.objects.get_or_create(
                 thoth_id=work.workId)
@@ -125,6 +130,8 @@ class Command(BaseCommand):
 
             self._sync_subjects(thoth_sync, work, work_model)
 
+        return work_ids
+
     @staticmethod
     def _sync_subjects(thoth_sync, work, work_model):
         """
@@ -6,9 +6,10 @@ __author__ = "Javier Arias <javi@openbookpublishers.com>"
 __copyright__ = "Copyright (c) 2020 Open Book Publishers"
 __license__ = "Apache 2.0"
 
+from .async_client import AsyncThothClient
 from .client import ThothClient
 from .errors import ThothError
 from .mutation import ThothMutation
 from .query import ThothQuery
 
-__all__ = ["ThothClient", "ThothQuery", "ThothMutation", "ThothError"]
+__all__ = ["ThothClient", "AsyncThothClient", "ThothQuery", "ThothMutation", "ThothError"]
@@ -0,0 +1,162 @@
+"""
+GraphQL client for Thoth
+
+(c) ΔQ Programming LLP, July 2021
+This programme is free software; you may redistribute and/or modify
+it under the terms of the Apache License v2.0.
+"""
+import functools
+import json
+
+from .client import ThothClient, THOTH_ENDPOINT, THOTH_VERSION
+from .client import PlannedMutation, PlannedQuery
+from .columnar import column_paths, to_columns
+from .errors import AuthorizationError
+from .graphql import AsyncGraphQLClient, DEFAULT_ASYNC_LIMIT
+from .graphql import DEFAULT_COMPRESS_THRESHOLD, DEFAULT_TIMEOUT
+from .mutation import ThothMutation
+from .query import ThothQuery
+from .retry import RetryPolicy
+
+
+class AsyncThothClient:
+    """
+    Asynchronous client to Thoth's GraphQL API.
+
+    Every endpoint method of the versioned ThothClient (works, work_by_id,
+    create_work...) is available as a coroutine with the same arguments;
+    the helpers that send several requests (fetch_all, paginate, iter_works,
+    stream, batch...) are not. The requests are built from the same QUERIES
+    fixtures and the results pass through the same StructureBuilder as the
+    blocking client.
+    """
+
+    def __init__(self, thoth_endpoint=THOTH_ENDPOINT, version=THOTH_VERSION,
+                 limit=DEFAULT_ASYNC_LIMIT, limit_per_host=0,
+                 keep_alive=True, retry_policy=None, rate_limiter=None,
+                 compress_requests=False,
+                 compress_threshold=DEFAULT_COMPRESS_THRESHOLD,
+                 timeout=DEFAULT_TIMEOUT, records=False, lazy=False,
+                 normalize=False):
+        """
+        Returns a new AsyncThothClient at the specified endpoint
+        @param thoth_endpoint: the Thoth API instance endpoint
+        @param version: the version of the Thoth API to use
+        @param limit: the maximum number of simultaneous connections
+        @param limit_per_host: the maximum connections per host (0: no limit)
+        @param keep_alive: whether to keep connections open between requests
+        @param retry_policy: the RetryPolicy deciding when failed requests are
+        sent again
+        @param rate_limiter: a TokenBucket pacing every request
+        @param compress_requests: whether to gzip large request bodies
+        @param compress_threshold: the smallest request body to gzip, in bytes
+        @param timeout: the (connect, read) socket timeouts in seconds
+        @param records: whether to build results as records rather than Munch
+        objects (see thothlibrary.records)
+        @param lazy: whether to build results as LazyMunch objects, which
+        convert nested objects only when they are read (see thothlibrary.lazy)
+        @param normalize: whether to share repeated entities and strings
+        within each result (see thothlibrary.normalize)
+        """
+        # the blocking client is only used to build requests and structures
+        self.sync_client = ThothClient(thoth_endpoint=thoth_endpoint,
+                                       version=version, records=records,
+                                       lazy=lazy, normalize=normalize)
+        self.QUERIES = self.sync_client.QUERIES
+        self.auth_endpoint = self.sync_client.auth_endpoint
+        self.client = AsyncGraphQLClient(self.sync_client.graphql_endpoint,
+                                         limit=limit,
+                                         limit_per_host=limit_per_host,
+                                         keep_alive=keep_alive,
+                                         rate_limiter=rate_limiter,
+                                         compress_requests=compress_requests,
+                                         compress_threshold=compress_threshold,
+                                         timeout=timeout)
+        self.retry_policy = retry_policy or RetryPolicy()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    def __getattr__(self, name):
+        # only called for attributes that are not defined here, i.e. the
+        # endpoint methods of the versioned blocking client
+        method = getattr(self.sync_client, name)
+        if name.startswith('_') or not callable(method):
+            return method
+        if not self.sync_client._is_endpoint(name):
+            raise AttributeError('{0} is only available on ThothClient'
+                                 .format(name))
+
+        @functools.wraps(method)
+        async def endpoint(*args, **kwargs):
+            plan = self.sync_client._plan(name, *args, **kwargs)
+            if not isinstance(plan, (PlannedQuery, PlannedMutation)):
+                raise TypeError('{0} does not send a request'.format(name))
+            return await self._execute(plan)
+
+        return endpoint
+
+    async def close(self):
+        """Close the pooled HTTP session"""
+        await self.client.close()
+
+    async def login(self, email, password):
+        """Obtain an authentication token"""
+        session = self.client._get_session()
+        payload = {'email': email, 'password': password}
+        async with session.post(
+                self.auth_endpoint, json=payload,
+                timeout=self.client.client_timeout()) as response:
+            body = await response.text()
+            if response.status == 401:
+                raise AuthorizationError(self.auth_endpoint,
+                                         'Wrong credentials')
+        try:
+            token = json.loads(body)['token']
+        except (KeyError, TypeError, ValueError):
+            raise AuthorizationError(self.auth_endpoint, body)
+        self.client.inject_token("Bearer {}".format(token))
+
+    async def mutation(self, mutation_name, data, nested=True):
+        """Instantiate a thoth mutation and execute it"""
+        mutation = ThothMutation(mutation_name, data, nested)
+        return await self.retry_policy.call_async(
+            lambda: mutation.run_async(self.client), idempotent=False)
+
+    async def query(self, query_name, parameters, raw=False, fields=None,
+                    profile=None):
+        """Instantiate a thoth query and execute"""
+        query = ThothQuery(query_name, parameters, self.QUERIES, raw=raw,
+                           fields=fields, profile=profile)
+        return await self.retry_policy.call_async(
+            lambda: query.run_async(self.client))
+
+    async def _execute(self, plan):
+        """
+        Sends a request recorded from the blocking client
+        @param plan: a PlannedQuery or a PlannedMutation
+        @return: the result of the request
+        """
+        if isinstance(plan, PlannedMutation):
+            return await self.mutation(plan.mutation_name, plan.data,
+                                       nested=plan.nested)
+
+        if plan.options.get('with_count'):
+            raise ValueError('with_count is only supported by ThothClient')
+        return_raw = plan.options.get('return_raw', False)
+        columnar = plan.options.get('columnar')
+        if columnar and return_raw:
+            raise ValueError('Columnar results can not be raw')
+        response = await self.query(plan.endpoint_name, plan.parameters,
+                                    raw=return_raw,
+                                    fields=plan.options.get('fields'),
+                                    profile=plan.options.get('profile'))
+
+        if return_raw:
+            return response
+        if columnar:
+            return to_columns(response, column_paths(columnar))
+        return self.sync_client._build_structure(plan.endpoint_name, response)
@@ -10,19 +10,26 @@ it under the terms of the Apache License v2.0.
 import json
 import urllib
 import requests
+from . import deadline
+from .deadline import DEFAULT_TIMEOUT
 from .errors import AuthorizationError
 
 
 class ThothAuthenticator():  # pylint: disable=too-few-public-methods
     """Authentication handler"""
-    def __init__(self, auth_endpoint, email, password):
+    def __init__(self, auth_endpoint, email, password,
+                 timeout=DEFAULT_TIMEOUT):
         self.auth_endpoint = auth_endpoint
         self.payload = {'email': email, 'password': password}
+        self.timeout = timeout
 
     def get_token(self):
         """Perform an authentication request"""
         try:
-            response = requests.post(self.auth_endpoint, json=self.payload)
+            timeout = deadline.effective_timeout(self.timeout,
+                                                 self.auth_endpoint)
+            response = requests.post(self.auth_endpoint, json=self.payload,
+                                     timeout=timeout)
             if response.status_code == 401:
                 raise AuthorizationError(self.auth_endpoint, 'Wrong credentials')
             token = response.json()['token']
@@ -0,0 +1,201 @@
+"""
+GraphQL client for Thoth
+
+(c) ΔQ Programming LLP, July 2021
+This programme is free software; you may redistribute and/or modify
+it under the terms of the Apache License v2.0.
+"""
+import json
+
+from .errors import ThothError, ResponseEmptyError, GraphQLError
+from .errors import TransportError
+from .graphql import TRANSPORT_ERRORS
+from .query import ThothQuery, QUERY_ERRORS
+
+
+class BatchResult:
+    """The pending result of an endpoint call recorded in a ThothBatch"""
+
+    def __init__(self, batch, endpoint_name, query):
+        self.batch = batch
+        self.endpoint_name = endpoint_name
+        self.query = query
+        self.done = False
+        self._value = None
+        self._error = None
+
+    def result(self):
+        """
+        Returns the result of the call, sending the batch first if needed
+        @return: an object or raw result, as the endpoint method would return
+        """
+        if not self.done:
+            self.batch.execute()
+        if self._error is not None:
+            raise self._error
+        return self._value
+
+    def _resolve(self, value=None, error=None):
+        self._value = value
+        self._error = error
+        self.done = True
+
+
+class ThothBatch:
+    """
+    Records endpoint calls and sends them to Thoth as a single GraphQL
+    document, in which every call is aliased. Use it as a context manager:
+
+        with client.batch() as batch:
+            works = batch.work_count()
+            books = batch.book_count()
+        print(works.result(), books.result())
+
+    Each call's result (or error) is available from its BatchResult once the
+    batch has been executed.
+    """
+
+    def __init__(self, client):
+        """
+        Creates a batch on a versioned ThothClient
+        @param client: the client whose endpoint methods are recorded
+        """
+        self.client = client
+        self.calls = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.execute()
+
+    def __getattr__(self, name):
+        method = getattr(self.client, name)
+        if name.startswith('_') or not callable(method):
+            return method
+        if not self.client._is_endpoint(name):
+            raise AttributeError('{0} can not be batched'.format(name))
+
+        def record(*args, **kwargs):
+            plan = self.client._plan(name, *args, **kwargs)
+            return self.add(plan)
+
+        return record
+
+    def add(self, plan):
+        """
+        Adds a planned query (see ThothClient._plan) to the batch
+        @param plan: the PlannedQuery
+        @return: a BatchResult
+        """
+        if not hasattr(plan, 'endpoint_name'):
+            raise ValueError('Only queries can be batched')
+        if plan.options.get('with_count'):
+            raise ValueError('Calls with a count can not be batched')
+        if plan.options.get('columnar'):
+            raise ValueError('Columnar calls can not be batched')
+
+        query = ThothQuery(plan.endpoint_name, plan.parameters,
+                           self.client.QUERIES,
+                           raw=plan.options.get('return_raw', False),
+                           fields=plan.options.get('fields'),
+                           profile=plan.options.get('profile'))
+        call = BatchResult(self, plan.endpoint_name, query)
+        self.calls.append(call)
+        return call
+
+    def execute(self):
+        """
+        Sends every pending call as one request and resolves the results
+        @return: the list of BatchResults
+        """
+        pending = [call for call in self.calls if not call.done]
+        if not pending:
+            return self.calls
+
+        selections = []
+        definitions = []
+        variables = {}
+
+        for index, call in enumerate(pending):
+            selection, definition, values = \
+                call.query.prepare_aliased('q{0}'.format(index))
+            selections.append(selection)
+            if definition:
+                definitions.append(definition)
+            variables.update(values)
+
+        request = "query{0} {{\n{1}\n}}".format(
+            "(" + ", ".join(definitions) + ")" if definitions else '',
+            "\n".join(selections))
+
+        try:
+            serialised, result = self._send(request, variables or None)
+        except ThothError as error:
+            for call in pending:
+                call._resolve(error=error)
+            return self.calls
+
+        self._resolve_calls(pending, serialised, request, result)
+        return self.calls
+
+    def _send(self, request, variables):
+        """
+        Sends the merged document and decodes the response
+        @param request: the GraphQL document
+        @param variables: the merged variables
+        @return: the decoded response and its text
+        """
+        def send():
+            result = ""
+            try:
+                result = self.client.client.execute(request, variables)
+                if result == "":
+                    raise ResponseEmptyError(request, "None")
+                return json.loads(result), result
+            except TRANSPORT_ERRORS as error:
+                raise TransportError(request, error) from error
+            except QUERY_ERRORS as error:
+                raise ThothError(request, result or error)
+
+        return self.client.retry_policy.call(send)
+
+    def _resolve_calls(self, pending, serialised, request, result):
+        """
+        Splits a batched response into the results of its calls
+        @param pending: the calls that were sent
+        @param serialised: the decoded response
+        @param request: the GraphQL document that was sent
+        @param result: the response text
+        @return: None
+        """
+        errors = {}
+        for error in serialised.get('errors') or []:
+            path = error.get('path') or [None]
+            errors.setdefault(path[0], []).append(error)
+
+        data = serialised.get('data') or {}
+
+        for index, call in enumerate(pending):
+            alias = 'q{0}'.format(index)
+            query = call.query
+
+            if alias in errors or None in errors:
+                response = json.dumps({'errors': errors.get(alias, []) +
+                                       errors.get(None, [])})
+                call._resolve(error=GraphQLError(query.request, response))
+                continue
+
+            try:
+                value = data[alias]
+                if query.raw:
+                    value = json.dumps({'data': {query.query_name: value}})
+                else:
+                    value = self.client._build_structure(call.endpoint_name,
+                                                         value)
+            except QUERY_ERRORS:
+                call._resolve(error=ThothError(request, result))
+                continue
+
+            call._resolve(value=value)
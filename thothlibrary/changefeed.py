@@ -0,0 +1,188 @@
+"""
+GraphQL client for Thoth
+
+(c) ΔQ Programming LLP, July 2021
+This programme is free software; you may redistribute and/or modify
+it under the terms of the Apache License v2.0.
+"""
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+from contextlib import contextmanager
+
+
+class ChangeFeed:
+    """
+    Iterates over the records updated at or after a watermark, in order of
+    updatedAtWithRelations, and tracks the new watermark as they are read.
+
+    Because records arrive in ascending order, the watermark after any
+    record is a safe place to resume from: commit() may be called at any
+    point, not only once the feed is exhausted. The watermark is inclusive,
+    so the records sharing the last timestamp are read again by the next
+    run; consumers should apply records idempotently (upsert by ID).
+
+        store = FileWatermarkStore('watermarks.json')
+        feed = client.changes_since(store=store)
+        for work in feed:
+            mirror.upsert(work)
+        feed.commit()
+    """
+
+    def __init__(self, paginator, since=None, store=None, name='works',
+                 key='updatedAtWithRelations'):
+        """
+        Creates a change feed
+        @param paginator: a KeysetPaginator starting at since
+        @param since: the watermark the feed starts from, or None
+        @param store: the watermark store that commit() saves to, or None
+        @param name: the name of the watermark in the store
+        @param key: the timestamp field the records are ordered by
+        """
+        self.paginator = paginator
+        self.since = since
+        self.watermark = since
+        self.store = store
+        self.name = name
+        self.key = key
+        self.changes = 0
+
+    def __iter__(self):
+        for record in self.paginator:
+            self.watermark = getattr(record, self.key)
+            self.changes += 1
+            yield record
+
+    def commit(self):
+        """
+        Saves the current watermark to the store
+        @return: the watermark saved, or None if there is nothing to save
+        """
+        if self.store is None:
+            raise ValueError('The change feed has no watermark store')
+        if self.watermark is not None and self.watermark != self.since:
+            self.store.save(self.name, self.watermark)
+        return self.watermark
+
+
+class FileWatermarkStore:
+    """
+    Keeps watermarks in a JSON file, one per name. The file is replaced
+    atomically, so an interrupted run leaves the previous watermarks intact.
+    """
+
+    def __init__(self, path):
+        """
+        Creates a file watermark store
+        @param path: the JSON file holding the watermarks
+        """
+        self.path = path
+        self._lock = threading.Lock()
+
+    def load(self, name):
+        """
+        Returns a stored watermark
+        @param name: the name of the watermark
+        @return: the timestamp, or None if none was saved
+        """
+        return self._read().get(name)
+
+    def save(self, name, timestamp):
+        """
+        Stores a watermark
+        @param name: the name of the watermark
+        @param timestamp: the timestamp to resume from
+        @return: None
+        """
+        with self._lock:
+            watermarks = self._read()
+            watermarks[name] = timestamp
+            directory = os.path.dirname(os.path.abspath(self.path))
+            descriptor, temporary = tempfile.mkstemp(dir=directory)
+            try:
+                with os.fdopen(descriptor, 'w') as watermark_file:
+                    json.dump(watermarks, watermark_file, indent=4,
+                              sort_keys=True)
+                # mkstemp creates the file readable by its owner only
+                os.chmod(temporary, self._mode())
+                os.replace(temporary, self.path)
+            except BaseException:
+                os.unlink(temporary)
+                raise
+
+    def _mode(self):
+        """
+        Returns the permissions of the watermark file, or those that open()
+        would give a new file
+        """
+        try:
+            return os.stat(self.path).st_mode & 0o7777
+        except FileNotFoundError:
+            umask = os.umask(0)
+            os.umask(umask)
+            return 0o666 & ~umask
+
+    def _read(self):
+        try:
+            with open(self.path, 'r') as watermark_file:
+                return json.load(watermark_file)
+        except FileNotFoundError:
+            return {}
+
+
+class SQLiteWatermarkStore:
+    """
+    Keeps watermarks in a table of an SQLite database, which can be the
+    mirror's own database so that records and watermark live side by side.
+    """
+
+    def __init__(self, path, table='thoth_watermarks'):
+        """
+        Creates an SQLite watermark store, creating its table if needed
+        @param path: the database file
+        @param table: the name of the table holding the watermarks
+        """
+        if not table.isidentifier():
+            raise ValueError('Invalid table name: {0}'.format(table))
+        self.path = path
+        self.table = table
+        with self._connect() as connection:
+            connection.execute('CREATE TABLE IF NOT EXISTS {0} '
+                               '(name TEXT PRIMARY KEY, timestamp TEXT NOT '
+                               'NULL)'.format(table))
+
+    def load(self, name):
+        """
+        Returns a stored watermark
+        @param name: the name of the watermark
+        @return: the timestamp, or None if none was saved
+        """
+        with self._connect() as connection:
+            row = connection.execute('SELECT timestamp FROM {0} WHERE name = '
+                                     '?'.format(self.table),
+                                     (name,)).fetchone()
+        return row[0] if row else None
+
+    def save(self, name, timestamp):
+        """
+        Stores a watermark
+        @param name: the name of the watermark
+        @param timestamp: the timestamp to resume from
+        @return: None
+        """
+        with self._connect() as connection:
+            connection.execute('INSERT OR REPLACE INTO {0} (name, timestamp) '
+                               'VALUES (?, ?)'.format(self.table),
+                               (name, timestamp))
+
+    @contextmanager
+    def _connect(self):
+        """Opens a connection, committing (or rolling back) and closing it"""
+        connection = sqlite3.connect(self.path)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
@@ -11,6 +11,9 @@ from os import getenv
 
 import thothlibrary
 
+# the first API version whose endpoints take fields and profile
+FIELD_SELECTION_VERSION = (0, 9, 0)
+
 
 def _raw_parse(value):
     """
@@ -67,6 +70,29 @@ class ThothAPI:
         self.client = GraphQLClient(self.graphql_endpoint)
         self.version = self.version.replace('.', '_')
 
+    def _projection(self, fields, profile):
+        """
+        Returns the fields and profile arguments of an endpoint call, leaving
+        them out when they are not given so that API versions without field
+        selection still work, and refusing them for those versions
+        :param fields: the value of the --fields flag
+        :param profile: the value of the --profile flag
+        :return: a dictionary of keyword arguments
+        """
+        arguments = {}
+        if fields:
+            if isinstance(fields, tuple):
+                fields = list(fields)
+            arguments['fields'] = fields
+        if profile:
+            arguments['profile'] = profile
+
+        version = tuple(int(part) for part in self.version.split('_'))
+        if arguments and version < FIELD_SELECTION_VERSION:
+            raise ValueError('--fields and --profile need version 0.9.0 or '
+                             'later; add --version=0.9.0')
+        return arguments
+
     def _set_credentials(self):
         """
         Get user's Thoth credentials
@@ -79,20 +105,25 @@ class ThothAPI:
         self.thoth_pwd = input('Thoth password: ')
 
     @fire.decorators.SetParseFn(_raw_parse)
-    def contribution(self, contribution_id, raw=False, version=None,
-                     endpoint=None, serialize=False):
+    def contribution(self, contribution_id, raw=False, fields=None,
+                     profile=None, version=None, endpoint=None,
+                     serialize=False):
         """
         Retrieves a contribution by ID from a Thoth instance
         :param str contribution_id: the contributor to fetch
         :param bool raw: whether to return a python object or the raw result
+        :param str fields: comma-separated fields to fetch, or -fields to omit
+        :param str profile: a selection profile (e.g. ids, summary or full)
         :param str version: a custom Thoth version
         :param str endpoint: a custom Thoth endpoint
         :param bool serialize: return a pickled python object
         """
         self._override_version(version=version, endpoint=endpoint)
+        projection = self._projection(fields, profile)
 
         contribution = self._client().contribution(
-            contribution_id=contribution_id, raw=raw)
+            contribution_id=contribution_id, raw=raw,
+            **projection)
 
         if not serialize:
             print(contribution)
@@ -101,8 +132,9 @@ class ThothAPI:
 
     @fire.decorators.SetParseFn(_raw_parse)
     def contributions(self, limit=100, order=None, offset=0, publishers=None,
-                      contribution_type=None, raw=False, version=None,
-                      endpoint=None, serialize=False):
+                      contribution_type=None, raw=False, fields=None,
+                      profile=None, version=None, endpoint=None,
+                      serialize=False):
         """
         Retrieves contributions from a Thoth instance
         :param int limit: the maximum number of results to return
@@ -111,15 +143,19 @@ class ThothAPI:
         :param str publishers: a list of publishers to limit by
         :param str contribution_type: the contribution type (e.g. AUTHOR)
         :param bool raw: whether to return a python object or the raw result
+        :param str fields: comma-separated fields to fetch, or -fields to omit
+        :param str profile: a selection profile (e.g. ids, summary or full)
         :param str version: a custom Thoth version
         :param str endpoint: a custom Thoth endpoint
         :param bool serialize: return a pickled python object
         """
         self._override_version(version=version, endpoint=endpoint)
+        projection = self._projection(fields, profile)
 
         contribs = self._client().contributions(
             limit=limit, order=order, offset=offset, publishers=publishers,
-            contribution_type=contribution_type, raw=raw)
+            contribution_type=contribution_type, raw=raw,
+            **projection)
 
         if not raw and not serialize:
             print(*contribs, sep='\n')
@@ -148,20 +184,24 @@ class ThothAPI:
             contribution_type=contribution_type, raw=raw))
 
     @fire.decorators.SetParseFn(_raw_parse)
-    def contributor(self, contributor_id, raw=False, version=None,
-                    endpoint=None, serialize=False):
+    def contributor(self, contributor_id, raw=False, fields=None, profile=None,
+                    version=None, endpoint=None, serialize=False):
         """
         Retrieves a contributor by ID from a Thoth instance
         :param str contributor_id: the contributor to fetch
         :param bool raw: whether to return a python object or the raw result
+        :param str fields: comma-separated fields to fetch, or -fields to omit
+        :param str profile: a selection profile (e.g. ids, summary or full)
         :param str version: a custom Thoth version
         :param str endpoint: a custom Thoth endpoint
         :param bool serialize: return a pickled python object
         """
         self._override_version(version=version, endpoint=endpoint)
+        projection = self._projection(fields, profile)
 
-        contributor = self._client().contributor(contributor_id=contributor_id,
-                                                 raw=raw)
+        contributor = self._client().contributor(
+            contributor_id=contributor_id, raw=raw,
+            **projection)
 
         if not serialize:
             print(contributor)
@@ -170,7 +210,8 @@ class ThothAPI:
 
     @fire.decorators.SetParseFn(_raw_parse)
     def contributors(self, limit=100, order=None, offset=0, search=None,
-                     raw=False, version=None, endpoint=None, serialize=False):
+                     raw=False, fields=None, profile=None, version=None,
+                     endpoint=None, serialize=False):
         """
         Retrieves contributors from a Thoth instance
         :param int limit: the maximum number of results to return
@@ -178,16 +219,20 @@ class ThothAPI:
         :param int offset: the offset from which to retrieve results
         :param str search: a search string to search
         :param bool raw: whether to return a python object or the raw result
+        :param str fields: comma-separated fields to fetch, or -fields to omit
+        :param str profile: a selection profile (e.g. ids, summary or full)
         :param str version: a custom Thoth version
         :param str endpoint: a custom Thoth endpoint
         :param bool serialize: return a pickled python object
         """
         self._override_version(version=version, endpoint=endpoint)
+        projection = self._projection(fields, profile)
 
         contribs = self._client().contributors(limit=limit, order=order,
                                                offset=offset,
                                                search=search,
-                                               raw=raw)
+                                               raw=raw,
+                                               **projection)
 
         if not raw and not serialize:
             print(*contribs, sep='\n')
@@ -212,20 +257,24 @@ class ThothAPI:
         print(self._client().contributor_count(search=search, raw=raw))
 
     @fire.decorators.SetParseFn(_raw_parse)
-    def institution(self, institution_id, raw=False, version=None,
-                    endpoint=None, serialize=False):
+    def institution(self, institution_id, raw=False, fields=None, profile=None,
+                    version=None, endpoint=None, serialize=False):
         """
         Retrieves an institution by ID from a Thoth instance
         :param str institution_id: the institution to fetch
         :param bool raw: whether to return a python object or the raw result
+        :param str fields: comma-separated fields to fetch, or -fields to omit
+        :param str profile: a selection profile (e.g. ids, summary or full)
         :param str version: a custom Thoth version
         :param str endpoint: a custom Thoth endpoint
         :param bool serialize: return a pickled python object
         """
         self._override_version(version=version, endpoint=endpoint)
+        projection = self._projection(fields, profile)
 
         funder = self._client().institution(institution_id=institution_id,
-                                            raw=raw)
+                                            raw=raw,
+                                            **projection)
 
         if not serialize:
             print(funder)
@@ -234,7 +283,8 @@ class ThothAPI:
 
     @fire.decorators.SetParseFn(_raw_parse)
     def institutions(self, limit=100, order=None, offset=0, search=None,
-                     raw=False, version=None, endpoint=None, serialize=False):
+                     raw=False, fields=None, profile=None, version=None,
+                     endpoint=None, serialize=False):
         """
         Retrieves institutions from a Thoth instance
         :param int limit: the maximum number of results to return
@@ -242,15 +292,19 @@ class ThothAPI:
         :param int offset: the offset from which to retrieve results
         :param str search: a search string to search
         :param bool raw: whether to return a python object or the raw result
+        :param str fields: comma-separated fields to fetch, or -fields to omit
+        :param str profile: a selection profile (e.g. ids, summary or full)
         :param str version: a custom Thoth version
         :param str endpoint: a custom Thoth endpoint
         :param bool serialize: return a pickled python object
         """
         self._override_version(version=version, endpoint=endpoint)
+        projection = self._projection(fields, profile)
 
         funders = self._client().institutions(limit=limit, order=order,
                                               offset=offset, search=search,
-                                              raw=raw)
+                                              raw=raw,
+                                              **projection)
 
         if not raw and not serialize:
             print(*funders, sep='\n')
@@ -273,19 +327,23 @@ class ThothAPI:
         print(self._client().funder_count(search=search, raw=raw))
 
     @fire.decorators.SetParseFn(_raw_parse)
-    def funding(self, funding_id, raw=False, version=None, endpoint=None,
-                serialize=False):
+    def funding(self, funding_id, raw=False, fields=None, profile=None,
+                version=None, endpoint=None, serialize=False):
         """
         Retrieves a funding by ID from a Thoth instance
         :param str funding_id: the funding to fetch
         :param bool raw: whether to return a python object or the raw result
+        :param str fields: comma-separated fields to fetch, or -fields to omit
+        :param str profile: a selection profile (e.g. ids, summary or full)
         :param str version: a custom Thoth version
         :param str endpoint: a custom Thoth endpoint
         :param bool serialize: return a pickled python object
         """
         self._override_version(version=version, endpoint=endpoint)
+        projection = self._projection(fields, profile)
 
-        funding = self._client().funding(funding_id=funding_id, raw=raw)
+        funding = self._client().funding(funding_id=funding_id, raw=raw,
+                                         **projection)
 
         if not serialize:
             print(funding)
@@ -294,7 +352,8 @@ class ThothAPI:
 
     @fire.decorators.SetParseFn(_raw_parse)
     def fundings(self, limit=100, order=None, offset=0, publishers=None,
-                 raw=False, version=None, endpoint=None, serialize=False):
+                 raw=False, fields=None, profile=None, version=None,
+                 endpoint=None, serialize=False):
         """
         Retrieves fundings from a Thoth instance
         :param int limit: the maximum number of results to return
@@ -302,15 +361,19 @@ class ThothAPI:
         :param int offset: the offset from which to retrieve results
         :param str publishers: a list of publishers to limit by
         :param bool raw: whether to return a python object or the raw result
+        :param str fields: comma-separated fields to fetch, or -fields to omit
+        :param str profile: a selection profile (e.g. ids, summary or full)
         :param str version: a custom Thoth version
         :param str endpoint: a custom Thoth endpoint
         :param bool serialize: return a pickled python object
         """
         self._override_version(version=version, endpoint=endpoint)
+        projection = self._projection(fields, profile)
 
         fundings = self._client().fundings(limit=limit, order=order,
                                            offset=offset, publishers=publishers,
-                                           raw=raw)
+                                           raw=raw,
+                                           **projection)
 
         if not raw and not serialize:
             print(*fundings, sep='\n')
@@ -332,19 +395,23 @@ class ThothAPI:
         print(self._client().funding_count(raw=raw))
 
     @fire.decorators.SetParseFn(_raw_parse)
-    def imprint(self, imprint_id, raw=False, version=None, endpoint=None,
-                serialize=False):
+    def imprint(self, imprint_id, raw=False, fields=None, profile=None,
+                version=None, endpoint=None, serialize=False):
         """
         Retrieves an imprint by ID from a Thoth instance
         :param str imprint_id: the imprint to fetch
         :param bool raw: whether to return a python object or the raw result
+        :param str fields: comma-separated fields to fetch, or -fields to omit
+        :param str profile: a selection profile (e.g. ids, summary or full)
         :param str version: a custom Thoth version
         :param str endpoint: a custom Thoth endpoint
         :param bool serialize: return a pickled python object
         """
         self._override_version(version=version, endpoint=endpoint)
+        projection = self._projection(fields, profile)
 
-        imprint = self._client().imprint(imprint_id=imprint_id, raw=raw)
+        imprint = self._client().imprint(imprint_id=imprint_id, raw=raw,
+                                         **projection)
 
         if not serialize:
             print(imprint)
@@ -353,8 +420,8 @@ class ThothAPI:
 
     @fire.decorators.SetParseFn(_raw_parse)
     def imprints(self, limit=100, order=None, offset=0, publishers=None,
-                 search=None, raw=False, version=None, endpoint=None,
-                 serialize=False):
+                 search=None, raw=False, fields=None, profile=None,
+                 version=None, endpoint=None, serialize=False):
         """
         Retrieves imprints from a Thoth instance
         :param int limit: the maximum number of results to return
@@ -363,17 +430,21 @@ class ThothAPI:
         :param str publishers: a list of publishers to limit by
         :param str search: a search string to search
         :param bool raw: whether to return a python object or the raw result
+        :param str fields: comma-separated fields to fetch, or -fields to omit
+        :param str profile: a selection profile (e.g. ids, summary or full)
         :param str version: a custom Thoth version
         :param str endpoint: a custom Thoth endpoint
         :param bool serialize: return a pickled python object
         """
         self._override_version(version=version, endpoint=endpoint)
+        projection = self._projection(fields, profile)
 
         imprints = self._client().imprints(limit=limit, order=order,
                                            offset=offset,
                                            publishers=publishers,
                                            search=search,
-                                           raw=raw)
+                                           raw=raw,
+                                           **projection)
 
         if not raw and not serialize:
             print(*imprints, sep='\n')
@@ -400,19 +471,23 @@ class ThothAPI:
                                            raw=raw))
 
     @fire.decorators.SetParseFn(_raw_parse)
-    def issue(self, issue_id, raw=False, version=None, endpoint=None,
-              serialize=False):
+    def issue(self, issue_id, raw=False, fields=None, profile=None,
+              version=None, endpoint=None, serialize=False):
         """
         Retrieves an issue by ID from a Thoth instance
         :param str issue_id: the issue to fetch
         :param bool raw: whether to return a python object or the raw result
+        :param str fields: comma-separated fields to fetch, or -fields to omit
+        :param str profile: a selection profile (e.g. ids, summary or full)
         :param str version: a custom Thoth version
         :param str endpoint: a custom Thoth endpoint
         :param bool serialize: return a pickled python object
         """
         self._override_version(version=version, endpoint=endpoint)
+        projection = self._projection(fields, profile)
 
-        issue = self._client().issue(issue_id=issue_id, raw=raw)
+        issue = self._client().issue(issue_id=issue_id, raw=raw,
+                                     **projection)
 
         if not serialize:
             print(issue)
@@ -421,8 +496,8 @@ class ThothAPI:
 
     @fire.decorators.SetParseFn(_raw_parse)
     def issues(self, limit=100, order=None, offset=0, publishers=None,
-               search=None, raw=False, version=None, endpoint=None,
-               serialize=False):
+               search=None, raw=False, fields=None, profile=None, version=None,
+               endpoint=None, serialize=False):
         """
         Retrieves issues from a Thoth instance
         :param int limit: the maximum number of results to return
@@ -431,17 +506,20 @@ class ThothAPI:
         :param str publishers: a list of publishers to limit by
         :param str search: a search string to search
         :param bool raw: whether to return a python object or the raw result
+        :param str fields: comma-separated fields to fetch, or -fields to omit
+        :param str profile: a selection profile (e.g. ids, summary or full)
         :param str version: a custom Thoth version
         :param str endpoint: a custom Thoth endpoint
         :param bool serialize: return a pickled python object
         """
         self._override_version(version=version, endpoint=endpoint)
+        projection = self._projection(fields, profile)
 
         issues = self._client().issues(limit=limit, order=order,
                                        offset=offset,
                                        publishers=publishers,
                                        search=search,
-                                       raw=raw)
+                                       raw=raw, **projection)
 
         if not raw and not serialize:
             print(*issues, sep='\n')
@@ -463,19 +541,23 @@ class ThothAPI:
         print(self._client().issue_count(raw=raw))
 
     @fire.decorators.SetParseFn(_raw_parse)
-    def language(self, language_id, raw=False, version=None, endpoint=None,
-                 serialize=False):
+    def language(self, language_id, raw=False, fields=None, profile=None,
+                 version=None, endpoint=None, serialize=False):
         """
         Retrieves a language by ID from a Thoth instance
         :param str language_id: the language to fetch
         :param bool raw: whether to return a python object or the raw result
+        :param str fields: comma-separated fields to fetch, or -fields to omit
+        :param str profile: a selection profile (e.g. ids, summary or full)
         :param str version: a custom Thoth version
         :param str endpoint: a custom Thoth endpoint
         :param bool serialize: return a pickled python object
         """
         self._override_version(version=version, endpoint=endpoint)
+        projection = self._projection(fields, profile)
 
-        lang = self._client().language(language_id=language_id, raw=raw)
+        lang = self._client().language(language_id=language_id, raw=raw,
+                                       **projection)
 
         if not serialize:
             print(lang)
@@ -484,8 +566,9 @@ class ThothAPI:
 
     @fire.decorators.SetParseFn(_raw_parse)
     def languages(self, limit=100, order=None, offset=0, publishers=None,
-                  search=None, raw=False, version=None, endpoint=None,
-                  serialize=False, language_codes=None, language_relation=None):
+                  search=None, raw=False, fields=None, profile=None,
+                  version=None, endpoint=None, serialize=False,
+                  language_codes=None, language_relation=None):
         """
         Retrieves languages from a Thoth instance
         :param int limit: the maximum number of results to return
@@ -494,6 +577,8 @@ class ThothAPI:
         :param str publishers: a list of publishers to limit by
         :param str search: a search string to search
         :param bool raw: whether to return a python object or the raw result
+        :param str fields: comma-separated fields to fetch, or -fields to omit
+        :param str profile: a selection profile (e.g. ids, summary or full)
         :param str version: a custom Thoth version
         :param str endpoint: a custom Thoth endpoint
         :param bool serialize: return a pickled python object
@@ -501,6 +586,7 @@ class ThothAPI:
         :param language_codes: select by language code (e.g. ADA)
         """
         self._override_version(version=version, endpoint=endpoint)
+        projection = self._projection(fields, profile)
 
         langs = self._client().languages(limit=limit, order=order,
                                          offset=offset,
@@ -508,7 +594,8 @@ class ThothAPI:
                                          search=search,
                                          language_codes=language_codes,
                                          language_relation=language_relation,
-                                         raw=raw)
+                                         raw=raw,
+                                         **projection)
 
         if not raw and not serialize:
             print(*langs, sep='\n')
@@ -535,19 +622,23 @@ class ThothAPI:
                                             raw=raw))
 
     @fire.decorators.SetParseFn(_raw_parse)
-    def price(self, price_id, raw=False, version=None, endpoint=None,
-              serialize=False):
+    def price(self, price_id, raw=False, fields=None, profile=None,
+              version=None, endpoint=None, serialize=False):
         """
         Retrieves a price by ID from a Thoth instance
         :param str price_id: the price to fetch
         :param bool raw: whether to return a python object or the raw result
+        :param str fields: comma-separated fields to fetch, or -fields to omit
+        :param str profile: a selection profile (e.g. ids, summary or full)
         :param str version: a custom Thoth version
         :param str endpoint: a custom Thoth endpoint
         :param bool serialize: return a pickled python object
         """
         self._override_version(version=version, endpoint=endpoint)
+        projection = self._projection(fields, profile)
 
-        price = self._client().price(price_id=price_id, raw=raw)
+        price = self._client().price(price_id=price_id, raw=raw,
+                                     **projection)
 
         if not serialize:
             print(price)
@@ -556,8 +647,8 @@ class ThothAPI:
 
     @fire.decorators.SetParseFn(_raw_parse)
     def prices(self, limit=100, order=None, offset=0, publishers=None,
-               currency_codes=None, raw=False, version=None, endpoint=None,
-               serialize=False):
+               currency_codes=None, raw=False, fields=None, profile=None,
+               version=None, endpoint=None, serialize=False):
         """
         Retrieves prices from a Thoth instance
         :param int limit: the maximum number of results to return
@@ -565,18 +656,21 @@ class ThothAPI:
         :param int offset: the offset from which to retrieve results
         :param str publishers: a list of publishers to limit by
         :param bool raw: whether to return a python object or the raw result
+        :param str fields: comma-separated fields to fetch, or -fields to omit
+        :param str profile: a selection profile (e.g. ids, summary or full)
         :param str version: a custom Thoth version
         :param str endpoint: a custom Thoth endpoint
         :param bool serialize: return a pickled python object
         :param str currency_codes: the currency code (e.g. GBP)
         """
         self._override_version(version=version, endpoint=endpoint)
+        projection = self._projection(fields, profile)
 
         prices = self._client().prices(limit=limit, order=order,
                                        offset=offset,
                                        publishers=publishers,
                                        currency_codes=currency_codes,
-                                       raw=raw)
+                                       raw=raw, **projection)
 
         if not raw and not serialize:
             print(*prices, sep='\n')
@@ -601,20 +695,24 @@ class ThothAPI:
                                          raw=raw))
 
     @fire.decorators.SetParseFn(_raw_parse)
-    def publication(self, publication_id, raw=False,
+    def publication(self, publication_id, raw=False, fields=None, profile=None,
                     version=None, endpoint=None, serialize=False):
         """
         Retrieves a publication by id from a Thoth instance
         :param bool raw: whether to return a python object or the raw result
+        :param str fields: comma-separated fields to fetch, or -fields to omit
+        :param str profile: a selection profile (e.g. ids, summary or full)
         :param str version: a custom Thoth version
         :param str endpoint: a custom Thoth endpoint
         :param bool serialize: return a pickled python object
         :param str publication_id: a publicationId to retrieve
         """
         self._override_version(version=version, endpoint=endpoint)
+        projection = self._projection(fields, profile)
 
-        publication = self._client().publication(publication_id=publication_id,
-                                                 raw=raw)
+        publication = self._client().publication(
+            publication_id=publication_id, raw=raw,
+            **projection)
 
         if not serialize:
             print(publication)
@@ -624,7 +722,8 @@ class ThothAPI:
     @fire.decorators.SetParseFn(_raw_parse)
     def publications(self, limit=100, order=None, offset=0, publishers=None,
                      search=None, publication_types=None, raw=False,
-                     version=None, endpoint=None, serialize=False):
+                     fields=None, profile=None, version=None, endpoint=None,
+                     serialize=False):
         """
         Retrieves publications from a Thoth instance
         :param int limit: the maximum number of results to return
@@ -634,17 +733,21 @@ class ThothAPI:
         :param str search: a search string to search
         :param str publication_types: the work type (e.g. PAPERBACK)
         :param bool raw: whether to return a python object or the raw result
+        :param str fields: comma-separated fields to fetch, or -fields to omit
+        :param str profile: a selection profile (e.g. ids, summary or full)
         :param str version: a custom Thoth version
         :param str endpoint: a custom Thoth endpoint
         :param bool serialize: return a pickled python object
         """
         self._override_version(version=version, endpoint=endpoint)
+        projection = self._projection(fields, profile)
 
         pubs = self._client().publications(limit=limit, order=order,
                                            offset=offset, publishers=publishers,
                                            search=search,
                                            publication_types=publication_types,
-                                           raw=raw)
+                                           raw=raw,
+                                           **projection)
         if not raw and not serialize:
             print(*pubs, sep='\n')
         elif serialize:
@@ -671,19 +774,24 @@ class ThothAPI:
             publication_types=publication_types, raw=raw))
 
     @fire.decorators.SetParseFn(_raw_parse)
-    def publisher(self, publisher_id, raw=False, version=None, endpoint=None,
-                  serialize=False):
+    def publisher(self, publisher_id, raw=False, fields=None, profile=None,
+                  version=None, endpoint=None, serialize=False):
         """
         Retrieves a publisher by ID from a Thoth instance
         :param str publisher_id: the publisher to fetch
         :param bool raw: whether to return a python object or the raw result
+        :param str fields: comma-separated fields to fetch, or -fields to omit
+        :param str profile: a selection profile (e.g. ids, summary or full)
         :param str version: a custom Thoth version
         :param str endpoint: a custom Thoth endpoint
         :param bool serialize: return a pickled python object
         """
         self._override_version(version=version, endpoint=endpoint)
+        projection = self._projection(fields, profile)
 
-        publisher = self._client().publisher(publisher_id=publisher_id, raw=raw)
+        publisher = self._client().publisher(publisher_id=publisher_id,
+                                             raw=raw,
+                                             **projection)
 
         if not serialize:
             print(publisher)
@@ -692,8 +800,8 @@ class ThothAPI:
 
     @fire.decorators.SetParseFn(_raw_parse)
     def publishers(self, limit=100, order=None, offset=0, publishers=None,
-                   search=None, raw=False, version=None, endpoint=None,
-                   serialize=False):
+                   search=None, raw=False, fields=None, profile=None,
+                   version=None, endpoint=None, serialize=False):
         """
         Retrieves publishers from a Thoth instance
         :param int limit: the maximum number of results to return
@@ -702,6 +810,8 @@ class ThothAPI:
         :param str publishers: a list of publishers to limit by
         :param str search: a search string to search
         :param bool raw: whether to return a python object or the raw result
+        :param str fields: comma-separated fields to fetch, or -fields to omit
+        :param str profile: a selection profile (e.g. ids, summary or full)
         :param str version: a custom Thoth version
         :param str endpoint: a custom Thoth endpoint
         :param bool serialize: return a pickled python object
@@ -712,7 +822,9 @@ class ThothAPI:
                                                      offset=offset,
                                                      publishers=publishers,
                                                      search=search,
-                                                     raw=raw)
+                                                     raw=raw,
+                                                     **_projection(fields,
+                                                                   profile))
 
         if not raw and not serialize:
             print(*found_publishers, sep='\n')
@@ -739,19 +851,24 @@ class ThothAPI:
                                              raw=raw))
 
     @fire.decorators.SetParseFn(_raw_parse)
-    def reference(self, reference_id, raw=False, version=None, endpoint=None,
-                  serialize=False):
+    def reference(self, reference_id, raw=False, fields=None, profile=None,
+                  version=None, endpoint=None, serialize=False):
         """
         Retrieves a reference by ID from a Thoth instance
         :param str reference_id: the series to fetch
         :param bool raw: whether to return a python object or the raw result
+        :param str fields: comma-separated fields to fetch, or -fields to omit
+        :param str profile: a selection profile (e.g. ids, summary or full)
         :param str version: a custom Thoth version
         :param str endpoint: a custom Thoth endpoint
         :param bool serialize: return a pickled python object
         """
         self._override_version(version=version, endpoint=endpoint)
+        projection = self._projection(fields, profile)
 
-        reference = self._client().reference(reference_id=reference_id, raw=raw)
+        reference = self._client().reference(reference_id=reference_id,
+                                             raw=raw,
+                                             **projection)
 
         if not serialize:
             print(reference)
@@ -760,8 +877,8 @@ class ThothAPI:
 
     @fire.decorators.SetParseFn(_raw_parse)
     def references(self, limit=100, order=None, offset=0, publishers=None,
-                   search=None, raw=False, version=None, endpoint=None,
-                   serialize=False):
+                   search=None, raw=False, fields=None, profile=None,
+                   version=None, endpoint=None, serialize=False):
         """
         Retrieves references from a Thoth instance
         :param int limit: the maximum number of results to return
@@ -770,17 +887,21 @@ class ThothAPI:
         :param str publishers: a list of publishers to limit by
         :param str search: a search string to search
         :param bool raw: whether to return a python object or the raw result
+        :param str fields: comma-separated fields to fetch, or -fields to omit
+        :param str profile: a selection profile (e.g. ids, summary or full)
         :param str version: a custom Thoth version
         :param str endpoint: a custom Thoth endpoint
         :param bool serialize: return a pickled python object
         """
         self._override_version(version=version, endpoint=endpoint)
+        projection = self._projection(fields, profile)
 
         references = self._client().references(limit=limit, order=order,
                                                offset=offset,
                                                publishers=publishers,
                                                search=search,
-                                               raw=raw)
+                                               raw=raw,
+                                               **projection)
 
         if not raw and not serialize:
             print(*references, sep='\n')
@@ -790,19 +911,23 @@ class ThothAPI:
             print(references)
 
     @fire.decorators.SetParseFn(_raw_parse)
-    def series(self, series_id, raw=False, version=None, endpoint=None,
-               serialize=False):
+    def series(self, series_id, raw=False, fields=None, profile=None,
+               version=None, endpoint=None, serialize=False):
         """
         Retrieves a series by ID from a Thoth instance
         :param str series_id: the series to fetch
         :param bool raw: whether to return a python object or the raw result
+        :param str fields: comma-separated fields to fetch, or -fields to omit
+        :param str profile: a selection profile (e.g. ids, summary or full)
         :param str version: a custom Thoth version
         :param str endpoint: a custom Thoth endpoint
         :param bool serialize: return a pickled python object
         """
         self._override_version(version=version, endpoint=endpoint)
+        projection = self._projection(fields, profile)
 
-        series = self._client().series(series_id=series_id, raw=raw)
+        series = self._client().series(series_id=series_id, raw=raw,
+                                       **projection)
 
         if not serialize:
             print(series)
@@ -811,8 +936,8 @@ class ThothAPI:
 
     @fire.decorators.SetParseFn(_raw_parse)
     def serieses(self, limit=100, order=None, offset=0, publishers=None,
-                 search=None, series_types=None, raw=False, version=None,
-                 endpoint=None, serialize=False):
+                 search=None, series_types=None, raw=False, fields=None,
+                 profile=None, version=None, endpoint=None, serialize=False):
         """
         Retrieves serieses from a Thoth instance
         :param int limit: the maximum number of results to return
@@ -821,19 +946,23 @@ class ThothAPI:
         :param str publishers: a list of publishers to limit by
         :param str search: a search string to search
         :param bool raw: whether to return a python object or the raw result
+        :param str fields: comma-separated fields to fetch, or -fields to omit
+        :param str profile: a selection profile (e.g. ids, summary or full)
         :param str version: a custom Thoth version
         :param str endpoint: a custom Thoth endpoint
         :param bool serialize: return a pickled python object
         :param series_types: the type of serieses to return (e.g. BOOK_SERIES)
         """
         self._override_version(version=version, endpoint=endpoint)
+        projection = self._projection(fields, profile)
 
         serieses = self._client().serieses(limit=limit, order=order,
                                            offset=offset,
                                            publishers=publishers,
                                            search=search,
                                            series_types=series_types,
-                                           raw=raw)
+                                           raw=raw,
+                                           **projection)
 
         if not raw and not serialize:
             print(*serieses, sep='\n')
@@ -860,19 +989,23 @@ class ThothAPI:
                                           series_types=series_types, raw=raw))
 
     @fire.decorators.SetParseFn(_raw_parse)
-    def subject(self, subject_id, raw=False, version=None, endpoint=None,
-                serialize=False):
+    def subject(self, subject_id, raw=False, fields=None, profile=None,
+                version=None, endpoint=None, serialize=False):
         """
         Retrieves a subject by ID from a Thoth instance
         :param str subject_id: the subject to fetch
         :param bool raw: whether to return a python object or the raw result
+        :param str fields: comma-separated fields to fetch, or -fields to omit
+        :param str profile: a selection profile (e.g. ids, summary or full)
         :param str version: a custom Thoth version
         :param str endpoint: a custom Thoth endpoint
         :param bool serialize: return a pickled python object
         """
         self._override_version(version=version, endpoint=endpoint)
+        projection = self._projection(fields, profile)
 
-        subj = self._client().subject(subject_id=subject_id, raw=raw)
+        subj = self._client().subject(subject_id=subject_id, raw=raw,
+                                      **projection)
 
         if not serialize:
             print(subj)
@@ -881,8 +1014,9 @@ class ThothAPI:
 
     @fire.decorators.SetParseFn(_raw_parse)
     def subjects(self, limit=100, order=None, offset=0, publishers=None,
-                 search=None, raw=False, version=None, endpoint=None,
-                 serialize=False, subject_types=None):
+                 search=None, raw=False, fields=None, profile=None,
+                 version=None, endpoint=None, serialize=False,
+                 subject_types=None):
         """
         Retrieves subjects from a Thoth instance
         :param int limit: the maximum number of results to return
@@ -891,19 +1025,22 @@ class ThothAPI:
         :param str publishers: a list of publishers to limit by
         :param str search: a search string to search
         :param bool raw: whether to return a python object or the raw result
+        :param str fields: comma-separated fields to fetch, or -fields to omit
+        :param str profile: a selection profile (e.g. ids, summary or full)
         :param str version: a custom Thoth version
         :param str endpoint: a custom Thoth endpoint
         :param bool serialize: return a pickled python object
         :param subject_types: select by subject code (e.g. BIC)
         """
         self._override_version(version=version, endpoint=endpoint)
+        projection = self._projection(fields, profile)
 
         subj = self._client().subjects(limit=limit, order=order,
                                        offset=offset,
                                        publishers=publishers,
                                        search=search,
                                        subject_types=subject_types,
-                                       raw=raw)
+                                       raw=raw, **projection)
 
         if not raw and not serialize:
             print(*subj, sep='\n')
@@ -936,12 +1073,15 @@ class ThothAPI:
         return self._client().supported_versions()
 
     @fire.decorators.SetParseFn(_raw_parse)
-    def work(self, doi=None, work_id=None, raw=False, version=None,
-             endpoint=None, serialize=False, cover_ascii=False):
+    def work(self, doi=None, work_id=None, raw=False, fields=None,
+             profile=None, version=None, endpoint=None, serialize=False,
+             cover_ascii=False):
         """
         Retrieves a work by DOI or ID from a Thoth instance
         :param str doi: the doi to fetch
         :param bool raw: whether to return a python object or the raw result
+        :param str fields: comma-separated fields to fetch, or -fields to omit
+        :param str profile: a selection profile (e.g. ids, summary or full)
         :param str version: a custom Thoth version
         :param str endpoint: a custom Thoth endpoint
         :param bool serialize: return a pickled python object
@@ -949,14 +1089,17 @@ class ThothAPI:
         :param bool cover_ascii: whether to render an ASCII art cover
         """
         self._override_version(version=version, endpoint=endpoint)
+        projection = self._projection(fields, profile)
 
         if not doi and not work_id:
             print("You must specify either workId or doi.")
             return
         elif doi:
-            work = self._client().work_by_doi(doi=doi, raw=raw)
+            work = self._client().work_by_doi(doi=doi, raw=raw,
+                                              **projection)
         else:
-            work = self._client().work_by_id(work_id=work_id, raw=raw)
+            work = self._client().work_by_id(work_id=work_id, raw=raw,
+                                             **projection)
 
         if not serialize:
             print(work)
@@ -972,7 +1115,8 @@ class ThothAPI:
     @fire.decorators.SetParseFn(_raw_parse)
     def works(self, limit=100, order=None, offset=0, publishers=None,
               search=None, work_types=None, work_status=None, raw=False,
-              version=None, endpoint=None, serialize=False):
+              fields=None, profile=None, version=None, endpoint=None,
+              serialize=False):
         """
         Retrieves works from a Thoth instance
         :param int limit: the maximum number of results to return
@@ -983,18 +1127,21 @@ class ThothAPI:
         :param str work_types: the work type (e.g. MONOGRAPH)
         :param str work_status: the work status (e.g. ACTIVE)
         :param bool raw: whether to return a python object or the raw result
+        :param str fields: comma-separated fields to fetch, or -fields to omit
+        :param str profile: a selection profile (e.g. ids, summary or full)
         :param str version: a custom Thoth version
         :param str endpoint: a custom Thoth endpoint
         :param bool serialize: return a pickled python object
         """
         self._override_version(version=version, endpoint=endpoint)
+        projection = self._projection(fields, profile)
 
         works = self._client().works(limit=limit, order=order, offset=offset,
                                      publishers=publishers,
                                      search=search,
                                      work_types=work_types,
                                      work_status=work_status,
-                                     raw=raw)
+                                     raw=raw, **projection)
 
         if not raw and not serialize:
             print(*works, sep='\n')
@@ -1027,8 +1174,8 @@ class ThothAPI:
 
     @fire.decorators.SetParseFn(_raw_parse)
     def books(self, limit=100, order=None, offset=0, publishers=None,
-              search=None, work_status=None, raw=False, version=None,
-              endpoint=None, serialize=False):
+              search=None, work_status=None, raw=False, fields=None,
+              profile=None, version=None, endpoint=None, serialize=False):
         """
         Retrieves books from a Thoth instance
         :param int limit: the maximum number of results to return
@@ -1038,17 +1185,20 @@ class ThothAPI:
         :param str search: a search string to search
         :param str work_status: the work status (e.g. ACTIVE)
         :param bool raw: whether to return a python object or the raw result
+        :param str fields: comma-separated fields to fetch, or -fields to omit
+        :param str profile: a selection profile (e.g. ids, summary or full)
         :param str version: a custom Thoth version
         :param str endpoint: a custom Thoth endpoint
         :param bool serialize: return a pickled python object
         """
         self._override_version(version=version, endpoint=endpoint)
+        projection = self._projection(fields, profile)
 
         books = self._client().books(limit=limit, order=order, offset=offset,
                                      publishers=publishers,
                                      search=search,
                                      work_status=work_status,
-                                     raw=raw)
+                                     raw=raw, **projection)
 
         if not raw and not serialize:
             print(*books, sep='\n')
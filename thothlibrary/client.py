@@ -5,26 +5,60 @@ GraphQL client for Thoth
 This programme is free software; you may redistribute and/or modify
 it under the terms of the Apache License v2.0.
 """
+import copy
 import importlib
+import json
 import pkgutil
+import threading
+import time
+from collections import namedtuple
 
 import re
+from munch import Munch
+
 import thothlibrary
 from .auth import ThothAuthenticator
-from .errors import ResponseEmptyError
+from .batch import ThothBatch
+from .columnar import column_paths, to_columns
+from .loader import ThothLoader
 from .graphql import GraphQLClientRequests as GraphQLClient
+from .graphql import DEFAULT_POOL_CONNECTIONS, DEFAULT_POOL_MAXSIZE
+from .graphql import DEFAULT_COMPRESS_THRESHOLD, DEFAULT_TIMEOUT
+from .lazy import lazy_structure
 from .mutation import ThothMutation
-from .query import ThothQuery
+from .normalize import NormalizingBuilder
+from .pagination import KeysetPaginator, PageSizer, Paginator, ThothPage
+from .pagination import bounded, fetch_pages, merge_streams
+from .pagination import DEFAULT_MAX_WORKERS, DEFAULT_PAGE_SIZE
+from .query import ThothQuery, field_name, require_fields
+from .query import select_fields, select_profile
+from .records import RecordBuilder
+from .retry import RetryPolicy
+from .singleflight import SingleFlight
 
 THOTH_ENDPOINT = "https://api.thoth.pub"
 THOTH_VERSION = "0.9.0"
 
+# the requests an endpoint method would have sent, as recorded by
+# ThothClient._plan
+PlannedQuery = namedtuple('PlannedQuery',
+                          ['endpoint_name', 'parameters', 'options'])
+PlannedMutation = namedtuple('PlannedMutation',
+                             ['mutation_name', 'data', 'nested'])
+
 
 class ThothClient:
     """Client to Thoth's GraphQL API"""
     QUERIES = {}  # populated according to each version's requirements
-
-    def __new__(cls, thoth_endpoint=THOTH_ENDPOINT, version=THOTH_VERSION):
+    # public methods that send several requests, or none, rather than the
+    # single request that _plan records; so do the iter_* methods
+    HELPERS = frozenset(('login', 'query', 'mutation', 'batch', 'loader',
+                         'paginate', 'paginate_keyset', 'fetch_all', 'stream',
+                         'merge_publishers', 'page_sizer',
+                         'supported_versions', 'changes_since'))
+
+    def __new__(cls, thoth_endpoint=THOTH_ENDPOINT, version=THOTH_VERSION,
+                **kwargs):
         # this new call is the only bit of "magic"
         # it basically subs in the sub-class of the correct version and returns
         # an instance of that, instead of the generic class
@@ -36,46 +70,384 @@ class ThothClient:
             endpoints, 'ThothClient{0}'.format(version_replaced))
 
         return version_endpoints(thoth_endpoint=thoth_endpoint,
-                                 version=version)
-
-    def __init__(self, thoth_endpoint=THOTH_ENDPOINT, version=THOTH_VERSION):
+                                 version=version, **kwargs)
+
+    def __init__(self, thoth_endpoint=THOTH_ENDPOINT, version=THOTH_VERSION,
+                 pool_connections=DEFAULT_POOL_CONNECTIONS,
+                 pool_maxsize=DEFAULT_POOL_MAXSIZE, keep_alive=True,
+                 single_flight=False, retry_policy=None, rate_limiter=None,
+                 compress_requests=False,
+                 compress_threshold=DEFAULT_COMPRESS_THRESHOLD,
+                 timeout=DEFAULT_TIMEOUT, records=False, lazy=False,
+                 normalize=False):
         """Returns new ThothClient object at the specified GraphQL endpoint
 
         thoth_endpoint: Must be the full URL (eg. 'http://localhost').
+
+        pool_connections, pool_maxsize, keep_alive: configure the pooled HTTP
+        session, which is shared by every client using the same endpoint.
+
+        single_flight: True (or a SingleFlight shared between clients) to
+        collapse concurrent identical queries into one request. Only queries
+        to the same endpoint with the same credentials are collapsed.
+
+        retry_policy: the RetryPolicy deciding when failed requests are sent
+        again (by default two retries with jittered exponential backoff).
+
+        rate_limiter: a TokenBucket (or FileTokenBucket) pacing every request
+        sent by this client, including retries. Share one bucket between
+        clients, threads or processes to keep their combined rate under the
+        API's limits.
+
+        compress_requests, compress_threshold: gzip request bodies of at
+        least compress_threshold bytes. Responses are always negotiated as
+        gzip or deflate; self.client.transfers reports the bytes transferred.
+
+        timeout: the (connect, read) socket timeouts in seconds, or None to
+        wait indefinitely. Use thothlibrary.deadline.timeout to override them
+        for some calls, and thothlibrary.deadline.deadline to bound the total
+        time of a block of calls.
+
+        records: build results as compact record classes generated from
+        QUERIES (see thothlibrary.records) instead of Munch objects. Records
+        are faster to build and smaller, but are not dictionaries.
+
+        lazy: build results as LazyMunch objects (see thothlibrary.lazy),
+        which convert nested objects only when they are first read.
+
+        normalize: build each result with a NormalizingBuilder (see
+        thothlibrary.normalize), so that repeated publishers, contributors,
+        institutions and short strings are shared rather than copied. True
+        for the default ID fields, or a list of ID fields.
         """
+        if len([mode for mode in (records, lazy, normalize) if mode]) > 1:
+            raise ValueError('Set only one of records, lazy and normalize')
+        self.retry_policy = retry_policy or RetryPolicy()
+        if single_flight is True:
+            single_flight = SingleFlight()
+        self.single_flight = single_flight or None
         self.thoth_endpoint = thoth_endpoint
         self.auth_endpoint = "{}/account/login".format(thoth_endpoint)
         self.graphql_endpoint = "{}/graphql".format(thoth_endpoint)
-        self.client = GraphQLClient(self.graphql_endpoint)
+        self.client = GraphQLClient(self.graphql_endpoint,
+                                    pool_connections=pool_connections,
+                                    pool_maxsize=pool_maxsize,
+                                    keep_alive=keep_alive,
+                                    rate_limiter=rate_limiter,
+                                    compress_requests=compress_requests,
+                                    compress_threshold=compress_threshold,
+                                    timeout=timeout)
         self.version = version.replace('.', '_')
+        # page sizes learned by adaptive pagination, by endpoint method
+        self.page_sizers = {}
+        self._page_sizers_lock = threading.Lock()
+        self.records = records
+        self._record_builder = None
+        self.lazy = lazy
+        self.normalize = normalize
 
     def login(self, email, password):
         """Obtain an authentication token"""
-        auth = ThothAuthenticator(self.auth_endpoint, email, password)
+        auth = ThothAuthenticator(self.auth_endpoint, email, password,
+                                  timeout=self.client.timeout)
         bearer = "Bearer {}".format(auth.get_token())
         self.client.inject_token(bearer)
 
     def mutation(self, mutation_name, data, nested=True):
         """Instantiate a thoth mutation and execute it"""
         mutation = ThothMutation(mutation_name, data, nested)
-        max_retries = 2
-        for attempt in range(max_retries + 1):
-            try:
-                return mutation.run(self.client)
-            except ResponseEmptyError:
-                if attempt == max_retries:
-                    raise
-
-    def query(self, query_name, parameters, raw=False):
+        return self.retry_policy.call(lambda: mutation.run(self.client),
+                                      idempotent=False)
+
+    def query(self, query_name, parameters, raw=False, fields=None,
+              profile=None):
         """Instantiate a thoth query and execute"""
-        query = ThothQuery(query_name, parameters, self.QUERIES, raw=raw)
-        max_retries = 2
-        for attempt in range(max_retries + 1):
-            try:
-                return query.run(self.client)
-            except ResponseEmptyError:
-                if attempt == max_retries:
-                    raise
+        query = ThothQuery(query_name, parameters, self.QUERIES, raw=raw,
+                           fields=fields, profile=profile)
+
+        if self.single_flight is None:
+            return self._run_query(query)
+
+        key = SingleFlight.key(query.request, query.variables, raw,
+                               *SingleFlight.credentials(self.client))
+        return self.single_flight.do(key, lambda: self._run_query(query))
+
+    def _run_query(self, query):
+        """Execute a thoth query, retrying as the retry policy allows"""
+        return self.retry_policy.call(lambda: query.run(self.client))
+
+    def batch(self):
+        """
+        Returns a ThothBatch, which records endpoint calls and sends them as
+        a single aliased GraphQL request
+        """
+        return ThothBatch(self)
+
+    def loader(self, max_batch_size=100, wait=None, cache=True):
+        """
+        Returns a ThothLoader, which coalesces by-ID and by-DOI lookups into
+        aliased batch requests
+        @param max_batch_size: the maximum number of lookups per request
+        @param wait: seconds to collect lookups before sending them, or None
+        to send only when a result is needed
+        @param cache: whether to remember results for repeated lookups
+        """
+        return ThothLoader(self, max_batch_size=max_batch_size, wait=wait,
+                           cache=cache)
+
+    def paginate(self, method_name, page_size=DEFAULT_PAGE_SIZE,
+                 prefetch=True, **kwargs):
+        """
+        Returns a Paginator over every item of a list endpoint method
+        @param method_name: the list endpoint method (e.g. works)
+        @param page_size: the number of items to request per page, or None
+        to adapt it to the endpoint (see page_sizer)
+        @param prefetch: whether to fetch the next page in the background
+        @param kwargs: the other arguments of the endpoint method; offset sets
+        the first item
+        """
+        if kwargs.pop('raw', False):
+            raise ValueError('Raw results can not be paginated')
+        if kwargs.get('columnar'):
+            raise ValueError('Columnar results can not be paginated')
+        method = getattr(self, method_name)
+        offset = kwargs.pop('offset', 0)
+
+        def fetch_page(page_offset, limit):
+            return method(limit=limit, offset=page_offset, **kwargs)
+
+        if page_size is None:
+            page_size = self.page_sizer(method_name)
+            fetch_page = self._measured(fetch_page, page_size)
+        return Paginator(fetch_page, page_size=page_size, prefetch=prefetch,
+                         offset=offset)
+
+    def paginate_keyset(self, method_name, page_size=DEFAULT_PAGE_SIZE,
+                        prefetch=True, since=None, **kwargs):
+        """
+        Returns a KeysetPaginator over a list endpoint method that can be
+        ordered and filtered by updatedAtWithRelations (works, books, bookIds)
+        @param method_name: the list endpoint method (e.g. works)
+        @param page_size: the number of items to request per page, or None
+        to adapt it to the endpoint (see page_sizer)
+        @param prefetch: whether to fetch the next page in the background
+        @param since: only return items updated at or after this timestamp
+        @param kwargs: the other filters of the endpoint method
+        """
+        if kwargs.pop('raw', False):
+            raise ValueError('Raw results can not be paginated')
+        if kwargs.get('columnar'):
+            raise ValueError('Columnar results can not be paginated')
+        for reserved in ('offset', 'order', 'updated_at_with_relations'):
+            if reserved in kwargs:
+                raise ValueError('Keyset pagination sets {0} '
+                                 'itself'.format(reserved))
+        method = getattr(self, method_name)
+        order = {'field': 'UPDATED_AT_WITH_RELATIONS', 'direction': 'ASC'}
+        if kwargs.get('fields') is not None:
+            # the cursor is built from the timestamp and ID of each row
+            kwargs['fields'] = require_fields(
+                kwargs['fields'], ('workId', 'updatedAtWithRelations'))
+
+        def fetch_page(after, offset, limit):
+            updated = None
+            if after is not None:
+                updated = {'timestamp': after, 'expression': 'GREATER_THAN'}
+            return method(limit=limit, offset=offset, order=order,
+                          updated_at_with_relations=updated, **kwargs)
+
+        if page_size is None:
+            page_size = self.page_sizer(method_name)
+            fetch_page = self._measured(fetch_page, page_size)
+        return KeysetPaginator(fetch_page, page_size=page_size,
+                               prefetch=prefetch, since=since)
+
+    def fetch_all(self, method_name, page_size=DEFAULT_PAGE_SIZE,
+                  max_workers=DEFAULT_MAX_WORKERS, **kwargs):
+        """
+        Fetches every item of a list endpoint method. The matching count
+        query (declared as "count" in QUERIES) is sent first; the pages are
+        then fetched concurrently, up to the first incomplete page, and
+        returned in order.
+        @param method_name: the list endpoint method (e.g. works)
+        @param page_size: the number of items to request per page, or None
+        for the size learned for the endpoint (see page_sizer)
+        @param max_workers: the maximum number of pages requested at once
+        @param kwargs: the other arguments of the endpoint method; offset sets
+        the first item
+        @return: a list of every item
+        """
+        if kwargs.pop('raw', False):
+            raise ValueError('Raw results can not be paginated')
+        if kwargs.get('columnar'):
+            raise ValueError('Columnar results can not be paginated')
+        method = getattr(self, method_name)
+        offset = kwargs.pop('offset', 0)
+        sizer = None
+        if page_size is None:
+            sizer = self.page_sizer(method_name)
+            page_size = sizer.size
+        plan = self._plan(method_name, limit=page_size, offset=offset,
+                          **kwargs)
+
+        count_name, parameters = self._count_query(plan.endpoint_name,
+                                                   plan.parameters)
+        total = self.query(count_name, parameters)
+
+        def fetch_page(page_offset, limit):
+            return method(limit=limit, offset=page_offset, **kwargs)
+
+        if sizer is not None:
+            fetch_page = self._measured(fetch_page, sizer)
+        return fetch_pages(fetch_page, total, page_size=page_size,
+                           max_workers=max_workers, offset=offset)
+
+    def stream(self, method_name, *args, **kwargs):
+        """
+        Calls a list endpoint method and yields its results as they arrive.
+        The response is read and parsed incrementally, so memory is bounded
+        by one item rather than the whole payload, and the first items are
+        available before the last ones have been sent. A failure to send the
+        request is retried as the retry policy allows; a failure after the
+        first item has been yielded is raised.
+
+            for work in client.stream('works', limit=9999):
+                ...
+
+        With columnar=True (or a list of paths), each item is added to the
+        columns as it arrives and the columns are returned.
+
+        @param method_name: the list endpoint method (e.g. works)
+        @param args: positional arguments for the endpoint method
+        @param kwargs: keyword arguments for the endpoint method
+        @return: an iterator of objects, or a dictionary of columns
+        """
+        plan = self._plan(method_name, *args, **kwargs)
+        if not isinstance(plan, PlannedQuery):
+            raise ValueError('{0} is not a query'.format(method_name))
+        if plan.options.get('return_raw'):
+            raise ValueError('Raw results can not be streamed')
+
+        query = ThothQuery(plan.endpoint_name, plan.parameters, self.QUERIES,
+                           fields=plan.options.get('fields'),
+                           profile=plan.options.get('profile'))
+        chunks = self.retry_policy.call(lambda: query.open_stream(self.client))
+        columnar = plan.options.get('columnar')
+        if columnar:
+            # the columns are filled as the items arrive
+            return to_columns(query.parse_stream(chunks),
+                              column_paths(columnar))
+        return (self._build_structure(plan.endpoint_name, item)
+                for item in query.parse_stream(chunks))
+
+    def merge_publishers(self, method_name, publishers, order_by=None,
+                         descending=False, max_workers=DEFAULT_MAX_WORKERS,
+                         page_size=DEFAULT_PAGE_SIZE, **kwargs):
+        """
+        Iterates over a list endpoint method for several publishers at once,
+        reading one stream of pages per publisher in parallel and merging
+        them, so that the whole takes about as long as the largest publisher.
+
+            for work in client.merge_publishers('works', publisher_ids,
+                                                order_by='publicationDate'):
+                ...
+
+        @param method_name: the list endpoint method (e.g. works)
+        @param publishers: the IDs of the publishers
+        @param order_by: a field (e.g. publicationDate or updatedAt) to merge
+        the streams in order of, or None to yield items as they arrive
+        @param descending: whether to order by the field in descending order
+        @param max_workers: the maximum number of requests sent at once
+        @param page_size: the number of items to request per page
+        @param kwargs: the other filters of the endpoint method
+        @return: an iterator of objects
+        """
+        if kwargs.pop('raw', False):
+            raise ValueError('Raw results can not be paginated')
+        if kwargs.get('columnar'):
+            raise ValueError('Columnar results can not be paginated')
+        if 'offset' in kwargs:
+            raise ValueError('merge_publishers sets the offset itself')
+        method = getattr(self, method_name)
+        semaphore = threading.BoundedSemaphore(max_workers)
+        key = None
+
+        if order_by is not None:
+            if 'order' in kwargs:
+                raise ValueError('Set either order or order_by')
+            field = re.sub(r'(?<!^)(?=[A-Z])', '_', order_by).upper()
+            kwargs['order'] = {'field': field,
+                               'direction': 'DESC' if descending else 'ASC'}
+            kwargs['fields'] = self._with_field(method_name, order_by,
+                                                kwargs.get('fields'),
+                                                kwargs.pop('profile', None))
+            key = _sort_key(order_by)
+
+        def paginator(publisher):
+            filters = dict(kwargs, publishers=json.dumps([publisher]))
+
+            def fetch_page(page_offset, limit):
+                return method(limit=limit, offset=page_offset, **filters)
+
+            return Paginator(bounded(fetch_page, semaphore),
+                             page_size=page_size, prefetch=False)
+
+        return merge_streams([paginator(publisher)
+                              for publisher in publishers],
+                             max_workers=max_workers, key=key,
+                             reverse=descending)
+
+    def _with_field(self, method_name, name, fields=None, profile=None):
+        """
+        Returns a field projection of a list endpoint method that selects
+        what fields (or profile) would, plus the field name
+        """
+        plan = self._plan(method_name, limit=1)
+        query = self.QUERIES.get(plan.endpoint_name, {})
+        selection = select_fields(query.get('fields', []), fields,
+                                  current=select_profile(query, profile))
+        if name not in [field_name(field) for field in selection]:
+            selection.append(name)
+        return selection
+
+    def page_sizer(self, method_name):
+        """
+        Returns the PageSizer of a list endpoint method, creating it on first
+        use. Sizes learned by one adaptive iteration carry over to the next
+        for as long as the client lives. To change the targets of an
+        endpoint, store a configured sizer first:
+
+            client.page_sizers['institutions'] = PageSizer(target_seconds=1)
+
+        @param method_name: the list endpoint method (e.g. works)
+        @return: a PageSizer
+        """
+        with self._page_sizers_lock:
+            sizer = self.page_sizers.get(method_name)
+            if sizer is None:
+                sizer = self.page_sizers[method_name] = PageSizer()
+            return sizer
+
+    def _measured(self, fetch_page, sizer):
+        """
+        Wraps a page fetching function so that each page's duration and
+        decoded size are reported to sizer
+        """
+        transfers = self.client.transfers
+
+        def fetch(*args):
+            last = transfers.last
+            start = time.monotonic()
+            page = fetch_page(*args)
+            elapsed = time.monotonic() - start
+            # a page shared by single-flight was fetched by another thread,
+            # so its size is unknown here: size the next page by time alone
+            transfer = transfers.last
+            size = transfer.received if transfer is not last else None
+            sizer.observe(len(page), elapsed, size)
+            return page
+
+        return fetch
 
     def create_publisher(self, publisher):
         """Construct and trigger a mutation to add a new publisher object"""
@@ -188,20 +560,117 @@ class ThothClient:
         return versions
 
     def _api_request(self, endpoint_name: str, parameters,
-                     return_raw: bool = False):
+                     return_raw: bool = False, fields=None, profile=None,
+                     with_count: bool = False, columnar=False):
         """
         Makes a request to the API
         @param endpoint_name: the name of the endpoint
         @param return_raw: whether to return raw data or an object (default)
         @param parameters: the parameters to pass to GraphQL
+        @param fields: the fields to select instead of those in QUERIES
+        @param profile: the named selection profile declared in QUERIES
+        @param with_count: whether to fetch the total number of results in
+        the same request and return a ThothPage
+        @param columnar: True, or a list of dotted field paths, to return a
+        dictionary of columns (see thothlibrary.columnar)
         @return: an object or JSON of the request
         """
-        response = self.query(endpoint_name, parameters, raw=return_raw)
+        if columnar:
+            if return_raw or with_count:
+                raise ValueError('Columnar results can not be raw or counted')
+            response = self.query(endpoint_name, parameters, fields=fields,
+                                  profile=profile)
+            return to_columns(response, column_paths(columnar))
+
+        if with_count:
+            if return_raw:
+                raise ValueError('Raw results can not be counted')
+            return self._page_with_count(endpoint_name, parameters,
+                                         fields=fields, profile=profile)
+
+        response = self.query(endpoint_name, parameters, raw=return_raw,
+                              fields=fields, profile=profile)
 
         if return_raw:
             return response
         return self._build_structure(endpoint_name, response)
 
+    def _count_query(self, endpoint_name, parameters):
+        """
+        Returns the count query matching a list query (declared as "count"
+        in QUERIES) and the parameters it takes
+        @param endpoint_name: the name of the list endpoint
+        @param parameters: the parameters of the list query
+        @return: the count query's name and parameters
+        """
+        count_name = self.QUERIES.get(endpoint_name, {}).get('count')
+        if count_name is None:
+            raise ValueError('{0} has no count query'.format(endpoint_name))
+
+        # the count query takes the filters it declares as variables; a list
+        # filter that it does not take would make the total count items that
+        # the list leaves out
+        declared = self.QUERIES[count_name].get('variables', {})
+        filters = {key: value for key, value in parameters.items()
+                   if key not in ('limit', 'offset', 'order')}
+        unsupported = sorted(key for key in filters if key not in declared)
+        if unsupported:
+            raise ValueError('{0} can not be filtered by {1}, so {2} can not '
+                             'be counted with it'.format(
+                                 count_name, ', '.join(unsupported),
+                                 endpoint_name))
+        return count_name, filters
+
+    def _page_with_count(self, endpoint_name, parameters, **options):
+        """
+        Fetches a page of a list together with the total number of matching
+        items, as two aliased queries in a single request
+        @param endpoint_name: the name of the list endpoint
+        @param parameters: the parameters of the list query
+        @param options: the fields and profile of the list query
+        @return: a ThothPage
+        """
+        count_name, count_parameters = self._count_query(endpoint_name,
+                                                         parameters)
+        batch = self.batch()
+        page = batch.add(PlannedQuery(endpoint_name, parameters, options))
+        total = batch.add(PlannedQuery(count_name, count_parameters, {}))
+        batch.execute()
+
+        return ThothPage(page.result(), total.result(),
+                         offset=parameters.get('offset', 0),
+                         limit=parameters.get('limit'))
+
+    def _is_endpoint(self, name):
+        """
+        Returns whether a method sends a single query or mutation, so that
+        _plan can record it
+        @param name: the name of the method
+        @return: True for an endpoint method
+        """
+        return not name.startswith(('_', 'iter_')) and \
+            name not in self.HELPERS
+
+    def _plan(self, method_name, *args, **kwargs):
+        """
+        Runs an endpoint method without contacting the server and returns the
+        request that it would have made
+        @param method_name: the name of the endpoint method
+        @param args: positional arguments for the endpoint method
+        @param kwargs: keyword arguments for the endpoint method
+        @return: a PlannedQuery, a PlannedMutation or, for methods that do not
+        call the API, their plain return value
+        """
+        planner = copy.copy(self)
+        planner._api_request = \
+            lambda endpoint_name, parameters, **options: \
+            PlannedQuery(endpoint_name, parameters, options)
+        planner.mutation = \
+            lambda mutation_name, data, nested=True: \
+            PlannedMutation(mutation_name, data, nested)
+
+        return getattr(planner, method_name)(*args, **kwargs)
+
     def _build_structure(self, endpoint_name, data):
         """
         Builds an object structure for an endpoint
@@ -211,6 +680,20 @@ class ThothClient:
         """
         module = 'thothlibrary.thoth-{0}.structures'.format(self.version)
         structures = importlib.import_module(module)
+        if self.records:
+            if self._record_builder is None:
+                self._record_builder = RecordBuilder(
+                    self.QUERIES, getattr(structures, 'default_fields', {}))
+            return self._record_builder.build(endpoint_name, data)
+        munch_type = getattr(structures, 'munch_types', {}).get(endpoint_name,
+                                                                Munch)
+        if self.lazy:
+            return lazy_structure(munch_type, data)
+        if self.normalize:
+            options = {} if self.normalize is True \
+                else {'id_fields': self.normalize}
+            return NormalizingBuilder(munch_type, **options).build(data)
+
         builder = getattr(structures, 'StructureBuilder')(endpoint_name, data)
 
         return builder.create_structure()
@@ -227,3 +710,17 @@ class ThothClient:
         if value:
             input_dict[key] = value
         return input_dict
+
+
+def _sort_key(name):
+    """
+    Returns a sort key for objects by a field, placing missing values last as
+    the API does in ascending order
+    @param name: the field
+    @return: a key function
+    """
+    def key(item):
+        value = getattr(item, name, None)
+        return value is None, value if value is not None else ''
+
+    return key
@@ -0,0 +1,146 @@
+"""
+GraphQL client for Thoth
+
+(c) ΔQ Programming LLP, July 2021
+This programme is free software; you may redistribute and/or modify
+it under the terms of the Apache License v2.0.
+"""
+import re
+from array import array
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover - optional dependency
+    numpy = None
+
+_DATE = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+
+def column_paths(columnar):
+    """
+    Returns the paths named by a columnar argument
+    @param columnar: True for every field, or a list (or comma-separated
+    string) of dotted paths
+    @return: the paths, or None for every field
+    """
+    if columnar is True:
+        return None
+    if isinstance(columnar, str):
+        return [path.strip() for path in columnar.split(',')]
+    return list(columnar)
+
+
+def to_columns(items, paths=None, use_numpy=None):
+    """
+    Converts decoded list items into columns, one per field.
+
+    Nested objects are flattened into dotted paths, such as
+    imprint.publisher.publisherName. By default every scalar field of every
+    item becomes a column and nested lists are left out; naming paths
+    selects those columns only, and a path through a list (such as
+    contributions.fullName) gives a list of values per item. Items lacking
+    a field hold None.
+
+    Columns are typed when their values allow it. With NumPy, integers
+    become int64 arrays, numbers float64 arrays (null as NaN), booleans
+    bool arrays, dates (YYYY-MM-DD) datetime64[D] arrays (null as NaT) and
+    anything else object arrays. Without NumPy, integers become array('q'),
+    numbers array('d') and anything else lists.
+
+        columns = client.works(limit=9999, columnar=True)
+        columns['pageCount'][columns['workType'] == 'MONOGRAPH'].mean()
+
+    @param items: an iterable of decoded items (dicts)
+    @param paths: the dotted paths of the columns, or None for all fields
+    @param use_numpy: whether to build NumPy arrays (by default when NumPy
+    is installed)
+    @return: a dictionary mapping each path to a column
+    """
+    if use_numpy is None:
+        use_numpy = numpy is not None
+    elif use_numpy and numpy is None:
+        raise ImportError('NumPy columns require numpy. Install it with: '
+                          'pip install numpy')
+
+    if paths is None:
+        columns = _flatten_all(items)
+    else:
+        columns = {path: [] for path in paths}
+        keys = [(path, path.split('.')) for path in paths]
+        for item in items:
+            for path, path_keys in keys:
+                columns[path].append(_resolve(item, path_keys))
+
+    return {path: _typed(values, use_numpy)
+            for path, values in columns.items()}
+
+
+def _flatten_all(items):
+    """
+    Collects every scalar field of the items, in the order first found
+    @return: a dictionary of paths and their values
+    """
+    columns = {}
+    count = 0
+    for item in items:
+        for path, value in _flatten(item, ''):
+            column = columns.get(path)
+            if column is None:
+                column = columns[path] = [None] * count
+            column.append(value)
+        count += 1
+        for column in columns.values():
+            if len(column) < count:
+                column.append(None)
+    return columns
+
+
+def _flatten(item, prefix):
+    """Yields the dotted path and value of each scalar field of an object"""
+    for key, value in item.items():
+        if isinstance(value, dict):
+            yield from _flatten(value, prefix + key + '.')
+        elif not isinstance(value, list):
+            yield prefix + key, value
+
+
+def _resolve(value, keys):
+    """Returns the value at a path of keys, mapping over any lists on it"""
+    for position, key in enumerate(keys):
+        if isinstance(value, list):
+            return [_resolve(element, keys[position:]) for element in value]
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+def _typed(values, use_numpy):
+    """
+    Converts a column of values into the most specific array that holds
+    them all
+    """
+    kinds = {type(value) for value in values if value is not None}
+    missing = any(value is None for value in values)
+
+    if kinds == {bool} and not missing:
+        return numpy.array(values, dtype=bool) if use_numpy \
+            else array('b', values)
+    if kinds == {int} and not missing:
+        return numpy.array(values, dtype=numpy.int64) if use_numpy \
+            else array('q', values)
+    if kinds and kinds <= {int, float}:
+        floats = [float('nan') if value is None else value
+                  for value in values]
+        return numpy.array(floats, dtype=numpy.float64) if use_numpy \
+            else array('d', floats)
+    if use_numpy:
+        if kinds == {str} and all(value is None or _DATE.fullmatch(value)
+                                  for value in values):
+            return numpy.array(['NaT' if value is None else value
+                                for value in values], dtype='datetime64[D]')
+        column = numpy.empty(len(values), dtype=object)
+        for index, value in enumerate(values):
+            column[index] = value
+        return column
+    return values
@@ -0,0 +1,115 @@
+"""
+GraphQL client for Thoth
+
+(c) ΔQ Programming LLP, July 2021
+This programme is free software; you may redistribute and/or modify
+it under the terms of the Apache License v2.0.
+"""
+import contextvars
+import time
+from contextlib import contextmanager
+
+from .errors import DeadlineExceededError
+
+# (connect, read) socket timeouts in seconds
+DEFAULT_TIMEOUT = (10.0, 60.0)
+
+# the deadline and timeout in force are context variables, so they follow the
+# calling thread (or asyncio task) through retries, pages and batches. Work
+# handed to another thread must be run in a copy of the caller's context
+# (contextvars.copy_context().run) to stay under the caller's deadline.
+_deadline = contextvars.ContextVar('thoth_deadline', default=None)
+_timeout = contextvars.ContextVar('thoth_timeout', default=None)
+
+
+@contextmanager
+def deadline(seconds):
+    """
+    Bounds the total time of every request made inside the block, including
+    retries and the time spent waiting for them. A deadline nested inside
+    another can only shorten it.
+
+        with deadline(30):
+            for work in client.works(limit=9999):
+                ...
+
+    @param seconds: the time budget of the block
+    """
+    expires = time.monotonic() + seconds
+    current = _deadline.get()
+    if current is not None:
+        expires = min(expires, current)
+
+    token = _deadline.set(expires)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+@contextmanager
+def timeout(value):
+    """
+    Overrides the client's socket timeouts for every request made inside the
+    block
+    @param value: a (connect, read) tuple, or one number for both
+    """
+    token = _timeout.set(value)
+    try:
+        yield
+    finally:
+        _timeout.reset(token)
+
+
+def remaining():
+    """
+    Returns the time left before the current deadline
+    @return: the time left in seconds, or None if there is no deadline
+    """
+    expires = _deadline.get()
+    if expires is None:
+        return None
+    return expires - time.monotonic()
+
+
+def expired():
+    """
+    Returns whether the current deadline has passed
+    @return: True if there is a deadline and it has passed
+    """
+    left = remaining()
+    return left is not None and left <= 0
+
+
+def check(request=None):
+    """
+    Raises DeadlineExceededError if the current deadline has passed
+    @param request: the request about to be made, for the error message
+    @return: the time left in seconds, or None if there is no deadline
+    """
+    left = remaining()
+    if left is not None and left <= 0:
+        raise DeadlineExceededError(request, 'Deadline exceeded')
+    return left
+
+
+def effective_timeout(default, request=None):
+    """
+    Returns the socket timeouts for a request: the per-call override or the
+    client's default, shortened to fit within the current deadline
+    @param default: the client's (connect, read) timeouts, or None
+    @param request: the request about to be made, for the error message
+    @return: a (connect, read) tuple, or None for no timeout
+    """
+    value = _timeout.get()
+    if value is None:
+        value = default
+    if value is not None and not isinstance(value, tuple):
+        value = (value, value)
+
+    left = check(request)
+    if left is None:
+        return value
+    if value is None:
+        return (left, left)
+    return tuple(left if part is None else min(part, left) for part in value)
@@ -26,3 +26,19 @@ class GraphQLError(ThothError):
 
 class AuthorizationError(ThothError):
     """An authorization error occurred."""
+
+
+class HTTPStatusError(ThothError):
+    """The server answered with an HTTP error status (429 or 5xx)."""
+    def __init__(self, request, response, status, headers=None):
+        super().__init__(request, response)
+        self.status = status
+        self.headers = headers or {}
+
+
+class TransportError(ThothError):
+    """The request could not be sent or its response was not received."""
+
+
+class DeadlineExceededError(ThothError):
+    """The time budget set with thothlibrary.deadline.deadline ran out."""
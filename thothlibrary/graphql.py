@@ -8,6 +8,8 @@ https://github.com/prisma-labs/python-graphql-client
 
 The modifications here change the library to use the requests framework instead
 of urllib. This means that we can then mock requests more easily in unit tests.
+Requests are sent over pooled keep-alive sessions that are shared between
+clients pointing at the same endpoint.
 
 The MIT License (MIT)
 
@@ -31,15 +33,189 @@ LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
-import requests
+import asyncio
+import contextvars
+import gzip
 import json
+import threading
+from collections import namedtuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+from . import deadline
+from .deadline import DEFAULT_TIMEOUT
+from .errors import DeadlineExceededError, HTTPStatusError
+from .streaming import DEFAULT_CHUNK_SIZE
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_ASYNC_LIMIT = 100
+DEFAULT_COMPRESS_THRESHOLD = 1024
+ACCEPT_ENCODING = 'gzip, deflate'
+
+# the size of a request and its response, before (sent, received) and after
+# (sent_encoded, received_encoded) content encoding
+Transfer = namedtuple('Transfer', ['sent', 'sent_encoded',
+                                   'received', 'received_encoded'])
+
+# failures to reach the server or to receive its answer, as opposed to errors
+# reported by the server itself
+TRANSPORT_ERRORS = (requests.exceptions.ConnectionError,
+                    requests.exceptions.Timeout)
+
+# sessions are shared by every client that talks to the same endpoint with the
+# same pool configuration, so that TCP/TLS connections are re-used across
+# ThothClient instances
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+
+def get_session(endpoint, pool_connections=DEFAULT_POOL_CONNECTIONS,
+                pool_maxsize=DEFAULT_POOL_MAXSIZE, keep_alive=True):
+    """
+    Returns the shared, pooled requests session for an endpoint
+    @param endpoint: the GraphQL endpoint
+    @param pool_connections: the number of host connection pools to cache
+    @param pool_maxsize: the maximum number of connections kept per host
+    @param keep_alive: whether to keep connections open between requests
+    @return: a requests.Session
+    """
+    key = (endpoint, pool_connections, pool_maxsize, keep_alive)
+
+    with _sessions_lock:
+        session = _sessions.get(key)
+
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=pool_connections,
+                                  pool_maxsize=pool_maxsize)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+
+            if not keep_alive:
+                session.headers['Connection'] = 'close'
+
+            _sessions[key] = session
+
+    return session
+
+
+def _is_error_status(status):
+    """
+    Returns whether an HTTP status means the server failed or refused the
+    request, rather than answering it (GraphQL errors come back as 200)
+    @param status: the HTTP status code
+    @return: True for 429 and 5xx statuses
+    """
+    return status == 429 or status >= 500
+
+
+def encode_request(query, variables, compress=False,
+                   compress_threshold=DEFAULT_COMPRESS_THRESHOLD):
+    """
+    Serialises a GraphQL request, gzipping large bodies if asked to
+    @param query: the GraphQL document
+    @param variables: the variables payload
+    @param compress: whether bodies may be gzipped
+    @param compress_threshold: the smallest body, in bytes, to gzip
+    @return: the body, the request headers and the size of the plain body
+    """
+    body = json.dumps({'query': query,
+                       'variables': variables}).encode('utf-8')
+    size = len(body)
+    headers = {'Accept': 'application/json',
+               'Accept-Encoding': ACCEPT_ENCODING,
+               'Content-Type': 'application/json'}
+
+    if compress and size >= compress_threshold:
+        body = gzip.compress(body)
+        headers['Content-Encoding'] = 'gzip'
+
+    return body, headers, size
+
+
+class TransferStats:
+    """
+    Records the bytes sent and received by a transport. The last transfer is
+    kept in a context variable, so that concurrent threads and coroutines
+    each see their own request.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._last = contextvars.ContextVar('thoth_transfer', default=None)
+        self.requests = 0
+        self.sent = 0
+        self.sent_encoded = 0
+        self.received = 0
+        self.received_encoded = 0
+
+    @property
+    def last(self):
+        """The Transfer of the last request sent in the calling context"""
+        return self._last.get()
+
+    def record(self, transfer):
+        """
+        Adds a request to the totals
+        @param transfer: the request's Transfer
+        @return: None
+        """
+        self._last.set(transfer)
+        with self._lock:
+            self.requests += 1
+            self.sent += transfer.sent
+            self.sent_encoded += transfer.sent_encoded
+            self.received += transfer.received
+            self.received_encoded += transfer.received_encoded
+
+    def totals(self):
+        """
+        Returns the bytes transferred since the transport was created
+        @return: a dictionary of request count and byte totals
+        """
+        with self._lock:
+            return {'requests': self.requests,
+                    'sent': self.sent,
+                    'sent_encoded': self.sent_encoded,
+                    'received': self.received,
+                    'received_encoded': self.received_encoded}
+
+
+def close_sessions():
+    """
+    Closes every shared session and drops its pooled connections
+    @return: None
+    """
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
 
 
 class GraphQLClientRequests:
-    def __init__(self, endpoint):
+    def __init__(self, endpoint, pool_connections=DEFAULT_POOL_CONNECTIONS,
+                 pool_maxsize=DEFAULT_POOL_MAXSIZE, keep_alive=True,
+                 rate_limiter=None, compress_requests=False,
+                 compress_threshold=DEFAULT_COMPRESS_THRESHOLD,
+                 timeout=DEFAULT_TIMEOUT):
         self.endpoint = endpoint
         self.token = None
         self.headername = None
+        self.rate_limiter = rate_limiter
+        self.compress_requests = compress_requests
+        self.compress_threshold = compress_threshold
+        self.timeout = timeout
+        self.transfers = TransferStats()
+        self.session = get_session(endpoint, pool_connections=pool_connections,
+                                   pool_maxsize=pool_maxsize,
+                                   keep_alive=keep_alive)
 
     def execute(self, query, variables=None):
         return self._send(query, variables)
@@ -48,21 +224,179 @@ class GraphQLClientRequests:
         self.token = token
         self.headername = headername
 
-    def _send(self, query, variables):
-        data = {'query': query,
-                'variables': variables}
-        headers = {'Accept': 'application/json',
-                   'Content-Type': 'application/json'}
+    def stream(self, query, variables=None, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Sends a request and returns its body as it arrives, decompressed but
+        not decoded, so that large responses can be parsed incrementally.
+        The connection is returned to the pool once the chunks are exhausted
+        (or the iterator is closed).
+        @param query: the GraphQL document
+        @param variables: the variables payload
+        @param chunk_size: the number of bytes to read at a time
+        @return: an iterator of bytes
+        """
+        req, data, size = self._post(query, variables, stream=True)
+
+        if _is_error_status(req.status_code):
+            content = req.content
+            self._record(req, size, data, len(content))
+            raise HTTPStatusError(query, content.decode('utf-8'),
+                                  req.status_code, req.headers)
+
+        return self._iter_chunks(req, size, data, chunk_size)
+
+    def _iter_chunks(self, req, size, data, chunk_size):
+        received = 0
+        try:
+            for chunk in req.iter_content(chunk_size):
+                received += len(chunk)
+                yield chunk
+        finally:
+            req.close()
+            self._record(req, size, data, received)
+
+    def _post(self, query, variables, stream=False):
+        data, headers, size = encode_request(query, variables,
+                                             self.compress_requests,
+                                             self.compress_threshold)
 
         if self.token is not None:
             headers[self.headername] = '{}'.format(self.token)
 
-        req = requests.post(self.endpoint,
-                            data=json.dumps(data).encode('utf-8'),
-                            headers=headers)
+        if self.rate_limiter is not None:
+            # waiting for a token must not outlast the deadline either
+            if self.rate_limiter.acquire(
+                    timeout=deadline.check(query)) is None:
+                raise DeadlineExceededError(query, 'Deadline exceeded')
+
+        timeout = deadline.effective_timeout(self.timeout, query)
+        try:
+            req = self.session.post(self.endpoint, data=data, headers=headers,
+                                    timeout=timeout, stream=stream)
+        except requests.exceptions.Timeout as e:
+            if deadline.expired():
+                raise DeadlineExceededError(query, 'Deadline exceeded') from e
+            raise
+        return req, data, size
+
+    def _record(self, req, size, data, received):
+        """Records the bytes sent and received by a request"""
+        # the raw stream counts the bytes read before they were decompressed
+        try:
+            received_encoded = req.raw.tell()
+        except (AttributeError, OSError):
+            received_encoded = received
+        self.transfers.record(Transfer(size, len(data), received,
+                                       received_encoded))
+
+    def _send(self, query, variables):
+        req, data, size = self._post(query, variables)
 
         try:
-            response = req.content.decode('utf-8')
-            return response
+            content = req.content
+            response = content.decode('utf-8')
         except requests.exceptions.RequestException as e:
             raise e
+
+        self._record(req, size, data, len(content))
+
+        if _is_error_status(req.status_code):
+            raise HTTPStatusError(query, response, req.status_code,
+                                  req.headers)
+        return response
+
+
+class AsyncGraphQLClient:
+    """
+    An asyncio GraphQL transport backed by a pooled aiohttp session. The
+    session is opened lazily inside the running event loop and must be closed
+    with close() (or by using the owning client as an async context manager).
+    """
+    def __init__(self, endpoint, limit=DEFAULT_ASYNC_LIMIT, limit_per_host=0,
+                 keep_alive=True, rate_limiter=None, compress_requests=False,
+                 compress_threshold=DEFAULT_COMPRESS_THRESHOLD,
+                 timeout=DEFAULT_TIMEOUT):
+        if aiohttp is None:
+            raise ImportError('The asyncio client requires aiohttp. Install '
+                              'it with: pip install thothlibrary[async]')
+        self.endpoint = endpoint
+        self.token = None
+        self.headername = None
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keep_alive = keep_alive
+        self.rate_limiter = rate_limiter
+        self.compress_requests = compress_requests
+        self.compress_threshold = compress_threshold
+        self.timeout = timeout
+        self.transfers = TransferStats()
+        self.session = None
+
+    async def execute(self, query, variables=None):
+        return await self._send(query, variables)
+
+    def inject_token(self, token, headername='Authorization'):
+        self.token = token
+        self.headername = headername
+
+    def _get_session(self):
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit, limit_per_host=self.limit_per_host,
+                force_close=not self.keep_alive)
+            self.session = aiohttp.ClientSession(connector=connector)
+        return self.session
+
+    def client_timeout(self, request=None):
+        """
+        Returns the aiohttp timeouts for a request, bounded by the deadline
+        @param request: the request about to be made, for the error message
+        @return: an aiohttp.ClientTimeout
+        """
+        connect, read = deadline.effective_timeout(self.timeout,
+                                                   request) or (None, None)
+        return aiohttp.ClientTimeout(total=deadline.remaining(),
+                                     sock_connect=connect, sock_read=read)
+
+    async def close(self):
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def _send(self, query, variables):
+        data, headers, size = encode_request(query, variables,
+                                             self.compress_requests,
+                                             self.compress_threshold)
+
+        if self.token is not None:
+            headers[self.headername] = '{}'.format(self.token)
+
+        if self.rate_limiter is not None:
+            # waiting for a token must not outlast the deadline either
+            if await self.rate_limiter.acquire_async(
+                    timeout=deadline.check(query)) is None:
+                raise DeadlineExceededError(query, 'Deadline exceeded')
+
+        try:
+            async with self._get_session().post(
+                    self.endpoint, data=data, headers=headers,
+                    timeout=self.client_timeout(query)) as req:
+                body = await req.read()
+                # aiohttp decompresses as it reads, so the encoded size is
+                # only known from the headers
+                received_encoded = req.content_length or len(body)
+        except aiohttp.ClientError as e:
+            raise requests.exceptions.ConnectionError(e)
+        except asyncio.TimeoutError as e:
+            if deadline.expired():
+                raise DeadlineExceededError(query, 'Deadline exceeded') from e
+            raise requests.exceptions.Timeout(e)
+
+        self.transfers.record(Transfer(size, len(data), len(body),
+                                       received_encoded))
+
+        response = body.decode('utf-8')
+        if _is_error_status(req.status):
+            raise HTTPStatusError(query, response, req.status,
+                                  dict(req.headers))
+        return response
@@ -0,0 +1,183 @@
+"""
+GraphQL client for Thoth
+
+(c) ΔQ Programming LLP, July 2021
+This programme is free software; you may redistribute and/or modify
+it under the terms of the Apache License v2.0.
+"""
+import threading
+
+from munch import Munch
+
+_lazy_types = {}
+_lazy_types_lock = threading.Lock()
+
+
+def lazy_structure(munch_type, data):
+    """
+    Wraps a decoded result in lazy objects, converting nothing beyond the
+    top level until it is read
+    @param munch_type: the Munch subclass of the endpoint (see munch_types in
+    each version's structures module), or Munch
+    @param data: the decoded result (an object or a list of objects)
+    @return: a LazyMunch or a LazyList
+    """
+    return _convert(lazy_type(munch_type), data)
+
+
+def lazy_type(munch_type):
+    """
+    Returns the LazyMunch subclass that formats itself as munch_type does,
+    creating it on first use
+    @param munch_type: a Munch subclass
+    @return: the class
+    """
+    lazy = _lazy_types.get(munch_type)
+    if lazy is None:
+        with _lazy_types_lock:
+            lazy = _lazy_types.get(munch_type)
+            if lazy is None:
+                name = 'Lazy{0}'.format(munch_type.__name__)
+                lazy = type(name, (LazyMunch, munch_type),
+                            {'_munch_type': munch_type})
+                _lazy_types[munch_type] = lazy
+    return lazy
+
+
+def _convert(factory, value):
+    """
+    Converts a decoded value that has not been read yet
+    @param factory: the LazyMunch subclass to build objects as
+    @param value: the value
+    @return: the value, wrapped if it is an object or a list
+    """
+    # decoded JSON holds plain dicts and lists; converted values are
+    # subclasses of them, so exact type checks tell the two apart
+    if type(value) is dict:  # pylint: disable=unidiomatic-typecheck
+        return factory(value)
+    if type(value) is list:  # pylint: disable=unidiomatic-typecheck
+        return LazyList(value, factory)
+    return value
+
+
+def _restore(munch_type, data):
+    """Rebuilds a pickled LazyMunch"""
+    return lazy_type(munch_type)(data)
+
+
+def _restore_list(munch_type, values):
+    """Rebuilds a pickled LazyList"""
+    return LazyList(values, lazy_type(munch_type))
+
+
+class LazyMunch(Munch):
+    """
+    A Munch over a decoded JSON object that converts the objects and lists
+    nested in it only when they are read, and keeps them once converted.
+
+    Building one costs a shallow copy of the object, so a large result can
+    be returned without converting the contributions, affiliations and
+    fundings of every item. Unread values stay plain dicts and lists, which
+    serialise to JSON and compare equal exactly as their conversions would.
+    """
+    _munch_type = Munch
+
+    def __init__(self, data=()):
+        dict.__init__(self, data)
+
+    def __getitem__(self, key):
+        value = dict.__getitem__(self, key)
+        converted = _convert(type(self), value)
+        if converted is not value:
+            dict.__setitem__(self, key, converted)
+        return converted
+
+    def get(self, key, default=None):
+        if key not in self:
+            return default
+        return self[key]
+
+    def __iter__(self):
+        # defined here so that dict(lazy) and {**lazy} read the values
+        # through __getitem__ rather than copying them unconverted
+        return dict.__iter__(self)
+
+    def items(self):
+        return [(key, self[key]) for key in self]
+
+    def values(self):
+        return [self[key] for key in self]
+
+    def copy(self):
+        return type(self)(self.items())
+
+    def pop(self, key, *default):
+        if key not in self:
+            return dict.pop(self, key, *default)
+        value = self[key]
+        dict.__delitem__(self, key)
+        return value
+
+    def __reduce__(self):
+        return _restore, (self._munch_type, dict(self))
+
+
+class LazyList(list):
+    """
+    A list of decoded JSON values that converts each object or list in it
+    when it is first read, and keeps it once converted
+    """
+    __slots__ = ('factory',)
+
+    def __init__(self, values=(), factory=LazyMunch):
+        """
+        Creates a lazy list
+        @param values: the decoded values
+        @param factory: the LazyMunch subclass to build objects as
+        """
+        list.__init__(self, values)
+        self.factory = factory
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return LazyList(list.__getitem__(self, index), self.factory)
+        value = list.__getitem__(self, index)
+        converted = _convert(self.factory, value)
+        if converted is not value:
+            list.__setitem__(self, index, converted)
+        return converted
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def __reversed__(self):
+        for index in range(len(self) - 1, -1, -1):
+            yield self[index]
+
+    def pop(self, index=-1):
+        value = self[index]
+        list.pop(self, index)
+        return value
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def __add__(self, other):
+        if not isinstance(other, list):
+            return NotImplemented
+        return LazyList(list.__getitem__(self, slice(None)) + list(other),
+                        self.factory)
+
+    def __radd__(self, other):
+        if not isinstance(other, list):
+            return NotImplemented
+        return LazyList(list(other) + list.__getitem__(self, slice(None)),
+                        self.factory)
+
+    def copy(self):
+        return LazyList(list.__getitem__(self, slice(None)), self.factory)
+
+    def __reduce__(self):
+        return _restore_list, (self.factory._munch_type,
+                               list.__getitem__(self, slice(None)))
@@ -0,0 +1,173 @@
+"""
+GraphQL client for Thoth
+
+(c) ΔQ Programming LLP, July 2021
+This programme is free software; you may redistribute and/or modify
+it under the terms of the Apache License v2.0.
+"""
+import contextvars
+import threading
+from concurrent.futures import Future
+
+
+class LoaderFuture(Future):
+    """
+    The future result of a ThothLoader lookup. Asking for the result of a
+    lookup that has not been sent yet sends every queued lookup.
+    """
+
+    def __init__(self, loader):
+        super().__init__()
+        self.loader = loader
+
+    def result(self, timeout=None):
+        if not self.done():
+            self.loader.dispatch()
+        return super().result(timeout=timeout)
+
+
+class ThothLoader:
+    """
+    Coalesces lookups such as work_by_id, work_by_doi, contributor,
+    publication or institution into aliased batch requests, in the manner of
+    a DataLoader. Identical lookups are only sent once and every caller gets
+    the same result.
+
+    Lookups are queued until one of these happens: the result of any of
+    them is requested, the loader's scope ends (when used as a context
+    manager) or the optional wait window elapses. The queue is then sent in
+    chunks of max_batch_size.
+
+        with client.loader() as loader:
+            works = [loader.work_by_id(work_id) for work_id in work_ids]
+        titles = [work.result().fullTitle for work in works]
+    """
+
+    def __init__(self, client, max_batch_size=100, wait=None, cache=True):
+        """
+        Creates a loader on a versioned ThothClient
+        @param client: the client whose endpoint methods are coalesced
+        @param max_batch_size: the maximum number of lookups per request
+        @param wait: seconds to collect lookups before sending them, or None
+        to send only on demand
+        @param cache: whether to remember results for repeated lookups
+        """
+        self.client = client
+        self.max_batch_size = max_batch_size
+        self.wait = wait
+        self.cache = cache
+        self.requests_sent = 0
+        self._lock = threading.Lock()
+        self._futures = {}
+        self._queue = []
+        self._timer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.dispatch()
+
+    def __getattr__(self, name):
+        method = getattr(self.client, name)
+        if name.startswith('_') or not callable(method):
+            return method
+
+        def load(*args, **kwargs):
+            return self.load(name, *args, **kwargs)
+
+        return load
+
+    def load(self, method_name, *args, **kwargs):
+        """
+        Queues a call to an endpoint method
+        @param method_name: the endpoint method (e.g. work_by_id)
+        @param args: positional arguments for the endpoint method
+        @param kwargs: keyword arguments for the endpoint method
+        @return: a LoaderFuture
+        """
+        key = (method_name, args, tuple(sorted(kwargs.items())))
+
+        with self._lock:
+            if key in self._futures:
+                return self._futures[key]
+
+            plan = self.client._plan(method_name, *args, **kwargs)
+            future = LoaderFuture(self)
+            self._futures[key] = future
+            self._queue.append((key, plan, future))
+
+            if self.wait is not None and self._timer is None:
+                # the timer sends the queue under the caller's deadline
+                self._timer = threading.Timer(self.wait,
+                                              contextvars.copy_context().run,
+                                              args=(self.dispatch,))
+                self._timer.daemon = True
+                self._timer.start()
+
+        return future
+
+    def dispatch(self):
+        """
+        Sends every queued lookup
+        @return: None
+        """
+        with self._lock:
+            queue, self._queue = self._queue, []
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+        for start in range(0, len(queue), self.max_batch_size):
+            chunk = queue[start:start + self.max_batch_size]
+            try:
+                self._send(chunk)
+            except BaseException as error:
+                # whatever went wrong must not leave a caller waiting
+                for key, plan, future in chunk:
+                    if not future.done():
+                        future.set_exception(error)
+                if not isinstance(error, Exception):
+                    raise
+            finally:
+                self._forget(chunk)
+
+    def _send(self, chunk):
+        """
+        Sends a chunk of queued lookups as one batch request and resolves
+        their futures
+        """
+        batch = self.client.batch()
+        results = []
+
+        for key, plan, future in chunk:
+            try:
+                results.append(batch.add(plan))
+            except ValueError as error:
+                results.append(None)
+                future.set_exception(error)
+
+        if batch.calls:
+            batch.execute()
+            self.requests_sent += 1
+
+        for (key, plan, future), result in zip(chunk, results):
+            if result is None:
+                continue
+            try:
+                future.set_result(result.result())
+            except Exception as error:  # pylint: disable=broad-except
+                future.set_exception(error)
+
+    def _forget(self, chunk):
+        """
+        Drops the futures of a sent chunk that must not be reused: every one
+        without a cache, and the failed ones with it, so that a lookup that
+        failed (e.g. on a 503) is sent again next time
+        """
+        with self._lock:
+            for key, plan, future in chunk:
+                if not self.cache or not future.done() or \
+                        future.exception() is not None:
+                    if self._futures.get(key) is future:
+                        del self._futures[key]
@@ -11,6 +11,11 @@ import re
 import json
 import urllib
 from .errors import ThothError, ResponseEmptyError, GraphQLError
+from .errors import TransportError
+from .graphql import TRANSPORT_ERRORS
+
+MUTATION_ERRORS = (KeyError, TypeError, ValueError,
+                   json.decoder.JSONDecodeError, urllib.error.HTTPError)
 
 
 class ThothMutation():
@@ -383,18 +388,36 @@ class ThothMutation():
         result = ""
         try:
             result = client.execute(self.request)
+            return self.parse_result(result)
+        except TRANSPORT_ERRORS as error:
+            raise TransportError(self.request, error) from error
+        except MUTATION_ERRORS as error:
             if result == "":
-                raise ResponseEmptyError(self.request, "None")
-            serialised = json.loads(result)
-            if "errors" in serialised:
-                raise GraphQLError(self.request, result)
-            return serialised["data"][self.mutation_name][self.return_value]
-        except (KeyError, TypeError, ValueError, json.decoder.JSONDecodeError,
-                urllib.error.HTTPError) as error:
+                result = error
+            raise ThothError(self.request, result)
+
+    async def run_async(self, client):
+        """Perform the GraphQL mutation on an asynchronous client"""
+        result = ""
+        try:
+            result = await client.execute(self.request)
+            return self.parse_result(result)
+        except TRANSPORT_ERRORS as error:
+            raise TransportError(self.request, error) from error
+        except MUTATION_ERRORS as error:
             if result == "":
                 result = error
             raise ThothError(self.request, result)
 
+    def parse_result(self, result):
+        """Decode a server response and return the mutation's return value"""
+        if result == "":
+            raise ResponseEmptyError(self.request, "None")
+        serialised = json.loads(result)
+        if "errors" in serialised:
+            raise GraphQLError(self.request, result)
+        return serialised["data"][self.mutation_name][self.return_value]
+
     def generate_values(self):
         """Returns a set of mutation statements based on object attributes."""
         def sanitise(text):
@@ -0,0 +1,88 @@
+"""
+GraphQL client for Thoth
+
+(c) ΔQ Programming LLP, July 2021
+This programme is free software; you may redistribute and/or modify
+it under the terms of the Apache License v2.0.
+"""
+from munch import Munch
+
+# the ID fields of the entities that NormalizingBuilder shares
+DEFAULT_ID_FIELDS = ('publisherId', 'imprintId', 'contributorId',
+                     'institutionId', 'seriesId', 'workId')
+# strings longer than this (abstracts, notes, tables of contents) are rarely
+# repeated and are not worth looking up
+DEFAULT_MAX_STRING_LENGTH = 100
+
+
+class NormalizingBuilder:
+    """
+    Builds the Munch objects of a result so that each repeated nested entity
+    is one shared object, and each repeated short string one shared string.
+
+    A nested object is an entity when it holds the ID field named after the
+    key it is found under: publisherId for a "publisher", contributorId for
+    a "contributor" and so on. A contribution's contributorId, or a work's
+    imprintId, refer to other entities and are left alone. Two objects are
+    the same entity when they share the ID and the fields selected, so
+    entities selected with different fields in one result stay apart.
+
+    Shared objects are shared: changing one changes it in every item that
+    refers to it. The identity map lives for one result only.
+    """
+
+    def __init__(self, munch_type=Munch, id_fields=DEFAULT_ID_FIELDS,
+                 max_string_length=DEFAULT_MAX_STRING_LENGTH):
+        """
+        Creates a normalising builder
+        @param munch_type: the Munch subclass to build objects as
+        @param id_fields: the ID fields of the entities to share
+        @param max_string_length: the longest string to share, or 0 for none
+        """
+        self.munch_type = munch_type
+        # the key an entity is found under, mapped to its ID field
+        self.id_fields = {field[:-2]: field for field in id_fields
+                          if field.endswith('Id')}
+        self.max_string_length = max_string_length
+        self.entities = {}
+        self.strings = {}
+        self.shared = 0
+
+    def build(self, data):
+        """
+        Builds the objects of a decoded result
+        @param data: the decoded result (an object or a list of objects)
+        @return: a Munch or a list of Munch objects
+        """
+        try:
+            return self._build(data)
+        finally:
+            self.entities.clear()
+            self.strings.clear()
+
+    def _build(self, value, key=None):
+        if isinstance(value, dict):
+            id_field = self.id_fields.get(key)
+            if id_field is not None and value.get(id_field) is not None:
+                return self._entity(value, id_field)
+            return self._object(value)
+        if isinstance(value, list):
+            return [self._build(element, key) for element in value]
+        if isinstance(value, str) and len(value) <= self.max_string_length:
+            return self.strings.setdefault(value, value)
+        return value
+
+    def _object(self, value):
+        built = self.munch_type.__new__(self.munch_type)
+        dict.update(built, {key: self._build(element, key)
+                            for key, element in value.items()})
+        return built
+
+    def _entity(self, value, id_field):
+        identity = (id_field, value[id_field], tuple(value))
+        entity = self.entities.get(identity)
+        if entity is None:
+            entity = self.entities[identity] = self._object(value)
+        else:
+            self.shared += 1
+        return entity
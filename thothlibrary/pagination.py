@@ -0,0 +1,476 @@
+"""
+GraphQL client for Thoth
+
+(c) ΔQ Programming LLP, July 2021
+This programme is free software; you may redistribute and/or modify
+it under the terms of the Apache License v2.0.
+"""
+import collections
+import contextvars
+import heapq
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+DEFAULT_PAGE_SIZE = 100
+DEFAULT_MAX_WORKERS = 4
+# the number of pages each stream of a merge may read ahead of the consumer
+DEFAULT_READ_AHEAD = 2
+# what adaptive page sizes aim for: each page should take about this long
+# and decode to about this many bytes
+DEFAULT_TARGET_SECONDS = 2.0
+DEFAULT_TARGET_BYTES = 1024 * 1024
+
+
+class ThothPage(list):
+    """
+    A page of a list together with the total number of items matching its
+    filters, as returned by list methods called with with_count=True:
+
+        page = client.works(limit=20, offset=40, with_count=True)
+        print('page {0} of {1}'.format(page.page, page.pages))
+    """
+
+    def __init__(self, items=(), total=0, offset=0, limit=None):
+        """
+        Creates a page
+        @param items: the items of the page
+        @param total: the number of items matching the filters
+        @param offset: the offset of the page's first item
+        @param limit: the page size that was requested
+        """
+        super().__init__(items)
+        self.total = total
+        self.offset = offset
+        self.limit = limit
+
+    @property
+    def page(self):
+        """The number of this page, starting at 1"""
+        if not self.limit:
+            return 1
+        return self.offset // self.limit + 1
+
+    @property
+    def pages(self):
+        """The number of pages of this size needed for every item"""
+        if not self.limit:
+            return 1
+        return max(1, -(-self.total // self.limit))
+
+
+class PageSizer:
+    """
+    Learns the page size of one endpoint from the pages fetched so far.
+
+    After each page, the time and decoded bytes per item are measured, and
+    the next page is sized to take about target_seconds and to weigh about
+    target_bytes, whichever allows fewer items. A size moves by at most a
+    factor of growth per page, so one slow response does not collapse it.
+    Narrow lists (bookIds) grow to large pages while deeply nested ones
+    (institutions) shrink.
+
+    One sizer is kept per endpoint on the client (client.page_sizers), so a
+    size learned by one iteration is where the next one starts.
+    """
+
+    def __init__(self, initial=DEFAULT_PAGE_SIZE,
+                 target_seconds=DEFAULT_TARGET_SECONDS,
+                 target_bytes=DEFAULT_TARGET_BYTES, minimum=10,
+                 maximum=5000, growth=2.0):
+        """
+        Creates a page sizer
+        @param initial: the size of the first page
+        @param target_seconds: the time each page should take, or None
+        @param target_bytes: the decoded size of each page, or None
+        @param minimum: the smallest page size
+        @param maximum: the largest page size
+        @param growth: the largest change of size between two pages
+        """
+        if not 1 <= minimum <= maximum:
+            raise ValueError('The page size bounds must satisfy '
+                             '1 <= minimum <= maximum')
+        self.target_seconds = target_seconds
+        self.target_bytes = target_bytes
+        self.minimum = minimum
+        self.maximum = maximum
+        self.growth = growth
+        self._lock = threading.Lock()
+        self.size = self._clamp(initial)
+        self.observations = 0
+
+    def observe(self, items, seconds, size_bytes=None):
+        """
+        Records a page and adjusts the size of the next one
+        @param items: the number of items in the page
+        @param seconds: the time taken to fetch the page
+        @param size_bytes: the decoded size of the response, or None if it is
+        not known
+        @return: the new page size
+        """
+        if items <= 0:
+            return self.size
+
+        ideal = float(self.maximum)
+        if self.target_seconds and seconds > 0:
+            ideal = min(ideal, self.target_seconds * items / seconds)
+        if self.target_bytes and size_bytes:
+            ideal = min(ideal, self.target_bytes * items / size_bytes)
+
+        with self._lock:
+            ideal = min(max(ideal, self.size / self.growth),
+                        self.size * self.growth)
+            self.size = self._clamp(ideal)
+            self.observations += 1
+            return self.size
+
+    def _clamp(self, size):
+        return max(self.minimum, min(self.maximum, int(size)))
+
+
+class Paginator:
+    """
+    Iterates over every item of a list endpoint, one page at a time, so that
+    only one or two pages are held in memory however long the list is.
+
+    With prefetch, the next page is requested in a background thread while
+    the caller works through the current one. The background request runs in
+    a copy of the caller's context, so it stays under the caller's deadline.
+
+        for work in client.iter_works(publishers='["..."]'):
+            ...
+    """
+
+    def __init__(self, fetch_page, page_size=DEFAULT_PAGE_SIZE,
+                 prefetch=True, offset=0):
+        """
+        Creates a paginator
+        @param fetch_page: a function of (offset, limit) returning one page
+        @param page_size: the number of items to request per page, or a
+        PageSizer choosing it before each page
+        @param prefetch: whether to fetch the next page in the background
+        @param offset: the offset of the first item
+        """
+        self.sizer = page_size if isinstance(page_size, PageSizer) else None
+        if self.sizer is None and page_size < 1:
+            raise ValueError('The page size must be at least 1')
+        self.fetch_page = fetch_page
+        self.page_size = page_size
+        self.prefetch = prefetch
+        self.offset = offset
+        self.pages_fetched = 0
+
+    def __iter__(self):
+        for page in self.pages():
+            yield from page
+
+    def pages(self):
+        """
+        Iterates over the pages, stopping after the first incomplete page
+        @return: an iterator of pages (lists of items)
+        """
+        if not self.prefetch:
+            cursor = self._start()
+            while cursor is not None:
+                page, cursor = self._fetch(cursor)
+                yield page
+            return
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        pending = None
+        try:
+            page, cursor = self._fetch(self._start())
+            while True:
+                if cursor is not None:
+                    context = contextvars.copy_context()
+                    pending = executor.submit(context.run, self._fetch, cursor)
+                yield page
+                if pending is None:
+                    return
+                (page, cursor), pending = pending.result(), None
+        finally:
+            if pending is not None:
+                pending.cancel()
+            executor.shutdown(wait=False)
+
+    def _start(self):
+        """Returns the cursor of the first page"""
+        return self.offset
+
+    def _limit(self):
+        """Returns the number of items to request for the next page"""
+        if self.sizer is not None:
+            return self.sizer.size
+        return self.page_size
+
+    def _fetch(self, cursor):
+        """
+        Fetches the page at a cursor
+        @param cursor: the position of the page
+        @return: the page and the cursor of the next page, or None if this
+        was the last page
+        """
+        limit = self._limit()
+        page = self.fetch_page(cursor, limit)
+        self.pages_fetched += 1
+        if len(page) < limit:
+            return page, None
+        return page, cursor + limit
+
+
+class KeysetPaginator(Paginator):
+    """
+    Iterates over a list in ascending order of a timestamp (by default
+    updatedAtWithRelations), asking each page for the rows at or after the
+    last timestamp seen rather than for an offset. Pages cost the same
+    however deep the crawl goes, and rows that change mid-crawl move to the
+    end instead of shifting the pages that follow.
+
+    The API has no secondary sort, so rows sharing a timestamp may come back
+    in any order. Each page therefore re-reads every row at the boundary
+    timestamp, asking for as many more rows as it has already seen there,
+    and leaves out the rows it has seen by ID.
+    """
+
+    def __init__(self, fetch_page, page_size=DEFAULT_PAGE_SIZE,
+                 prefetch=True, since=None, key='updatedAtWithRelations',
+                 id_field='workId'):
+        """
+        Creates a keyset paginator
+        @param fetch_page: a function of (after, offset, limit) returning the
+        rows updated strictly after the timestamp after (or every row if it
+        is None), in ascending order, from offset onwards; the offset is
+        always 0
+        @param page_size: the number of items to request per page, or a
+        PageSizer
+        @param prefetch: whether to fetch the next page in the background
+        @param since: the timestamp of the first rows to return, or None
+        @param key: the timestamp field the rows are ordered by
+        @param id_field: the field identifying a row
+        """
+        super().__init__(fetch_page, page_size=page_size, prefetch=prefetch)
+        self.since = since
+        self.key = key
+        self.id_field = id_field
+
+    def _start(self):
+        return self.since, frozenset()
+
+    def _fetch(self, cursor):
+        boundary, seen = cursor
+        after = None if boundary is None else previous_instant(boundary)
+
+        # the rows seen at the boundary are read again, so that the page
+        # holds the whole tie group whatever order its rows come in
+        limit = len(seen) + self._limit()
+        page = self.fetch_page(after, 0, limit)
+        self.pages_fetched += 1
+        items = [item for item in page
+                 if getattr(item, self.id_field) not in seen]
+
+        if len(page) < limit:
+            return items, None
+
+        last = getattr(page[-1], self.key)
+        if last != boundary:
+            boundary, seen = last, frozenset()
+        seen = seen.union(getattr(item, self.id_field) for item in page
+                          if getattr(item, self.key) == boundary)
+        return items, (boundary, seen)
+
+
+def previous_instant(timestamp):
+    """
+    Returns the timestamp one microsecond (the API's resolution) earlier,
+    which turns a GREATER_THAN filter into "at or after"
+    @param timestamp: an ISO 8601 timestamp
+    @return: an ISO 8601 timestamp in UTC
+    """
+    when = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+    if when.tzinfo is not None:
+        when = when.astimezone(timezone.utc)
+    when -= timedelta(microseconds=1)
+    return when.strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+
+
+def fetch_pages(fetch_page, total, page_size=DEFAULT_PAGE_SIZE,
+                max_workers=DEFAULT_MAX_WORKERS, offset=0):
+    """
+    Fetches every page of a list whose length is counted in advance, several
+    pages at a time, and returns their items in order.
+
+    The count only bounds the pages requested: at most max_workers pages are
+    in flight, and no page is requested once an incomplete page is found, so
+    a count that is too high costs at most max_workers - 1 extra requests. If
+    the list has grown since it was counted, the pages after the expected end
+    are fetched one by one until an incomplete page is found.
+    @param fetch_page: a function of (offset, limit) returning one page
+    @param total: the expected number of items, counted from offset 0
+    @param page_size: the number of items to request per page
+    @param max_workers: the maximum number of pages requested at once
+    @param offset: the offset of the first item
+    @return: a list of every item
+    """
+    offsets = iter(range(offset, max(total, offset + 1), page_size))
+    pending = collections.deque()
+    items = []
+    page_offset = offset
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        def submit():
+            next_offset = next(offsets, None)
+            if next_offset is not None:
+                pending.append((next_offset, executor.submit(
+                    contextvars.copy_context().run, fetch_page, next_offset,
+                    page_size)))
+
+        for _ in range(max_workers):
+            submit()
+        try:
+            while pending:
+                page_offset, future = pending.popleft()
+                page = future.result()
+                items.extend(page)
+                if len(page) < page_size:
+                    return items
+                submit()
+        finally:
+            for _, future in pending:
+                future.cancel()
+
+    items.extend(Paginator(fetch_page, page_size=page_size, prefetch=False,
+                           offset=page_offset + page_size))
+    return items
+
+
+def merge_streams(paginators, max_workers=DEFAULT_MAX_WORKERS, key=None,
+                  reverse=False, read_ahead=DEFAULT_READ_AHEAD):
+    """
+    Reads several paginators at once and merges their items into one
+    iterator, so that fetching N lists takes about as long as the longest
+    rather than the sum of all of them.
+
+    Each paginator is read by its own thread, at most read_ahead pages ahead
+    of the consumer. Without a key, items are yielded in the order their
+    pages arrive. With a key, every paginator must already be sorted by it,
+    and the items are merged in order (see heapq.merge).
+
+    Bound the number of simultaneous requests by giving the paginators page
+    fetching functions that share a semaphore (see bounded); max_workers
+    bounds the number of paginators read at once when there is no key.
+    @param paginators: the Paginators to read
+    @param max_workers: the maximum number of unordered streams read at once
+    @param key: the sort key of the items, or None for arrival order
+    @param reverse: whether the streams are sorted in descending order
+    @param read_ahead: the number of pages buffered per stream
+    @return: an iterator of items
+    """
+    paginators = list(paginators)
+    if not paginators:
+        return iter(())
+    if key is None:
+        return _merge_unordered(paginators, max_workers, read_ahead)
+    return _merge_ordered(paginators, key, reverse, read_ahead)
+
+
+def bounded(fetch_page, semaphore):
+    """
+    Wraps a page fetching function so that it holds a slot of semaphore
+    while it runs
+    @param fetch_page: the function to wrap
+    @param semaphore: the semaphore shared by the functions to bound
+    @return: the wrapped function
+    """
+    def fetch(*args):
+        with semaphore:
+            return fetch_page(*args)
+
+    return fetch
+
+
+_DONE = object()
+
+
+class _Stream:
+    """Reads the pages of a paginator into a queue, in a background thread"""
+
+    def __init__(self, paginator, pages, stop, index=0):
+        self.paginator = paginator
+        self.pages = pages
+        self.stop = stop
+        self.index = index
+
+    def run(self):
+        try:
+            for page in self.paginator.pages():
+                if not self._put((self.index, page, None)):
+                    return
+        except BaseException as error:  # pylint: disable=broad-except
+            self._put((self.index, _DONE, error))
+            return
+        self._put((self.index, _DONE, None))
+
+    def _put(self, item):
+        """Queues an item, giving up once the consumer has stopped"""
+        while not self.stop.is_set():
+            try:
+                self.pages.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def items(self):
+        """Yields the items of this stream's queue, for ordered merging"""
+        while True:
+            _, page, error = self.pages.get()
+            if error is not None:
+                raise error
+            if page is _DONE:
+                return
+            yield from page
+
+
+def _start(streams, max_workers):
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    for stream in streams:
+        executor.submit(contextvars.copy_context().run, stream.run)
+    return executor
+
+
+def _merge_unordered(paginators, max_workers, read_ahead):
+    stop = threading.Event()
+    pages = queue.Queue(maxsize=read_ahead * min(max_workers,
+                                                 len(paginators)))
+    streams = [_Stream(paginator, pages, stop, index)
+               for index, paginator in enumerate(paginators)]
+    executor = _start(streams, max_workers)
+    try:
+        remaining = len(streams)
+        while remaining:
+            _, page, error = pages.get()
+            if error is not None:
+                raise error
+            if page is _DONE:
+                remaining -= 1
+                continue
+            yield from page
+    finally:
+        stop.set()
+        executor.shutdown(wait=False)
+
+
+def _merge_ordered(paginators, key, reverse, read_ahead):
+    # every stream must be open at once to compare their heads, so each has
+    # its own thread; the requests themselves are bounded by the caller
+    stop = threading.Event()
+    streams = [_Stream(paginator, queue.Queue(maxsize=read_ahead), stop)
+               for paginator in paginators]
+    executor = _start(streams, len(streams))
+    try:
+        yield from heapq.merge(*[stream.items() for stream in streams],
+                               key=key, reverse=reverse)
+    finally:
+        stop.set()
+        executor.shutdown(wait=False)
@@ -8,11 +8,270 @@ it under the terms of the Apache License v2.0.
 """
 
 
+import functools
 import json
+import re
 
 import requests
 
 from .errors import ThothError, ResponseEmptyError, GraphQLError
+from .errors import TransportError
+from .graphql import TRANSPORT_ERRORS
+from .streaming import iter_json_array
+
+QUERY_ERRORS = (KeyError, TypeError, ValueError, json.decoder.JSONDecodeError,
+                requests.exceptions.RequestException)
+
+
+# the number of rendered query documents kept; each distinct query, alias,
+# field projection and set of variables renders its own document
+DOCUMENT_CACHE_SIZE = 512
+
+# GraphQL scalars whose values are sent as plain strings
+STRING_SCALARS = {'String', 'ID', 'Uuid', 'Doi', 'Isbn', 'Orcid', 'Ror',
+                  'Timestamp'}
+
+
+def parse_graphql_literal(text):
+    """
+    Parses a GraphQL input literal, such as '{field: DOI, direction: ASC}' or
+    '["uuid" "uuid"]', into the equivalent JSON-compatible python value. Enum
+    values become strings.
+    @param text: the literal
+    @return: the python value
+    """
+    value, position = _parse_literal(text, _skip_ignored(text, 0))
+    if _skip_ignored(text, position) != len(text):
+        raise ValueError('Unexpected input in GraphQL literal: {0}'.format(text))
+    return value
+
+
+def _skip_ignored(text, position):
+    """Skips whitespace and commas, which are insignificant in GraphQL"""
+    while position < len(text) and text[position] in ' \t\r\n,':
+        position += 1
+    return position
+
+
+def _parse_literal(text, position):
+    """Parses the literal starting at position and returns it with the end"""
+    if position >= len(text):
+        raise ValueError('Unexpected end of GraphQL literal: {0}'.format(text))
+
+    char = text[position]
+
+    if char == '"':
+        return json.JSONDecoder().raw_decode(text, position)
+
+    if char in '[{':
+        closing = ']' if char == '[' else '}'
+        result = [] if char == '[' else {}
+        position = _skip_ignored(text, position + 1)
+        while position < len(text) and text[position] != closing:
+            if char == '{':
+                key, position = _parse_name(text, position)
+                position = _skip_ignored(text, position)
+                if position >= len(text) or text[position] != ':':
+                    raise ValueError('Expected ":" in GraphQL literal: '
+                                     '{0}'.format(text))
+                value, position = _parse_literal(
+                    text, _skip_ignored(text, position + 1))
+                result[key] = value
+            else:
+                value, position = _parse_literal(text, position)
+                result.append(value)
+            position = _skip_ignored(text, position)
+        if position >= len(text):
+            raise ValueError('Unterminated GraphQL literal: {0}'.format(text))
+        return result, position + 1
+
+    token, end = _parse_name(text, position, numeric=True)
+    if token in ('true', 'false'):
+        return token == 'true', end
+    if token == 'null':
+        return None, end
+    if token[0] in '-0123456789':
+        number = float(token) if any(c in token for c in '.eE') \
+            else int(token)
+        return number, end
+    return token, end
+
+
+def _parse_name(text, position, numeric=False):
+    """Reads a GraphQL name (or number) token"""
+    end = position
+    allowed = '_-+.' if numeric else '_'
+    while end < len(text) and (text[end].isalnum() or text[end] in allowed):
+        end += 1
+    if end == position:
+        raise ValueError('Unexpected character in GraphQL literal: '
+                         '{0}'.format(text))
+    return text[position:end], end
+
+
+def coerce_variable(value, type_name):
+    """
+    Converts an endpoint parameter into a GraphQL variable value. Parameters
+    have historically been passed as GraphQL literals (for instance
+    '["uuid"]' or '{field: DOI, direction: ASC}') and these are still
+    accepted alongside plain python values.
+    @param value: the parameter value
+    @param type_name: the declared GraphQL type of the variable (e.g. [Uuid!])
+    @return: the JSON-compatible variable value
+    """
+    if not isinstance(value, str):
+        return value
+
+    stripped = value.strip()
+
+    if type_name.rstrip('!') in STRING_SCALARS and \
+            not stripped.startswith('"'):
+        return value
+
+    try:
+        return parse_graphql_literal(stripped)
+    except ValueError:
+        return value
+
+
+def split_fields(text):
+    """
+    Splits a comma-separated list of fields, such as
+    'workId, doi, imprint { imprintName }', at the top level only
+    @param text: the list of fields
+    @return: a list of fields
+    """
+    fields = []
+    depth = 0
+    start = 0
+    for position, char in enumerate(text):
+        if char in '{(':
+            depth += 1
+        elif char in '})':
+            depth -= 1
+        elif char == ',' and depth == 0:
+            fields.append(text[start:position])
+            start = position + 1
+    fields.append(text[start:])
+    return [field.strip() for field in fields if field.strip()]
+
+
+def field_name(field):
+    """
+    Returns the name of a field selection, e.g. 'imprint' for
+    'imprint { imprintName }'
+    @param field: the field selection
+    @return: the name, or the stripped selection if it does not start with one
+    """
+    match = re.match(r'\s*(\w+)', field)
+    return match.group(1) if match else field.strip()
+
+
+def select_fields(declared, fields=None, current=None):
+    """
+    Resolves a per-call field projection against a query's declared fields.
+
+    Names prefixed with "-" are removed from the current selection (by
+    default the declared fields). Otherwise the fields replace it: a bare
+    name that is declared brings its declared selection (with any nested
+    fields and arguments), anything else is sent as written. __typename is
+    kept whenever it is declared.
+    @param declared: the fields declared in QUERIES
+    @param fields: a list of fields, a comma-separated string, or None
+    @param current: the selection to trim, such as a profile's fields
+    @return: the fields to select
+    """
+    current = list(declared) if current is None else current
+    if fields is None:
+        return current
+    if isinstance(fields, str):
+        fields = split_fields(fields)
+    fields = [field.strip() for field in fields]
+
+    by_name = {field_name(field): field for field in declared}
+    removed = [field[1:].strip() for field in fields if field.startswith('-')]
+
+    if removed:
+        if len(removed) != len(fields):
+            raise ValueError('Fields must either all be removed (with "-") '
+                             'or all be selected')
+        names = [field_name(field) for field in current]
+        unknown = [name for name in removed if name not in names]
+        if unknown:
+            raise ValueError('Unknown fields: {0}'.format(', '.join(unknown)))
+        return [field for field in current
+                if field_name(field) not in removed]
+
+    if not fields:
+        raise ValueError('At least one field must be selected')
+    selected = [by_name.get(field, field) for field in fields]
+    if '__typename' in by_name and '__typename' not in fields:
+        selected.append(by_name['__typename'])
+    return selected
+
+
+def select_profile(query, profile=None):
+    """
+    Returns the fields of a named selection profile of a query. Profiles are
+    declared in QUERIES as lists of field names (or selections) under
+    "profiles"; "full" is every declared field.
+    @param query: the query's entry in QUERIES
+    @param profile: the name of the profile, or None for every field
+    @return: the fields to select
+    """
+    declared = query.get('fields', [])
+    if profile is None or profile == 'full':
+        return list(declared)
+
+    profiles = query.get('profiles', {})
+    if profile not in profiles:
+        raise ValueError('Unknown profile {0}; available profiles: '
+                         '{1}'.format(profile,
+                                      ', '.join(['full'] + list(profiles))))
+    return select_fields(declared, profiles[profile])
+
+
+def require_fields(fields, required):
+    """
+    Adjusts a per-call field projection so that it keeps some fields
+    @param fields: a list of fields, a comma-separated string, or None
+    @param required: the names of the fields to keep
+    @return: the adjusted projection
+    """
+    if fields is None:
+        return None
+    if isinstance(fields, str):
+        fields = split_fields(fields)
+    fields = [field.strip() for field in fields]
+
+    if any(field.startswith('-') for field in fields):
+        kept = [field for field in fields if field[1:].strip() not in required]
+        return kept or None
+    names = [field_name(field) for field in fields]
+    return fields + [name for name in required if name not in names]
+
+
+@functools.lru_cache(maxsize=DOCUMENT_CACHE_SIZE)
+def _render_document(query_name, alias_of, param_str, fields_str,
+                     definitions):
+    """
+    Renders a query document, keeping the most recently used ones
+    @return: the document
+    """
+    values = {
+        "definitions": "(" + definitions + ")" if definitions else '',
+        "query_name": query_name + ": " + alias_of if alias_of else query_name,
+        "parameters": "(" + param_str + ")" if param_str else '',
+        "fields": "{" + fields_str + "}" if fields_str else ''
+    }
+
+    payload = """
+        query%(definitions)s {
+            %(query_name)s%(parameters)s
+            %(fields)s
+        }
+    """
+    return payload % values
 
 
 class ThothQuery:
@@ -23,18 +282,34 @@ class ThothQuery:
        of tuples (str, bool) where the string represents the attribute and the
        boolean represents whether the values should be enclosed with quotes
        and sanitised.
+
+       Parameters declared in the query's 'variables' map (name to GraphQL
+       type) are sent as variables, so that the query text stays constant and
+       can be cached by the server. Undeclared parameters are interpolated
+       into the query text.
     """
 
-    def __init__(self, query_name, parameters, queries, raw=False):
+    def __init__(self, query_name, parameters, queries, raw=False,
+                 fields=None, profile=None):
         """Returns new ThothQuery object
 
-        mutation_name: Must match one of the keys found in MUTATIONS.
+        query_name: Must match one of the keys found in QUERIES.
+
+        parameters: Dictionary of query arguments and their values.
+
+        fields: replaces or trims the fields declared in QUERIES for this
+        query (see select_fields).
 
-        mutation_data: Dictionary of mutation fields and their values.
+        profile: the named selection profile to start from (see
+        select_profile).
         """
         self.QUERIES = queries
         self.query_name = query_name
         self.parameters = parameters
+        self.fields = fields
+        self.profile = profile
+        self.variable_types = self.prepare_variable_types()
+        self.variables = self.prepare_variables()
         self.param_str = self.prepare_parameters()
         self.fields_str = self.prepare_fields()
         self.alias_of = self.prepare_alias_of()
@@ -43,43 +318,90 @@ class ThothQuery:
 
     def prepare_request(self):
         """Format the query request string"""
-        values = {
-            "query_name": self.query_name + ": " + self.alias_of if self.alias_of else self.query_name,
-            "parameters": "(" + self.param_str + ")" if self.param_str else '',
-            "fields": "{" + self.fields_str + "}" if self.fields_str else ''
-        }
+        definitions = self.prepare_variable_definitions()
+        render = _render_document
 
-        payload = """
-            query {
-                %(query_name)s%(parameters)s
-                %(fields)s
-            }
-        """
-        return payload % values
+        # documents with values interpolated into them are rarely sent twice,
+        # so only those that depend on the query's shape alone are cached
+        if len(self.variable_types) != len(self.parameters):
+            render = _render_document.__wrapped__
+
+        return render(self.query_name, self.alias_of, self.param_str,
+                      self.fields_str, definitions)
 
     def run(self, client):
         """Perform the GraphQL query and report any errors"""
         result = ""
         try:
-            result = client.execute(self.request)
+            result = client.execute(self.request, self.variables)
+            return self.parse_result(result)
+        except TRANSPORT_ERRORS as error:
+            raise TransportError(self.request, error) from error
+        except QUERY_ERRORS as error:
             if result == "":
-                raise ResponseEmptyError(self.request, "None")
-            serialised = json.loads(result)
-            if "errors" in serialised:
-                raise GraphQLError(self.request, result)
-            if self.raw:
-                return result
-            return serialised["data"][self.query_name]
-        except (KeyError, TypeError, ValueError, json.decoder.JSONDecodeError,
-                requests.exceptions.RequestException) as error:
+                result = error
+            raise ThothError(self.request, result)
+
+    async def run_async(self, client):
+        """Perform the GraphQL query on an asynchronous client"""
+        result = ""
+        try:
+            result = await client.execute(self.request, self.variables)
+            return self.parse_result(result)
+        except TRANSPORT_ERRORS as error:
+            raise TransportError(self.request, error) from error
+        except QUERY_ERRORS as error:
             if result == "":
                 result = error
             raise ThothError(self.request, result)
 
-    def prepare_parameters(self):
+    def open_stream(self, client):
+        """
+        Sends the GraphQL query and returns the response body as it arrives,
+        to be decoded with parse_stream
+        """
+        try:
+            return client.stream(self.request, self.variables)
+        except TRANSPORT_ERRORS as error:
+            raise TransportError(self.request, error) from error
+
+    def parse_stream(self, chunks):
+        """
+        Decode a streamed server response and yield the items of this query's
+        list as each one arrives
+        """
+        def skipped(keys, value):
+            if keys == ('errors',):
+                raise GraphQLError(self.request,
+                                   json.dumps({'errors': value}))
+
+        try:
+            yield from iter_json_array(chunks, ('data', self.query_name),
+                                       on_skipped=skipped)
+        except TRANSPORT_ERRORS as error:
+            raise TransportError(self.request, error) from error
+        except QUERY_ERRORS as error:
+            raise ThothError(self.request, error)
+
+    def parse_result(self, result):
+        """Decode a server response and return the data for this query"""
+        if result == "":
+            raise ResponseEmptyError(self.request, "None")
+        serialised = json.loads(result)
+        if "errors" in serialised:
+            raise GraphQLError(self.request, result)
+        if self.raw:
+            return result
+        return serialised["data"][self.query_name]
+
+    def prepare_parameters(self, prefix=''):
         """Returns a string with all query parameters."""
         parameters = []
         for key, value in self.parameters.items():
+            if key in self.variable_types:
+                parameters.append("{0}: ${1}{0}".format(key, prefix))
+                continue
+
             # note that we strip out extraneous quotation marks from parameters
             # because ORDER clauses, for instance, do not allow them
 
@@ -87,11 +409,57 @@ class ThothQuery:
                               "{}, ".format(key, value))
         return ", ".join(parameters)
 
+    def prepare_variable_types(self):
+        """Returns the declared GraphQL types of the parameters in use."""
+        declared = {}
+        if self.query_name in self.QUERIES:
+            declared = self.QUERIES[self.query_name].get('variables', {})
+        return {key: declared[key] for key in self.parameters
+                if key in declared}
+
+    def prepare_variables(self):
+        """Returns the variables payload, or None if nothing is declared."""
+        if not self.variable_types:
+            return None
+        return {key: coerce_variable(self.parameters[key], type_name)
+                for key, type_name in self.variable_types.items()}
+
+    def prepare_variable_definitions(self, prefix=''):
+        """Returns a string with the query's variable definitions."""
+        return ", ".join("${0}{1}: {2}".format(prefix, key, type_name)
+                         for key, type_name in self.variable_types.items())
+
+    def prepare_aliased(self, alias):
+        """
+        Returns this query as a selection under an alias, with its variables
+        renamed to match, so that it can be merged with other queries into a
+        single GraphQL document
+        @param alias: the response key for this query
+        @return: the selection, its variable definitions and its variables
+        """
+        prefix = alias + '_'
+        param_str = self.prepare_parameters(prefix=prefix)
+        selection = "{0}: {1}{2} {3}".format(
+            alias, self.alias_of or self.query_name,
+            "(" + param_str + ")" if param_str else '',
+            "{" + self.fields_str + "}" if self.fields_str else '')
+        variables = {prefix + key: value
+                     for key, value in (self.variables or {}).items()}
+
+        return (selection, self.prepare_variable_definitions(prefix=prefix),
+                variables)
+
     def prepare_fields(self):
         """Returns a string with all query fields."""
         if self.query_name in self.QUERIES and \
                 'fields' in self.QUERIES[self.query_name]:
-            return "\n".join(self.QUERIES[self.query_name]["fields"])
+            query = self.QUERIES[self.query_name]
+            return "\n".join(select_fields(
+                query["fields"], self.fields,
+                current=select_profile(query, self.profile)))
+        if self.fields is not None or self.profile is not None:
+            raise ValueError('{0} has no fields to '
+                             'select'.format(self.query_name))
         return ''
 
     def prepare_alias_of(self):
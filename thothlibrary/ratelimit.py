@@ -0,0 +1,173 @@
+"""
+GraphQL client for Thoth
+
+(c) ΔQ Programming LLP, July 2021
+This programme is free software; you may redistribute and/or modify
+it under the terms of the Apache License v2.0.
+"""
+import asyncio
+import os
+import struct
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+
+class TokenBucket:
+    """
+    A token bucket that paces outgoing requests. Tokens are added at rate
+    per second up to burst; every request takes one token and waits until it
+    is available. A single bucket can be shared by any number of clients and
+    threads.
+
+    Waiting callers reserve their token before they sleep, so callers are
+    served in the order they arrived and the bucket never releases more than
+    rate requests per second once the burst is spent.
+    """
+
+    def __init__(self, rate, burst=None):
+        """
+        Creates a token bucket, initially full
+        @param rate: the sustained number of requests per second
+        @param burst: the number of requests that can be sent at once
+        (defaults to rate, and at least one)
+        """
+        if rate <= 0:
+            raise ValueError('The rate must be positive')
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(1, rate))
+        self.sleep = time.sleep
+        self.async_sleep = asyncio.sleep
+        self.clock = time.monotonic
+        self._lock = threading.Lock()
+        self._tokens = self.burst
+        self._updated = None
+        self.acquired = 0
+        self.waited = 0.0
+
+    def acquire(self, tokens=1, timeout=None):
+        """
+        Takes tokens from the bucket, blocking until they are available
+        @param tokens: the number of tokens to take
+        @param timeout: the longest time to wait, in seconds, or None
+        @return: the time spent waiting, in seconds, or None if the tokens
+        would not be available within timeout (none are taken)
+        """
+        delay = self.reserve(tokens, timeout)
+        if delay is not None and delay > 0:
+            self.sleep(delay)
+        return delay
+
+    async def acquire_async(self, tokens=1, timeout=None):
+        """
+        Takes tokens from the bucket, waiting without blocking the event loop
+        @param tokens: the number of tokens to take
+        @param timeout: the longest time to wait, in seconds, or None
+        @return: the time spent waiting, in seconds, or None if the tokens
+        would not be available within timeout (none are taken)
+        """
+        delay = self.reserve(tokens, timeout)
+        if delay is not None and delay > 0:
+            await self.async_sleep(delay)
+        return delay
+
+    def reserve(self, tokens=1, timeout=None):
+        """
+        Takes tokens from the bucket, possibly in advance of them being added
+        @param tokens: the number of tokens to take
+        @param timeout: the longest acceptable wait, in seconds, or None
+        @return: the time to wait before the tokens may be used, in seconds,
+        or None if that would exceed timeout (none are taken)
+        """
+        with self._lock:
+            delay = self._take(tokens, timeout)
+            if delay is not None:
+                self.acquired += tokens
+                self.waited += delay
+        return delay
+
+    def stats(self):
+        """
+        Returns the rate limiter counters
+        @return: a dictionary of tokens acquired and seconds spent waiting
+        """
+        with self._lock:
+            return {'acquired': self.acquired, 'waited': self.waited}
+
+    def _take(self, tokens, timeout=None):
+        """
+        Refills the bucket, takes tokens and returns the wait for them, or
+        only refills it and returns None if the wait would exceed timeout
+        """
+        now = self.clock()
+        available, updated = self._load(now)
+        available = min(self.burst, available + (now - updated) * self.rate)
+        delay = max(0.0, (tokens - available) / self.rate)
+        if timeout is not None and delay > timeout:
+            self._store(available, now)
+            return None
+        self._store(available - tokens, now)
+        return delay
+
+    def _load(self, now):
+        if self._updated is None:
+            return self._tokens, now
+        return self._tokens, self._updated
+
+    def _store(self, tokens, now):
+        self._tokens = tokens
+        self._updated = now
+
+
+class FileTokenBucket(TokenBucket):
+    """
+    A token bucket whose state is kept in a file, so that it is shared by
+    every process (for instance parallel crawlers on one host) that opens the
+    same path. Access to the file is serialised with an advisory lock.
+    """
+    _format = struct.Struct('<dd')
+
+    def __init__(self, path, rate, burst=None):
+        """
+        Creates a token bucket backed by a file
+        @param path: the file holding the bucket's state
+        @param rate: the sustained number of requests per second
+        @param burst: the number of requests that can be sent at once
+        """
+        if fcntl is None:
+            raise ImportError('FileTokenBucket requires fcntl, which is not '
+                              'available on this platform')
+        super().__init__(rate, burst)
+        self.path = path
+        self._fd = None
+        # the wall clock is the only clock shared between processes
+        self.clock = time.time
+
+    def _take(self, tokens, timeout=None):
+        # called with the thread lock held; the file lock serialises the
+        # other processes
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                self._fd = fd
+                return super()._take(tokens, timeout)
+            finally:
+                self._fd = None
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+
+    def _load(self, now):
+        data = os.pread(self._fd, self._format.size, 0)
+        if len(data) < self._format.size:
+            return self.burst, now
+        tokens, updated = self._format.unpack(data)
+        return tokens, min(updated, now)
+
+    def _store(self, tokens, now):
+        os.pwrite(self._fd, self._format.pack(tokens, now), 0)
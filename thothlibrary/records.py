@@ -0,0 +1,294 @@
+"""
+GraphQL client for Thoth
+
+(c) ΔQ Programming LLP, July 2021
+This programme is free software; you may redistribute and/or modify
+it under the terms of the Apache License v2.0.
+"""
+import re
+import threading
+
+_TOKEN = re.compile(r'\w+|[(){}]')
+
+# the generated record classes, shared by every builder so that a record
+# unpickled in another process gets the class it was pickled with
+_record_types = {}
+_record_types_lock = threading.Lock()
+
+
+def parse_selection(fields):
+    """
+    Parses the fields of a query, as declared in QUERIES, into a tree
+    @param fields: a list of field selections, such as
+    'imprint { imprintName publisher { publisherName } }'
+    @return: a dictionary mapping each field name to the tree of its nested
+    selection, or to None for a scalar field
+    """
+    tree, _ = _parse_tokens(_TOKEN.findall(' '.join(fields)), 0)
+    return tree
+
+
+def _parse_tokens(tokens, position):
+    """
+    Parses one level of a selection, up to its closing brace
+    @return: the tree and the position after it
+    """
+    tree = {}
+    name = None
+    while position < len(tokens):
+        token = tokens[position]
+        position += 1
+        if token == '(':
+            # arguments, e.g. (order: {field: ...}), do not select anything
+            depth = 1
+            while depth and position < len(tokens):
+                depth += {'(': 1, ')': -1}.get(tokens[position], 0)
+                position += 1
+        elif token == '{':
+            tree[name], position = _parse_tokens(tokens, position)
+        elif token == '}':
+            break
+        else:
+            name = token
+            tree.setdefault(name, None)
+    return tree, position
+
+
+class Record:
+    """
+    The base of the record classes that RecordBuilder generates. A record
+    keeps its fields in __slots__ rather than in a dictionary and reads like
+    the Munch objects built by default: by attribute, by key, with "in",
+    get(), keys(), items() and toDict(). Its __typename is a class attribute.
+    """
+    __slots__ = ()
+    # the fields in the order of the query, including __typename
+    _order = ()
+    _typename = None
+    _formatter = None
+
+    def keys(self):
+        """
+        Returns the names of the fields the record holds
+        @return: a list of field names
+        """
+        keys = []
+        for name in self._order:
+            if name == '__typename':
+                if self._typename is not None:
+                    keys.append(name)
+            elif hasattr(self, name):
+                keys.append(name)
+        return keys
+
+    def items(self):
+        """
+        Returns the fields the record holds
+        @return: a list of (name, value) pairs
+        """
+        return [(name, self[name]) for name in self.keys()]
+
+    def values(self):
+        """
+        Returns the values of the fields the record holds
+        @return: a list of values
+        """
+        return [self[name] for name in self.keys()]
+
+    def get(self, key, default=None):
+        """
+        Returns a field, or default if the record does not hold it
+        @param key: the name of the field
+        @param default: the value to return for a missing field
+        @return: the value
+        """
+        if key == '__typename':
+            return self._typename if self._typename is not None else default
+        return getattr(self, key, default)
+
+    def toDict(self):  # pylint: disable=invalid-name
+        """
+        Converts the record, and the records nested in it, into dictionaries
+        @return: a dictionary
+        """
+        return {name: _to_dict(value) for name, value in self.items()}
+
+    def __getitem__(self, key):
+        if key == '__typename' and self._typename is not None:
+            return self._typename
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __contains__(self, key):
+        if key == '__typename':
+            return self._typename is not None
+        return key in self._order and hasattr(self, key)
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+    def __eq__(self, other):
+        if isinstance(other, Record):
+            other = other.toDict()
+        return self.toDict() == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return '{0}({1})'.format(type(self).__name__, ', '.join(
+            '{0}={1!r}'.format(name, value) for name, value in self.items()
+            if name != '__typename'))
+
+    def __reduce__(self):
+        return _restore, (type(self).__name__, self._order, self._typename,
+                          self._formatter, [(name, getattr(self, name))
+                                            for name in self.__slots__
+                                            if hasattr(self, name)])
+
+
+def record_type(name, order, typename=None, formatter=None):
+    """
+    Returns the record class with a slot per field, generating it on first
+    use
+    @param name: the name of the class
+    @param order: the names of the fields, in the order of the query
+    @param typename: the __typename of the records, or None
+    @param formatter: the __str__ of the records, or None
+    @return: the class
+    """
+    key = (name, order, typename, formatter)
+    record_class = _record_types.get(key)
+    if record_class is None:
+        with _record_types_lock:
+            record_class = _record_types.get(key)
+            if record_class is None:
+                record_class = _record_types[key] = _generate(*key)
+    return record_class
+
+
+def _generate(name, order, typename, formatter):
+    """Generates a record class with a slot per field"""
+    namespace = {
+        '__slots__': tuple(field for field in order
+                           if field != '__typename'),
+        '__module__': __name__,
+        '_order': order,
+        '_fields': frozenset(order) | {'__typename'},
+        '_typename': typename,
+        # a staticmethod, so that reading it gives the formatter itself
+        '_formatter': staticmethod(formatter),
+        '__typename': typename,
+    }
+    if formatter is not None:
+        namespace['__str__'] = formatter
+    return type(name, (Record,), namespace)
+
+
+def _restore(name, order, typename, formatter, values):
+    """Rebuilds a pickled record"""
+    record_class = record_type(name, order, typename, formatter)
+    record = record_class.__new__(record_class)
+    for field, value in values:
+        setattr(record, field, value)
+    return record
+
+
+def _to_dict(value):
+    if isinstance(value, Record):
+        return value.toDict()
+    if isinstance(value, list):
+        return [_to_dict(element) for element in value]
+    return value
+
+
+class RecordBuilder:
+    """
+    Builds records from decoded results, as an alternative to Munch objects
+    for large result sets.
+
+    A record class is generated for each nested selection of a query and
+    each __typename found there, with one slot per field that QUERIES
+    declares for that selection. Classes are generated on first use and
+    shared by every builder (see record_type), so records can be pickled.
+    Results holding fields that the query does not declare (such as those
+    selected with the fields argument) get a class with slots for those
+    fields too.
+    """
+
+    def __init__(self, queries, formatters=None):
+        """
+        Creates a record builder
+        @param queries: the QUERIES of a Thoth version
+        @param formatters: the __str__ of the top-level records of each
+        endpoint (e.g. a version's default_fields)
+        """
+        self.queries = queries
+        self.formatters = formatters or {}
+        self._trees = {}
+        self._classes = {}
+        self._lock = threading.Lock()
+
+    def build(self, endpoint_name, data):
+        """
+        Builds the records of a result
+        @param endpoint_name: the name of the endpoint
+        @param data: the decoded result (an object or a list of objects)
+        @return: a record or a list of records
+        """
+        tree = self._trees.get(endpoint_name)
+        if tree is None:
+            fields = self.queries.get(endpoint_name, {}).get('fields', [])
+            tree = self._trees[endpoint_name] = parse_selection(fields)
+        return self._convert(data, tree, (endpoint_name,))
+
+    def _convert(self, value, tree, path):
+        if isinstance(value, dict):
+            return self._record(value, tree, path)
+        if isinstance(value, list):
+            return [self._convert(element, tree, path) for element in value]
+        return value
+
+    def _record(self, item, tree, path):
+        record_class = self._class(item, tree or {}, path)
+        record = record_class.__new__(record_class)
+        for key, value in item.items():
+            if key == '__typename':
+                continue
+            if isinstance(value, (dict, list)):
+                value = self._convert(value, (tree or {}).get(key),
+                                      path + (key,))
+            setattr(record, key, value)
+        return record
+
+    def _class(self, item, tree, path):
+        """
+        Returns the record class for an object of a selection, generating it
+        on first use
+        """
+        typename = item.get('__typename')
+        key = (path, typename)
+        record_class = self._classes.get(key)
+        if record_class is not None and \
+                item.keys() <= record_class._fields:
+            return record_class
+
+        extra = tuple(name for name in item if name not in tree)
+        if extra:
+            key = (path, typename, extra)
+            record_class = self._classes.get(key)
+            if record_class is not None:
+                return record_class
+
+        with self._lock:
+            if key not in self._classes:
+                name = typename or path[-1][:1].upper() + path[-1][1:]
+                formatter = self.formatters.get(path[0]) \
+                    if len(path) == 1 else None
+                self._classes[key] = record_type(
+                    name, tuple(tree) + extra, typename, formatter)
+            return self._classes[key]
@@ -0,0 +1,241 @@
+"""
+GraphQL client for Thoth
+
+(c) ΔQ Programming LLP, July 2021
+This programme is free software; you may redistribute and/or modify
+it under the terms of the Apache License v2.0.
+"""
+import asyncio
+import random
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import requests
+
+from . import deadline
+from .errors import HTTPStatusError, ResponseEmptyError, TransportError
+
+# statuses that mean the server did not (or may not have) processed a request
+QUERY_RETRY_STATUSES = frozenset([429, 500, 502, 503, 504])
+# statuses that guarantee a mutation was not applied
+MUTATION_RETRY_STATUSES = frozenset([429, 503])
+# transport failures after which a mutation can not have reached the server
+MUTATION_RETRY_TRANSPORT = (requests.exceptions.ConnectTimeout,)
+# the longest a server can make a client wait through Retry-After
+DEFAULT_MAX_RETRY_AFTER = 120.0
+
+
+def parse_retry_after(value, now=None):
+    """
+    Converts a Retry-After header into a delay
+    @param value: the header, in seconds or as an HTTP date
+    @param now: the current time (for testing)
+    @return: the delay in seconds, or None if the header is not valid
+    """
+    if value is None:
+        return None
+    value = value.strip()
+
+    if value.isdigit():
+        return float(value)
+
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if when is None:
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+
+    now = now or datetime.now(timezone.utc)
+    return max(0.0, (when - now).total_seconds())
+
+
+class RetryPolicy:
+    """
+    Decides whether and when a failed request is sent again.
+
+    Delays grow exponentially from backoff up to max_backoff and are drawn
+    with full jitter, so that clients failing together do not retry
+    together. A Retry-After header on a 429 or 5xx response replaces the
+    computed delay, up to max_retry_after seconds. Each call may retry at
+    most max_retries times and, when max_elapsed is set, gives up once the
+    next attempt would start more than max_elapsed seconds after the first,
+    or would start after the deadline in force (see thothlibrary.deadline).
+
+    Queries are idempotent and are retried after empty responses, transport
+    failures and any status in query_statuses. Mutations are only retried
+    when the server can not have applied them: empty responses, connection
+    timeouts and the statuses in mutation_statuses.
+    """
+
+    def __init__(self, max_retries=2, backoff=0.25, max_backoff=30.0,
+                 multiplier=2.0, jitter=True, max_elapsed=None,
+                 respect_retry_after=True,
+                 max_retry_after=DEFAULT_MAX_RETRY_AFTER,
+                 query_statuses=QUERY_RETRY_STATUSES,
+                 mutation_statuses=MUTATION_RETRY_STATUSES,
+                 on_retry=None):
+        """
+        Creates a retry policy
+        @param max_retries: the maximum number of retries per call
+        @param backoff: the delay before the first retry, in seconds
+        @param max_backoff: the largest computed delay, in seconds
+        @param multiplier: the growth of the delay after each retry
+        @param jitter: whether to draw each delay uniformly from [0, delay]
+        @param max_elapsed: the time budget of a call in seconds, or None
+        @param respect_retry_after: whether to wait as long as the server asks
+        @param max_retry_after: the longest delay taken from a Retry-After
+        header, in seconds
+        @param query_statuses: the HTTP statuses after which queries retry
+        @param mutation_statuses: the HTTP statuses after which mutations retry
+        @param on_retry: called with (attempt, error, delay) before each retry
+        """
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.max_elapsed = max_elapsed
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+        self.query_statuses = frozenset(query_statuses)
+        self.mutation_statuses = frozenset(mutation_statuses)
+        self.on_retry = on_retry
+        self.sleep = time.sleep
+        self.async_sleep = asyncio.sleep
+        self.clock = time.monotonic
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.retries = 0
+        self.failures = 0
+        self.reasons = Counter()
+
+    def is_retryable(self, error, idempotent=True):
+        """
+        Classifies an error
+        @param error: the exception raised by an attempt
+        @param idempotent: True for queries, False for mutations
+        @return: True if the request may be sent again
+        """
+        if isinstance(error, ResponseEmptyError):
+            return True
+        if isinstance(error, HTTPStatusError):
+            statuses = self.query_statuses if idempotent \
+                else self.mutation_statuses
+            return error.status in statuses
+        if isinstance(error, TransportError):
+            return idempotent or isinstance(error.__cause__,
+                                            MUTATION_RETRY_TRANSPORT)
+        return False
+
+    def delay(self, attempt, error=None):
+        """
+        Returns the time to wait before a retry
+        @param attempt: the number of the retry, starting at 1
+        @param error: the error that caused the retry
+        @return: the delay in seconds
+        """
+        if self.respect_retry_after and isinstance(error, HTTPStatusError):
+            retry_after = parse_retry_after(error.headers.get('Retry-After'))
+            if retry_after is not None:
+                return min(retry_after, self.max_retry_after)
+
+        delay = min(self.max_backoff,
+                    self.backoff * self.multiplier ** (attempt - 1))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+    def call(self, function, idempotent=True):
+        """
+        Calls function, retrying it as the policy allows
+        @param function: the request to make
+        @param idempotent: True for queries, False for mutations
+        @return: the result of function
+        """
+        start = self._record_call()
+        attempt = 0
+        while True:
+            try:
+                return function()
+            except Exception as error:  # pylint: disable=broad-except
+                attempt += 1
+                delay = self._next_delay(attempt, error, idempotent, start)
+            self.sleep(delay)
+
+    async def call_async(self, function, idempotent=True):
+        """
+        Awaits function, retrying it as the policy allows
+        @param function: a coroutine function making the request
+        @param idempotent: True for queries, False for mutations
+        @return: the result of function
+        """
+        start = self._record_call()
+        attempt = 0
+        while True:
+            try:
+                return await function()
+            except Exception as error:  # pylint: disable=broad-except
+                attempt += 1
+                delay = self._next_delay(attempt, error, idempotent, start)
+            await self.async_sleep(delay)
+
+    def stats(self):
+        """
+        Returns the retry counters
+        @return: a dictionary of calls, retries, calls that failed and the
+        number of retries per reason
+        """
+        with self._lock:
+            return {'calls': self.calls,
+                    'retries': self.retries,
+                    'failures': self.failures,
+                    'reasons': dict(self.reasons)}
+
+    def _record_call(self):
+        with self._lock:
+            self.calls += 1
+        return self.clock()
+
+    def _next_delay(self, attempt, error, idempotent, start):
+        """
+        Returns the delay before the next attempt, or re-raises error when
+        the call must not be retried
+        """
+        delay = None
+        if attempt <= self.max_retries and \
+                self.is_retryable(error, idempotent):
+            delay = self.delay(attempt, error)
+            if self.max_elapsed is not None and \
+                    self.clock() + delay - start > self.max_elapsed:
+                delay = None
+            left = deadline.remaining()
+            if left is not None and delay is not None and delay >= left:
+                delay = None
+
+        with self._lock:
+            if delay is None:
+                self.failures += 1
+            else:
+                self.retries += 1
+                self.reasons[self._reason(error)] += 1
+
+        if delay is None:
+            raise error
+
+        if self.on_retry is not None:
+            self.on_retry(attempt, error, delay)
+        return delay
+
+    @staticmethod
+    def _reason(error):
+        if isinstance(error, HTTPStatusError):
+            return str(error.status)
+        if isinstance(error, TransportError) and error.__cause__ is not None:
+            return type(error.__cause__).__name__
+        return type(error).__name__
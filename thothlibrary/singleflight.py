@@ -0,0 +1,111 @@
+"""
+GraphQL client for Thoth
+
+(c) ΔQ Programming LLP, July 2021
+This programme is free software; you may redistribute and/or modify
+it under the terms of the Apache License v2.0.
+"""
+import hashlib
+import json
+import re
+import threading
+from concurrent.futures import Future, TimeoutError
+
+from . import deadline
+from .errors import DeadlineExceededError
+
+
+class SingleFlight:
+    """
+    Collapses concurrent identical calls into one. The first caller for a key
+    runs the call; callers that arrive with the same key while it is in
+    flight wait for it and share its result (or its exception). A leader
+    that exceeds its own deadline does not fail its followers, which make
+    the call again within theirs.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._in_flight = {}
+        self.calls = 0
+        self.collapsed = 0
+
+    @staticmethod
+    def key(request, variables=None, *extra):
+        """
+        Builds a key from a GraphQL request, ignoring insignificant whitespace
+        @param request: the GraphQL document
+        @param variables: the variables payload
+        @param extra: any further values that distinguish the call
+        @return: a hashable key
+        """
+        return (re.sub(r'\s+', ' ', request).strip(),
+                json.dumps(variables, sort_keys=True)) + extra
+
+    @staticmethod
+    def credentials(client):
+        """
+        Returns the values that tell apart the callers of a transport, so
+        that a SingleFlight shared between clients only collapses calls to
+        the same endpoint made with the same credentials
+        @param client: the GraphQL transport
+        @return: the endpoint, the auth header and a digest of its token
+        """
+        token = client.token
+        if token is not None:
+            token = hashlib.sha256(token.encode('utf-8')).hexdigest()
+        return client.endpoint, client.headername, token
+
+    def do(self, key, function):
+        """
+        Runs function, unless an identical call is already in flight
+        @param key: the key identifying identical calls
+        @param function: the call to make
+        @return: the result of the (possibly shared) call
+        """
+        with self._lock:
+            self.calls += 1
+            call = self._in_flight.get(key)
+            leader = call is None
+            if leader:
+                call = self._in_flight[key] = Future()
+            else:
+                self.collapsed += 1
+
+        if not leader:
+            # followers wait no longer than their own deadline allows
+            wait = deadline.check(key)
+            try:
+                return call.result(timeout=wait)
+            except TimeoutError as error:
+                raise DeadlineExceededError(key,
+                                            'Deadline exceeded') from error
+            except DeadlineExceededError:
+                # the leader ran out of its own time budget, which says
+                # nothing about this caller's: make the call again
+                return self.do(key, function)
+
+        try:
+            result = function()
+        except BaseException as error:
+            self._finish(key)
+            call.set_exception(error)
+            raise
+
+        self._finish(key)
+        call.set_result(result)
+        return result
+
+    def stats(self):
+        """
+        Returns the single-flight counters
+        @return: a dictionary of calls, collapsed calls and calls in flight
+        """
+        with self._lock:
+            return {'calls': self.calls,
+                    'collapsed': self.collapsed,
+                    'in_flight': len(self._in_flight)}
+
+    def _finish(self, key):
+        with self._lock:
+            del self._in_flight[key]
@@ -0,0 +1,172 @@
+"""
+GraphQL client for Thoth
+
+(c) ΔQ Programming LLP, July 2021
+This programme is free software; you may redistribute and/or modify
+it under the terms of the Apache License v2.0.
+"""
+import codecs
+import json
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = ' \t\r\n'
+_NUMBER = '0123456789.eE+-'
+
+
+def iter_json_array(chunks, path, on_skipped=None):
+    """
+    Parses a JSON document incrementally and yields the elements of the
+    array found at path as each one is complete. Only the element being
+    parsed and the unread part of the current chunk are held in memory.
+
+        for work in iter_json_array(response.iter_content(), ('data', 'works')):
+            ...
+
+    @param chunks: an iterable of bytes (UTF-8) or str chunks
+    @param path: the keys leading from the root object to the array
+    @param on_skipped: called with (keys, value) for every value passed over
+    on the way to the array, such as a top-level "errors" list
+    @return: an iterator of decoded elements
+    """
+    reader = _Reader(chunks)
+    found = yield from _walk(reader, tuple(path), (), on_skipped)
+    if reader.peek() is not None:
+        raise ValueError('Unexpected data after the JSON document')
+    if not found:
+        raise ValueError('No array at {0}'.format('.'.join(path)))
+
+
+def _walk(reader, path, keys, on_skipped):
+    """
+    Walks the object at the reader's position towards path, yielding the
+    array's elements, and returns whether the array was found
+    """
+    reader.expect('{')
+    found = False
+    if reader.peek() == '}':
+        reader.advance()
+        return found
+
+    while True:
+        key = reader.decode()
+        reader.expect(':')
+        here = keys + (key,)
+        char = reader.peek()
+
+        if key == path[0] and len(path) > 1 and char == '{':
+            found = (yield from _walk(reader, path[1:], here, on_skipped)) \
+                or found
+        elif key == path[0] and len(path) == 1 and char == '[':
+            yield from _elements(reader)
+            found = True
+        else:
+            value = reader.decode()
+            if on_skipped is not None:
+                on_skipped(here, value)
+
+        if reader.peek() == ',':
+            reader.advance()
+            continue
+        reader.expect('}')
+        return found
+
+
+def _elements(reader):
+    """Yields the elements of the array at the reader's position"""
+    reader.expect('[')
+    if reader.peek() == ']':
+        reader.advance()
+        return
+
+    while True:
+        yield reader.decode()
+        if reader.peek() == ',':
+            reader.advance()
+            continue
+        reader.expect(']')
+        return
+
+
+class _Reader:
+    """A buffer over a stream of chunks, refilled as parsing needs it"""
+
+    _decoder = json.JSONDecoder()
+
+    def __init__(self, chunks):
+        self.chunks = iter(chunks)
+        self.text = ''
+        self.position = 0
+        self.exhausted = False
+        self._utf8 = codecs.getincrementaldecoder('utf-8')()
+
+    def fill(self):
+        """
+        Reads the next chunk, dropping the text already consumed
+        @return: False if there are no more chunks
+        """
+        if self.exhausted:
+            return False
+        chunk = next(self.chunks, None)
+        if chunk is None:
+            self.exhausted = True
+            chunk = self._utf8.decode(b'', final=True)
+        elif isinstance(chunk, bytes):
+            chunk = self._utf8.decode(chunk)
+        self.text = self.text[self.position:] + chunk
+        self.position = 0
+        return True
+
+    def peek(self):
+        """
+        Skips whitespace and returns the next character
+        @return: the character, or None at the end of the document
+        """
+        while True:
+            while self.position < len(self.text) and \
+                    self.text[self.position] in _WHITESPACE:
+                self.position += 1
+            if self.position < len(self.text):
+                return self.text[self.position]
+            if not self.fill():
+                return None
+
+    def advance(self):
+        """Consumes the character returned by peek"""
+        self.position += 1
+
+    def expect(self, char):
+        """Consumes char, which must be the next character"""
+        found = self.peek()
+        if found != char:
+            raise ValueError('Expected {0!r} at offset {1} but found '
+                             '{2!r}'.format(char, self.position, found))
+        self.advance()
+
+    def decode(self):
+        """
+        Decodes the JSON value at the current position, reading further
+        chunks until it is complete
+        @return: the value
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self.text, self.position)
+            except json.JSONDecodeError:
+                if not self.fill():
+                    raise
+                continue
+            # a number is decoded from its longest valid prefix, so one that
+            # reaches the end of the buffer may go on in the next chunk
+            if self._may_continue(value, end) and self.fill():
+                continue
+            self.position = end
+            return value
+
+    def _may_continue(self, value, end):
+        """Returns whether a decoded value may be cut short by the buffer"""
+        if end == len(self.text):
+            return True
+        return isinstance(value, (int, float)) and \
+            not isinstance(value, bool) and self.text[end] in _NUMBER
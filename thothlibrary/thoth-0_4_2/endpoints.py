@@ -19,11 +19,13 @@ class ThothClient0_4_2(ThothClient):
     def __new__(cls, *args, **kwargs):
         return super(thothlibrary.ThothClient, ThothClient0_4_2).__new__(cls)
 
-    def __init__(self, thoth_endpoint="https://api.thoth.pub", version="0.4.2"):
+    def __init__(self, thoth_endpoint="https://api.thoth.pub", version="0.4.2",
+                 **kwargs):
         """
         Creates an instance of Thoth 0.4.2 endpoints
         @param thoth_endpoint: the Thoth API instance endpoint
         @param version: the version of the Thoth API to use
+        @param kwargs: transport options passed through to ThothClient
         """
         if hasattr(self, 'client'):
             return
@@ -38,7 +40,8 @@ class ThothClient0_4_2(ThothClient):
         with open(path, 'r') as query_file:
             self.QUERIES = json.loads(query_file.read())
 
-        super().__init__(thoth_endpoint=thoth_endpoint, version=version)
+        super().__init__(thoth_endpoint=thoth_endpoint, version=version,
+                         **kwargs)
 
     @staticmethod
     def _order_limit_filter_offset_setup(order, limit, search, offset):
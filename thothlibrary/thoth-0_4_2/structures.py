@@ -11,13 +11,12 @@ from datetime import datetime
 
 def _munch_repr(obj):
     """
-    This is a hacky munch context switcher. It passes the original __repr__
-    pointer back
+    Returns the plain representation of an object, which formatters fall
+    back to for objects they can not format
     @param obj: the object to represent
-    @return: the original munch representation
+    @return: the munch representation
     """
-    Munch.__repr__ = munch_local
-    return obj.__repr__()
+    return Munch.__repr__(obj)
 
 
 def _author_parser(obj):
@@ -69,8 +68,8 @@ def _price_parser(prices):
 
 
 # these are formatting statements for the endpoints
-# they are injected to replace the default dictionary (Munch) __repr__ and
-# __str__ methods. They let us create nice-looking string representations
+# they become the __str__ methods of each endpoint's Munch subclass (see
+# munch_types below). They let us create nice-looking string representations
 # of objects, such as books
 
 def _generic_formatter(format_object, type_name, output):
@@ -287,9 +286,43 @@ default_fields = {
     "works": _work_formatter,
 }
 
-# this stores the original function pointer of Munch.__repr__ so that we can
-# re-inject it above in "_munch_repr"
-munch_local = Munch.__repr__
+_munch_types = {}
+
+
+def _munch_type(name, formatter):
+    """
+    Creates a Munch subclass whose __str__ and __repr__ are a formatter, so
+    that each endpoint's objects (and lists of them) format themselves
+    without Munch itself being changed
+    @param name: the name of the class
+    @param formatter: the formatting function
+    @return: the class
+    """
+    munch_type = type(name, (Munch,), {'__str__': formatter,
+                                       '__repr__': formatter,
+                                       '__module__': __name__})
+    _munch_types[formatter] = munch_type
+    return munch_type
+
+
+# the classes are module attributes so that their objects can be pickled
+ContributionMunch = _munch_type('ContributionMunch', _contribution_formatter)
+ContributorMunch = _munch_type('ContributorMunch', _contributor_formatter)
+FunderMunch = _munch_type('FunderMunch', _funder_formatter)
+FundingMunch = _munch_type('FundingMunch', _funding_formatter)
+ImprintMunch = _munch_type('ImprintMunch', _imprint_formatter)
+IssueMunch = _munch_type('IssueMunch', _issue_formatter)
+LanguageMunch = _munch_type('LanguageMunch', _language_formatter)
+PriceMunch = _munch_type('PriceMunch', _price_formatter)
+PublicationMunch = _munch_type('PublicationMunch', _publication_formatter)
+PublisherMunch = _munch_type('PublisherMunch', _publisher_formatter)
+SeriesMunch = _munch_type('SeriesMunch', _series_formatter)
+SubjectMunch = _munch_type('SubjectMunch', _subject_formatter)
+WorkMunch = _munch_type('WorkMunch', _work_formatter)
+
+# the Munch subclass that the objects of each endpoint are built as
+munch_types = {endpoint: _munch_types[formatter]
+               for endpoint, formatter in default_fields.items()}
 
 
 class StructureBuilder:
@@ -298,6 +331,7 @@ class StructureBuilder:
     def __init__(self, structure, data):
         self.structure = structure
         self.data = data
+        self.munch_type = munch_types.get(structure, Munch)
 
     def create_structure(self):
         """
@@ -317,14 +351,9 @@ class StructureBuilder:
 
     def _munch(self, item):
         """
-        Converts our JSON or dict object into an addressable object.
-        Also sets up the Munch __repr__ and __str__ functions.
+        Converts our JSON or dict object into an addressable object, built
+        as the endpoint's Munch subclass for its string representation
         @param item: the item to convert
         @return: a converted object with string representation
         """
-        x = Munch.fromDict(item)
-        if self.structure in default_fields.keys():
-            struct = default_fields[self.structure]
-            Munch.__repr__ = Munch.__str__
-            Munch.__str__ = struct
-        return x
+        return self.munch_type.fromDict(item)
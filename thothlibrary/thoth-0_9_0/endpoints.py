@@ -6,8 +6,10 @@ it under the terms of the Apache License v2.0.
 import json
 import os
 import pathlib
+from typing import Sequence, Union
 
 import thothlibrary
+from thothlibrary.changefeed import ChangeFeed
 from thothlibrary.client import ThothClient
 
 
@@ -19,11 +21,13 @@ class ThothClient0_9_0(ThothClient):
     def __new__(cls, *args, **kwargs):
         return super(thothlibrary.ThothClient, ThothClient0_9_0).__new__(cls)
 
-    def __init__(self, thoth_endpoint="https://api.thoth.pub", version="0.9.0"):
+    def __init__(self, thoth_endpoint="https://api.thoth.pub", version="0.9.0",
+                 **kwargs):
         """
         Creates an instance of Thoth 0.9.0 endpoints
         @param thoth_endpoint: the Thoth API instance endpoint
         @param version: the version of the Thoth API to use
+        @param kwargs: transport options passed through to ThothClient
         """
         if hasattr(self, 'client'):
             return
@@ -38,7 +42,8 @@ class ThothClient0_9_0(ThothClient):
         with open(path, 'r') as query_file:
             self.QUERIES = json.loads(query_file.read())
 
-        super().__init__(thoth_endpoint=thoth_endpoint, version=version)
+        super().__init__(thoth_endpoint=thoth_endpoint, version=version,
+                         **kwargs)
 
     @staticmethod
     def _order_limit_filter_offset_setup(order, limit, search, offset):
@@ -58,30 +63,37 @@ class ThothClient0_9_0(ThothClient):
             "limit": limit,
         }
 
-        if search and not search.startswith('"'):
-            search = '"{0}"'.format(search)
-
         ThothClient._dictionary_append(parameters, 'filter', search)
         ThothClient._dictionary_append(parameters, 'order', order)
 
         return parameters
 
-    def contribution(self, contribution_id: str, raw: bool = False):
+    def contribution(self, contribution_id: str, raw: bool = False,
+                     fields: list = None, profile: str = None):
         """
         Returns a contribution by ID
         @param contribution_id: the contribution ID
         @param raw: whether to return a python object or the raw result
+        @param fields: the fields to select instead of those in QUERIES,
+        or names prefixed with "-" to leave out
+        @param profile: a selection profile declared in QUERIES (e.g. ids,
+        summary or full)
         @return: either an object (default) or raw server response
         """
         parameters = {
-            'contributionId': '"' + contribution_id + '"'
+            'contributionId': contribution_id
         }
 
-        return self._api_request("contribution", parameters, return_raw=raw)
+        return self._api_request("contribution", parameters,
+                                 return_raw=raw, fields=fields,
+                                 profile=profile)
 
     def contributions(self, limit: int = 100, offset: int = 0,
                       order: str = None, publishers: str = None,
-                      contribution_type: str = None, raw: bool = False):
+                      contribution_type: str = None, raw: bool = False,
+                      fields: list = None, profile: str = None,
+                      with_count: bool = False,
+                      columnar: Union[bool, Sequence[str]] = False):
         """
         Returns a contributions list
         @param limit: the maximum number of results to return
@@ -90,6 +102,14 @@ class ThothClient0_9_0(ThothClient):
         @param publishers: a list of publishers to limit by
         @param contribution_type: the contribution type (e.g. AUTHOR)
         @param raw: whether to return a python object or the raw server result
+        @param fields: the fields to select instead of those in QUERIES,
+        or names prefixed with "-" to leave out
+        @param profile: a selection profile declared in QUERIES (e.g. ids,
+        summary or full)
+        @param with_count: whether to also fetch the total number of results,
+        in the same request, and return a ThothPage with a total attribute
+        @param columnar: True, or a list of dotted field paths, to return
+        a dict of columns (see thothlibrary.columnar) instead of objects
         @return: either an object (default) or raw server response
         """
         if order is None:
@@ -104,7 +124,23 @@ class ThothClient0_9_0(ThothClient):
         self._dictionary_append(parameters, 'contributionType',
                                 contribution_type)
 
-        return self._api_request("contributions", parameters, return_raw=raw)
+        return self._api_request("contributions", parameters,
+                                 return_raw=raw, fields=fields,
+                                 profile=profile, with_count=with_count,
+                                 columnar=columnar)
+
+    def iter_contributions(self, page_size: int = 100, prefetch: bool = True,
+                           **kwargs):
+        """
+        Iterates over all contributions, fetching them page by page
+        @param page_size: the number of results to fetch per request, or
+        None to adapt it to the endpoint
+        @param prefetch: whether to fetch the next page in the background
+        @param kwargs: the other arguments of contributions (search, order...)
+        @return: an iterator of objects
+        """
+        return self.paginate('contributions', page_size=page_size,
+                             prefetch=prefetch, **kwargs)
 
     def contribution_count(self, search: str = "", publishers: str = None,
                            contribution_type: str = None, raw: bool = False):
@@ -118,9 +154,6 @@ class ThothClient0_9_0(ThothClient):
         """
         parameters = {}
 
-        if search and not search.startswith('"'):
-            search = '"{0}"'.format(search)
-
         self._dictionary_append(parameters, 'filter', search)
         self._dictionary_append(parameters, 'publishers', publishers)
         self._dictionary_append(parameters, 'contributionType',
@@ -129,22 +162,31 @@ class ThothClient0_9_0(ThothClient):
         return self._api_request("contributionCount", parameters,
                                  return_raw=raw)
 
-    def contributor(self, contributor_id: str, raw: bool = False):
+    def contributor(self, contributor_id: str, raw: bool = False,
+                    fields: list = None, profile: str = None):
         """
         Returns a contributor by ID
         @param contributor_id: the ID to fetch
         @param raw: whether to return a python object or the raw result
+        @param fields: the fields to select instead of those in QUERIES,
+        or names prefixed with "-" to leave out
+        @param profile: a selection profile declared in QUERIES (e.g. ids,
+        summary or full)
         @return: either an object (default) or raw server response
         """
         parameters = {
-            'contributorId': '"' + contributor_id + '"'
+            'contributorId': contributor_id
         }
 
-        return self._api_request("contributor", parameters, return_raw=raw)
+        return self._api_request("contributor", parameters,
+                                 return_raw=raw, fields=fields,
+                                 profile=profile)
 
     def contributors(self, limit: int = 100, offset: int = 0,
                      search: str = "", order: str = None,
-                     raw: bool = False):
+                     raw: bool = False, fields: list = None,
+                     profile: str = None, with_count: bool = False,
+                     columnar: Union[bool, Sequence[str]] = False):
         """
         Returns contributors
         @param limit: the maximum number of results to return
@@ -152,6 +194,14 @@ class ThothClient0_9_0(ThothClient):
         @param offset: the offset from which to retrieve results
         @param search: a filter string to search
         @param raw: whether to return a python object or the raw result
+        @param fields: the fields to select instead of those in QUERIES,
+        or names prefixed with "-" to leave out
+        @param profile: a selection profile declared in QUERIES (e.g. ids,
+        summary or full)
+        @param with_count: whether to also fetch the total number of results,
+        in the same request, and return a ThothPage with a total attribute
+        @param columnar: True, or a list of dotted field paths, to return
+        a dict of columns (see thothlibrary.columnar) instead of objects
         @return: either an object (default) or raw server response
         """
         parameters = self._order_limit_filter_offset_setup(order=order,
@@ -159,7 +209,23 @@ class ThothClient0_9_0(ThothClient):
                                                            limit=limit,
                                                            offset=offset)
 
-        return self._api_request("contributors", parameters, return_raw=raw)
+        return self._api_request("contributors", parameters,
+                                 return_raw=raw, fields=fields,
+                                 profile=profile, with_count=with_count,
+                                 columnar=columnar)
+
+    def iter_contributors(self, page_size: int = 100, prefetch: bool = True,
+                          **kwargs):
+        """
+        Iterates over all contributors, fetching them page by page
+        @param page_size: the number of results to fetch per request, or
+        None to adapt it to the endpoint
+        @param prefetch: whether to fetch the next page in the background
+        @param kwargs: the other arguments of contributors (search, order...)
+        @return: an iterator of objects
+        """
+        return self.paginate('contributors', page_size=page_size,
+                             prefetch=prefetch, **kwargs)
 
     def contributor_count(self, search: str = "", raw: bool = False):
         """
@@ -170,29 +236,35 @@ class ThothClient0_9_0(ThothClient):
         """
         parameters = {}
 
-        if search and not search.startswith('"'):
-            search = '"{0}"'.format(search)
-
         self._dictionary_append(parameters, 'filter', search)
 
         return self._api_request("contributorCount", parameters,
                                  return_raw=raw)
 
-    def institution(self, institution_id: str, raw: bool = False):
+    def institution(self, institution_id: str, raw: bool = False,
+                    fields: list = None, profile: str = None):
         """
         Returns an institution by ID
         @param funder_id: the ID to fetch
         @param raw: whether to return a python object or the raw result
+        @param fields: the fields to select instead of those in QUERIES,
+        or names prefixed with "-" to leave out
+        @param profile: a selection profile declared in QUERIES (e.g. ids,
+        summary or full)
         @return: either an object (default) or raw server response
         """
         parameters = {
-            'institutionId': '"' + institution_id + '"'
+            'institutionId': institution_id
         }
 
-        return self._api_request("institution", parameters, return_raw=raw)
+        return self._api_request("institution", parameters,
+                                 return_raw=raw, fields=fields,
+                                 profile=profile)
 
     def institutions(self, limit: int = 100, offset: int = 0, order: str = None,
-                     search: str = "", raw: bool = False):
+                     search: str = "", raw: bool = False, fields: list = None,
+                     profile: str = None, with_count: bool = False,
+                     columnar: Union[bool, Sequence[str]] = False):
         """
         Return institutions
         @param limit: the limit on the number of results
@@ -200,6 +272,14 @@ class ThothClient0_9_0(ThothClient):
         @param order: the order of results
         @param search: a search string
         @param raw: whether to return raw result
+        @param fields: the fields to select instead of those in QUERIES,
+        or names prefixed with "-" to leave out
+        @param profile: a selection profile declared in QUERIES (e.g. ids,
+        summary or full)
+        @param with_count: whether to also fetch the total number of results,
+        in the same request, and return a ThothPage with a total attribute
+        @param columnar: True, or a list of dotted field paths, to return
+        a dict of columns (see thothlibrary.columnar) instead of objects
         @return: an object or raw result
         """
 
@@ -208,13 +288,26 @@ class ThothClient0_9_0(ThothClient):
             "offset": offset,
         }
 
-        if search and not search.startswith('"'):
-            search = '"{0}"'.format(search)
-
         self._dictionary_append(parameters, 'filter', search)
         self._dictionary_append(parameters, 'order', order)
 
-        return self._api_request("institutions", parameters, return_raw=raw)
+        return self._api_request("institutions", parameters,
+                                 return_raw=raw, fields=fields,
+                                 profile=profile, with_count=with_count,
+                                 columnar=columnar)
+
+    def iter_institutions(self, page_size: int = 100, prefetch: bool = True,
+                          **kwargs):
+        """
+        Iterates over all institutions, fetching them page by page
+        @param page_size: the number of results to fetch per request, or
+        None to adapt it to the endpoint
+        @param prefetch: whether to fetch the next page in the background
+        @param kwargs: the other arguments of institutions (search, order...)
+        @return: an iterator of objects
+        """
+        return self.paginate('institutions', page_size=page_size,
+                             prefetch=prefetch, **kwargs)
 
     def institution_count(self, search: str = "", raw: bool = False):
         """
@@ -225,9 +318,6 @@ class ThothClient0_9_0(ThothClient):
         """
         parameters = {}
 
-        if search and not search.startswith('"'):
-            search = '"{0}"'.format(search)
-
         self._dictionary_append(parameters, 'filter', search)
 
         return self._api_request("institutionCount", parameters, return_raw=raw)
@@ -241,28 +331,35 @@ class ThothClient0_9_0(ThothClient):
         """
         parameters = {}
 
-        if search and not search.startswith('"'):
-            search = '"{0}"'.format(search)
-
         self._dictionary_append(parameters, 'filter', search)
 
         return self._api_request("fundingCount", parameters, return_raw=raw)
 
-    def funding(self, funding_id: str, raw: bool = False):
+    def funding(self, funding_id: str, raw: bool = False, fields: list = None,
+                profile: str = None):
         """
         Returns a funding by ID
         @param funding_id: the ID to fetch
         @param raw: whether to return a python object or the raw result
+        @param fields: the fields to select instead of those in QUERIES,
+        or names prefixed with "-" to leave out
+        @param profile: a selection profile declared in QUERIES (e.g. ids,
+        summary or full)
         @return: either an object (default) or raw server response
         """
         parameters = {
-            'fundingId': '"' + funding_id + '"'
+            'fundingId': funding_id
         }
 
-        return self._api_request("funding", parameters, return_raw=raw)
+        return self._api_request("funding", parameters,
+                                 return_raw=raw, fields=fields,
+                                 profile=profile)
 
     def fundings(self, limit: int = 100, offset: int = 0, order: str = None,
-                 publishers: str = None, raw: bool = False):
+                 publishers: str = None, raw: bool = False,
+                 fields: list = None, profile: str = None,
+                 with_count: bool = False,
+                 columnar: Union[bool, Sequence[str]] = False):
         """
         Returns a fundings list
         @param limit: the maximum number of results to return
@@ -270,6 +367,14 @@ class ThothClient0_9_0(ThothClient):
         @param offset: the offset from which to retrieve results
         @param publishers: a list of publishers to limit by
         @param raw: whether to return a python object or the raw server result
+        @param fields: the fields to select instead of those in QUERIES,
+        or names prefixed with "-" to leave out
+        @param profile: a selection profile declared in QUERIES (e.g. ids,
+        summary or full)
+        @param with_count: whether to also fetch the total number of results,
+        in the same request, and return a ThothPage with a total attribute
+        @param columnar: True, or a list of dotted field paths, to return
+        a dict of columns (see thothlibrary.columnar) instead of objects
         @return: either an object (default) or raw server response
         """
         if order is None:
@@ -282,7 +387,23 @@ class ThothClient0_9_0(ThothClient):
         self._dictionary_append(parameters, 'order', order)
         self._dictionary_append(parameters, 'publishers', publishers)
 
-        return self._api_request("fundings", parameters, return_raw=raw)
+        return self._api_request("fundings", parameters,
+                                 return_raw=raw, fields=fields,
+                                 profile=profile, with_count=with_count,
+                                 columnar=columnar)
+
+    def iter_fundings(self, page_size: int = 100, prefetch: bool = True,
+                      **kwargs):
+        """
+        Iterates over all fundings, fetching them page by page
+        @param page_size: the number of results to fetch per request, or
+        None to adapt it to the endpoint
+        @param prefetch: whether to fetch the next page in the background
+        @param kwargs: the other arguments of fundings (search, order...)
+        @return: an iterator of objects
+        """
+        return self.paginate('fundings', page_size=page_size,
+                             prefetch=prefetch, **kwargs)
 
     def funding_count(self, raw: bool = False):
         """
@@ -294,22 +415,31 @@ class ThothClient0_9_0(ThothClient):
 
         return self._api_request("fundingCount", parameters, return_raw=raw)
 
-    def imprint(self, imprint_id: str, raw: bool = False):
+    def imprint(self, imprint_id: str, raw: bool = False, fields: list = None,
+                profile: str = None):
         """
         Return an imprint
         @param imprint_id: the imprint
         @param raw: whether to return a python object or the raw result
+        @param fields: the fields to select instead of those in QUERIES,
+        or names prefixed with "-" to leave out
+        @param profile: a selection profile declared in QUERIES (e.g. ids,
+        summary or full)
         @return: either an object (default) or raw server response
         """
         parameters = {
-            'imprintId': '"' + imprint_id + '"'
+            'imprintId': imprint_id
         }
 
-        return self._api_request("imprint", parameters, return_raw=raw)
+        return self._api_request("imprint", parameters,
+                                 return_raw=raw, fields=fields,
+                                 profile=profile)
 
     def imprints(self, limit: int = 100, offset: int = 0, order: str = None,
                  search: str = "", publishers: str = None,
-                 raw: bool = False):
+                 raw: bool = False, fields: list = None, profile: str = None,
+                 with_count: bool = False,
+                 columnar: Union[bool, Sequence[str]] = False):
         """
         Return imprints
         @param limit: the limit on the number of results returned
@@ -318,6 +448,14 @@ class ThothClient0_9_0(ThothClient):
         @param search: a search string
         @param publishers: a list of publishers by which to limit the query
         @param raw: whether to return a raw result
+        @param fields: the fields to select instead of those in QUERIES,
+        or names prefixed with "-" to leave out
+        @param profile: a selection profile declared in QUERIES (e.g. ids,
+        summary or full)
+        @param with_count: whether to also fetch the total number of results,
+        in the same request, and return a ThothPage with a total attribute
+        @param columnar: True, or a list of dotted field paths, to return
+        a dict of columns (see thothlibrary.columnar) instead of objects
         @return: an object or raw result
         """
         parameters = self._order_limit_filter_offset_setup(order=order,
@@ -326,7 +464,23 @@ class ThothClient0_9_0(ThothClient):
                                                            offset=offset)
         self._dictionary_append(parameters, 'publishers', publishers)
 
-        return self._api_request("imprints", parameters, return_raw=raw)
+        return self._api_request("imprints", parameters,
+                                 return_raw=raw, fields=fields,
+                                 profile=profile, with_count=with_count,
+                                 columnar=columnar)
+
+    def iter_imprints(self, page_size: int = 100, prefetch: bool = True,
+                      **kwargs):
+        """
+        Iterates over all imprints, fetching them page by page
+        @param page_size: the number of results to fetch per request, or
+        None to adapt it to the endpoint
+        @param prefetch: whether to fetch the next page in the background
+        @param kwargs: the other arguments of imprints (search, order...)
+        @return: an iterator of objects
+        """
+        return self.paginate('imprints', page_size=page_size,
+                             prefetch=prefetch, **kwargs)
 
     def imprint_count(self, search: str = "", publishers: str = None,
                       raw: bool = False):
@@ -344,21 +498,31 @@ class ThothClient0_9_0(ThothClient):
 
         return self._api_request("imprintCount", parameters, return_raw=raw)
 
-    def issue(self, issue_id: str, raw: bool = False):
+    def issue(self, issue_id: str, raw: bool = False, fields: list = None,
+              profile: str = None):
         """
         Returns an issue by ID
         @param issue_id: the issue
         @param raw: whether to return a python object or the raw result
+        @param fields: the fields to select instead of those in QUERIES,
+        or names prefixed with "-" to leave out
+        @param profile: a selection profile declared in QUERIES (e.g. ids,
+        summary or full)
         @return: either an object (default) or raw server response
         """
         parameters = {
-            'issueId': '"' + issue_id + '"'
+            'issueId': issue_id
         }
 
-        return self._api_request("issue", parameters, return_raw=raw)
+        return self._api_request("issue", parameters,
+                                 return_raw=raw, fields=fields,
+                                 profile=profile)
 
     def issues(self, limit: int = 100, offset: int = 0, order: str = None,
-               search: str = "", publishers: str = None, raw: bool = False):
+               search: str = "", publishers: str = None, raw: bool = False,
+               fields: list = None, profile: str = None,
+               with_count: bool = False,
+               columnar: Union[bool, Sequence[str]] = False):
         """
         Return issues
         @param limit: the limit on the number of results to return
@@ -367,6 +531,14 @@ class ThothClient0_9_0(ThothClient):
         @param search: a search string
         @param publishers: a list of publishers by which to limit results
         @param raw: whether to return a raw response
+        @param fields: the fields to select instead of those in QUERIES,
+        or names prefixed with "-" to leave out
+        @param profile: a selection profile declared in QUERIES (e.g. ids,
+        summary or full)
+        @param with_count: whether to also fetch the total number of results,
+        in the same request, and return a ThothPage with a total attribute
+        @param columnar: True, or a list of dotted field paths, to return
+        a dict of columns (see thothlibrary.columnar) instead of objects
         @return: an object or raw response
         """
         parameters = self._order_limit_filter_offset_setup(order=order,
@@ -375,7 +547,23 @@ class ThothClient0_9_0(ThothClient):
                                                            offset=offset)
         self._dictionary_append(parameters, 'publishers', publishers)
 
-        return self._api_request("issues", parameters, return_raw=raw)
+        return self._api_request("issues", parameters,
+                                 return_raw=raw, fields=fields,
+                                 profile=profile, with_count=with_count,
+                                 columnar=columnar)
+
+    def iter_issues(self, page_size: int = 100, prefetch: bool = True,
+                    **kwargs):
+        """
+        Iterates over all issues, fetching them page by page
+        @param page_size: the number of results to fetch per request, or
+        None to adapt it to the endpoint
+        @param prefetch: whether to fetch the next page in the background
+        @param kwargs: the other arguments of issues (search, order...)
+        @return: an iterator of objects
+        """
+        return self.paginate('issues', page_size=page_size,
+                             prefetch=prefetch, **kwargs)
 
     def issue_count(self, raw: bool = False):
         """
@@ -388,22 +576,32 @@ class ThothClient0_9_0(ThothClient):
         return self._api_request("issueCount", parameters,
                                  return_raw=raw)
 
-    def language(self, language_id: str, raw: bool = False):
+    def language(self, language_id: str, raw: bool = False,
+                 fields: list = None, profile: str = None):
         """
         Returns a language by ID
         @param language_id: the ID to fetch
         @param raw: whether to return a python object or the raw result
+        @param fields: the fields to select instead of those in QUERIES,
+        or names prefixed with "-" to leave out
+        @param profile: a selection profile declared in QUERIES (e.g. ids,
+        summary or full)
         @return: either an object (default) or raw server response
         """
         parameters = {
-            'languageId': '"' + language_id + '"'
+            'languageId': language_id
         }
 
-        return self._api_request("language", parameters, return_raw=raw)
+        return self._api_request("language", parameters,
+                                 return_raw=raw, fields=fields,
+                                 profile=profile)
 
     def languages(self, limit: int = 100, offset: int = 0, order: str = None,
                   search: str = "", publishers: str = None, raw: bool = False,
-                  language_codes: str = "", language_relation: str = ""):
+                  language_codes: str = "", language_relation: str = "",
+                  fields: list = None, profile: str = None,
+                  with_count: bool = False,
+                  columnar: Union[bool, Sequence[str]] = False):
         """
         Return languages
         @param limit: the limit on the number of results to return
@@ -412,6 +610,14 @@ class ThothClient0_9_0(ThothClient):
         @param search: a search string
         @param publishers: a list of publishers by which to limit the result
         @param raw: whether to return a raw result
+        @param fields: the fields to select instead of those in QUERIES,
+        or names prefixed with "-" to leave out
+        @param profile: a selection profile declared in QUERIES (e.g. ids,
+        summary or full)
+        @param with_count: whether to also fetch the total number of results,
+        in the same request, and return a ThothPage with a total attribute
+        @param columnar: True, or a list of dotted field paths, to return
+        a dict of columns (see thothlibrary.columnar) instead of objects
         @param language_codes: the language code to query
         @param language_relation: the language relation to query (e.g. ORIGINAL)
         @return: an object or raw result
@@ -425,7 +631,23 @@ class ThothClient0_9_0(ThothClient):
         self._dictionary_append(parameters, 'languageRelation',
                                 language_relation)
 
-        return self._api_request("languages", parameters, return_raw=raw)
+        return self._api_request("languages", parameters,
+                                 return_raw=raw, fields=fields,
+                                 profile=profile, with_count=with_count,
+                                 columnar=columnar)
+
+    def iter_languages(self, page_size: int = 100, prefetch: bool = True,
+                       **kwargs):
+        """
+        Iterates over all languages, fetching them page by page
+        @param page_size: the number of results to fetch per request, or
+        None to adapt it to the endpoint
+        @param prefetch: whether to fetch the next page in the background
+        @param kwargs: the other arguments of languages (search, order...)
+        @return: an iterator of objects
+        """
+        return self.paginate('languages', page_size=page_size,
+                             prefetch=prefetch, **kwargs)
 
     def language_count(self, language_codes: str = "",
                        language_relation: str = "", raw: bool = False):
@@ -444,35 +666,51 @@ class ThothClient0_9_0(ThothClient):
 
         return self._api_request("languageCount", parameters, return_raw=raw)
 
-    def location(self, location_id: str, raw: bool = False):
+    def location(self, location_id: str, raw: bool = False,
+                 fields: list = None, profile: str = None):
         """
         Returns a location by ID
         @param location_id: the ID to fetch
         @param raw: whether to return a python object or the raw result
+        @param fields: the fields to select instead of those in QUERIES,
+        or names prefixed with "-" to leave out
+        @param profile: a selection profile declared in QUERIES (e.g. ids,
+        summary or full)
         @return: either an object (default) or raw server response
         """
         parameters = {
-            'locationId': '"' + location_id + '"'
+            'locationId': location_id
         }
 
-        return self._api_request("location", parameters, return_raw=raw)
+        return self._api_request("location", parameters,
+                                 return_raw=raw, fields=fields,
+                                 profile=profile)
 
-    def price(self, price_id: str, raw: bool = False):
+    def price(self, price_id: str, raw: bool = False, fields: list = None,
+              profile: str = None):
         """
         Returns a price by ID
         @param price_id: the ID to fetch
         @param raw: whether to return a python object or the raw result
+        @param fields: the fields to select instead of those in QUERIES,
+        or names prefixed with "-" to leave out
+        @param profile: a selection profile declared in QUERIES (e.g. ids,
+        summary or full)
         @return: either an object (default) or raw server response
         """
         parameters = {
-            'priceId': '"' + price_id + '"'
+            'priceId': price_id
         }
 
-        return self._api_request("price", parameters, return_raw=raw)
+        return self._api_request("price", parameters,
+                                 return_raw=raw, fields=fields,
+                                 profile=profile)
 
     def prices(self, limit: int = 100, offset: int = 0, order: str = None,
                publishers: str = None, currency_codes: str = None,
-               raw: bool = False):
+               raw: bool = False, fields: list = None, profile: str = None,
+               with_count: bool = False,
+               columnar: Union[bool, Sequence[str]] = False):
         """
         Returns prices
         @param limit: the maximum number of results to return
@@ -481,6 +719,14 @@ class ThothClient0_9_0(ThothClient):
         @param publishers: a list of publishers to limit by
         @param currency_codes: the currency code (e.g. GBP)
         @param raw: whether to return a python object or the raw server result
+        @param fields: the fields to select instead of those in QUERIES,
+        or names prefixed with "-" to leave out
+        @param profile: a selection profile declared in QUERIES (e.g. ids,
+        summary or full)
+        @param with_count: whether to also fetch the total number of results,
+        in the same request, and return a ThothPage with a total attribute
+        @param columnar: True, or a list of dotted field paths, to return
+        a dict of columns (see thothlibrary.columnar) instead of objects
         @return: either an object (default) or raw server response
         """
         if order is None:
@@ -494,7 +740,23 @@ class ThothClient0_9_0(ThothClient):
         self._dictionary_append(parameters, 'publishers', publishers)
         self._dictionary_append(parameters, 'currencyCodes', currency_codes)
 
-        return self._api_request("prices", parameters, return_raw=raw)
+        return self._api_request("prices", parameters,
+                                 return_raw=raw, fields=fields,
+                                 profile=profile, with_count=with_count,
+                                 columnar=columnar)
+
+    def iter_prices(self, page_size: int = 100, prefetch: bool = True,
+                    **kwargs):
+        """
+        Iterates over all prices, fetching them page by page
+        @param page_size: the number of results to fetch per request, or
+        None to adapt it to the endpoint
+        @param prefetch: whether to fetch the next page in the background
+        @param kwargs: the other arguments of prices (search, order...)
+        @return: an iterator of objects
+        """
+        return self.paginate('prices', page_size=page_size,
+                             prefetch=prefetch, **kwargs)
 
     def price_count(self, currency_codes: str = None, raw: bool = False):
         """
@@ -509,23 +771,32 @@ class ThothClient0_9_0(ThothClient):
 
         return self._api_request("priceCount", parameters, return_raw=raw)
 
-    def publication(self, publication_id: str, raw: bool = False):
+    def publication(self, publication_id: str, raw: bool = False,
+                    fields: list = None, profile: str = None):
         """
         Returns a publication by ID
         @param publication_id: the ID to fetch
         @param raw: whether to return a python object or the raw result
+        @param fields: the fields to select instead of those in QUERIES,
+        or names prefixed with "-" to leave out
+        @param profile: a selection profile declared in QUERIES (e.g. ids,
+        summary or full)
         @return: either an object (default) or raw server response
         """
         parameters = {
-            'publicationId': '"' + publication_id + '"'
+            'publicationId': publication_id
         }
 
-        return self._api_request("publication", parameters, return_raw=raw)
+        return self._api_request("publication", parameters,
+                                 return_raw=raw, fields=fields,
+                                 profile=profile)
 
     def publications(self, limit: int = 100, offset: int = 0,
                      search: str = "", order: str = None,
                      publishers: str = None, publication_types: str = None,
-                     raw: bool = False):
+                     raw: bool = False, fields: list = None,
+                     profile: str = None, with_count: bool = False,
+                     columnar: Union[bool, Sequence[str]] = False):
         """
         Returns publications
         @param limit: the maximum number of results to return
@@ -535,6 +806,14 @@ class ThothClient0_9_0(ThothClient):
         @param search: a filter string to search
         @param publication_types: the work type (e.g. PAPERBACK)
         @param raw: whether to return a python object or the raw server result
+        @param fields: the fields to select instead of those in QUERIES,
+        or names prefixed with "-" to leave out
+        @param profile: a selection profile declared in QUERIES (e.g. ids,
+        summary or full)
+        @param with_count: whether to also fetch the total number of results,
+        in the same request, and return a ThothPage with a total attribute
+        @param columnar: True, or a list of dotted field paths, to return
+        a dict of columns (see thothlibrary.columnar) instead of objects
         @return: either an object (default) or raw server response
         """
         parameters = self._order_limit_filter_offset_setup(order=order,
@@ -545,7 +824,23 @@ class ThothClient0_9_0(ThothClient):
         self._dictionary_append(parameters, 'publicationTypes',
                                 publication_types)
 
-        return self._api_request("publications", parameters, return_raw=raw)
+        return self._api_request("publications", parameters,
+                                 return_raw=raw, fields=fields,
+                                 profile=profile, with_count=with_count,
+                                 columnar=columnar)
+
+    def iter_publications(self, page_size: int = 100, prefetch: bool = True,
+                          **kwargs):
+        """
+        Iterates over all publications, fetching them page by page
+        @param page_size: the number of results to fetch per request, or
+        None to adapt it to the endpoint
+        @param prefetch: whether to fetch the next page in the background
+        @param kwargs: the other arguments of publications (search, order...)
+        @return: an iterator of objects
+        """
+        return self.paginate('publications', page_size=page_size,
+                             prefetch=prefetch, **kwargs)
 
     def publication_count(self, search: str = "", publishers: str = None,
                           publication_types: str = None, raw: bool = False):
@@ -559,9 +854,6 @@ class ThothClient0_9_0(ThothClient):
         """
         parameters = {}
 
-        if search and not search.startswith('"'):
-            search = '"{0}"'.format(search)
-
         self._dictionary_append(parameters, 'filter', search)
         self._dictionary_append(parameters, 'publishers', publishers)
         self._dictionary_append(parameters, 'publicationTypes',
@@ -570,22 +862,31 @@ class ThothClient0_9_0(ThothClient):
         return self._api_request("publicationCount", parameters,
                                  return_raw=raw)
 
-    def publisher(self, publisher_id: str, raw: bool = False):
+    def publisher(self, publisher_id: str, raw: bool = False,
+                  fields: list = None, profile: str = None):
         """
         Returns a publisher by ID
         @param publisher_id: the publisher
         @param raw: whether to return a python object or the raw result
+        @param fields: the fields to select instead of those in QUERIES,
+        or names prefixed with "-" to leave out
+        @param profile: a selection profile declared in QUERIES (e.g. ids,
+        summary or full)
         @return: either an object (default) or raw server response
         """
         parameters = {
-            'publisherId': '"' + publisher_id + '"'
+            'publisherId': publisher_id
         }
 
-        return self._api_request("publisher", parameters, return_raw=raw)
+        return self._api_request("publisher", parameters,
+                                 return_raw=raw, fields=fields,
+                                 profile=profile)
 
     def publishers(self, limit: int = 100, offset: int = 0, order: str = None,
                    search: str = "", publishers: str = None,
-                   raw: bool = False):
+                   raw: bool = False, fields: list = None,
+                   profile: str = None, with_count: bool = False,
+                   columnar: Union[bool, Sequence[str]] = False):
         """
         Return publishers
         @param limit: the limit on the number of results
@@ -594,6 +895,14 @@ class ThothClient0_9_0(ThothClient):
         @param search: a search string
         @param publishers: a list of publishers by which to limit the results
         @param raw: whether to return a raw result
+        @param fields: the fields to select instead of those in QUERIES,
+        or names prefixed with "-" to leave out
+        @param profile: a selection profile declared in QUERIES (e.g. ids,
+        summary or full)
+        @param with_count: whether to also fetch the total number of results,
+        in the same request, and return a ThothPage with a total attribute
+        @param columnar: True, or a list of dotted field paths, to return
+        a dict of columns (see thothlibrary.columnar) instead of objects
         @return: an object or raw result
         """
         parameters = self._order_limit_filter_offset_setup(order=order,
@@ -602,7 +911,23 @@ class ThothClient0_9_0(ThothClient):
                                                            offset=offset)
         self._dictionary_append(parameters, 'publishers', publishers)
 
-        return self._api_request("publishers", parameters, return_raw=raw)
+        return self._api_request("publishers", parameters,
+                                 return_raw=raw, fields=fields,
+                                 profile=profile, with_count=with_count,
+                                 columnar=columnar)
+
+    def iter_publishers(self, page_size: int = 100, prefetch: bool = True,
+                        **kwargs):
+        """
+        Iterates over all publishers, fetching them page by page
+        @param page_size: the number of results to fetch per request, or
+        None to adapt it to the endpoint
+        @param prefetch: whether to fetch the next page in the background
+        @param kwargs: the other arguments of publishers (search, order...)
+        @return: an iterator of objects
+        """
+        return self.paginate('publishers', page_size=page_size,
+                             prefetch=prefetch, **kwargs)
 
     def publisher_count(self, search: str = "", publishers: str = None,
                         raw: bool = False):
@@ -615,30 +940,36 @@ class ThothClient0_9_0(ThothClient):
         """
         parameters = {}
 
-        if search and not search.startswith('"'):
-            search = '"{0}"'.format(search)
-
         self._dictionary_append(parameters, 'filter', search)
         self._dictionary_append(parameters, 'publishers', publishers)
 
         return self._api_request("publisherCount", parameters, return_raw=raw)
 
-    def reference(self, reference_id: str, raw: bool = False):
+    def reference(self, reference_id: str, raw: bool = False,
+                  fields: list = None, profile: str = None):
         """
         Returns a reference by ID
         @param reference_id: the ID to fetch
         @param raw: whether to return a python object or the raw result
+        @param fields: the fields to select instead of those in QUERIES,
+        or names prefixed with "-" to leave out
+        @param profile: a selection profile declared in QUERIES (e.g. ids,
+        summary or full)
         @return: either an object (default) or raw server response
         """
         parameters = {
-            'referenceId': '"' + reference_id + '"'
+            'referenceId': reference_id
         }
 
-        return self._api_request("reference", parameters, return_raw=raw)
+        return self._api_request("reference", parameters,
+                                 return_raw=raw, fields=fields,
+                                 profile=profile)
 
     def references(self, limit: int = 100, offset: int = 0, order: str = None,
                    search: str = "", publishers: str = None,
-                   raw: bool = False):
+                   raw: bool = False, fields: list = None,
+                   profile: str = None,
+                   columnar: Union[bool, Sequence[str]] = False):
         """
         Return references
         @param limit: the limit on the number of results
@@ -647,6 +978,12 @@ class ThothClient0_9_0(ThothClient):
         @param search: a search string
         @param publishers: a list of publishers by which to limit the results
         @param raw: whether to return a raw result
+        @param fields: the fields to select instead of those in QUERIES,
+        or names prefixed with "-" to leave out
+        @param profile: a selection profile declared in QUERIES (e.g. ids,
+        summary or full)
+        @param columnar: True, or a list of dotted field paths, to return
+        a dict of columns (see thothlibrary.columnar) instead of objects
         @return: an object or raw result
         """
         parameters = self._order_limit_filter_offset_setup(order=order,
@@ -655,24 +992,49 @@ class ThothClient0_9_0(ThothClient):
                                                            offset=offset)
         self._dictionary_append(parameters, 'publishers', publishers)
 
-        return self._api_request("references", parameters, return_raw=raw)
+        return self._api_request("references", parameters,
+                                 return_raw=raw, fields=fields,
+                                 profile=profile, columnar=columnar)
+
+    def iter_references(self, page_size: int = 100, prefetch: bool = True,
+                        **kwargs):
+        """
+        Iterates over all references, fetching them page by page
+        @param page_size: the number of results to fetch per request, or
+        None to adapt it to the endpoint
+        @param prefetch: whether to fetch the next page in the background
+        @param kwargs: the other arguments of references (search, order...)
+        @return: an iterator of objects
+        """
+        return self.paginate('references', page_size=page_size,
+                             prefetch=prefetch, **kwargs)
 
-    def series(self, series_id: str, raw: bool = False):
+    def series(self, series_id: str, raw: bool = False, fields: list = None,
+               profile: str = None):
         """
         Returns a series by ID
         @param series_id: the ID to fetch
         @param raw: whether to return a python object or the raw result
+        @param fields: the fields to select instead of those in QUERIES,
+        or names prefixed with "-" to leave out
+        @param profile: a selection profile declared in QUERIES (e.g. ids,
+        summary or full)
         @return: either an object (default) or raw server response
         """
         parameters = {
-            'seriesId': '"' + series_id + '"'
+            'seriesId': series_id
         }
 
-        return self._api_request("series", parameters, return_raw=raw)
+        return self._api_request("series", parameters,
+                                 return_raw=raw, fields=fields,
+                                 profile=profile)
 
     def serieses(self, limit: int = 100, offset: int = 0, order: str = None,
                  search: str = "", publishers: str = None,
-                 series_types: str = "", raw: bool = False):
+                 series_types: str = "", raw: bool = False,
+                 fields: list = None, profile: str = None,
+                 with_count: bool = False,
+                 columnar: Union[bool, Sequence[str]] = False):
         """
         Return serieses
         @param limit: the limit on the number of results to retrieve
@@ -682,6 +1044,14 @@ class ThothClient0_9_0(ThothClient):
         @param publishers: a list of publishers by which to limit results
         @param series_types: the series type (e.g. BOOK_SERIES)
         @param raw: whether to return a raw result
+        @param fields: the fields to select instead of those in QUERIES,
+        or names prefixed with "-" to leave out
+        @param profile: a selection profile declared in QUERIES (e.g. ids,
+        summary or full)
+        @param with_count: whether to also fetch the total number of results,
+        in the same request, and return a ThothPage with a total attribute
+        @param columnar: True, or a list of dotted field paths, to return
+        a dict of columns (see thothlibrary.columnar) instead of objects
         @return: an object or raw result
         """
         parameters = self._order_limit_filter_offset_setup(order=order,
@@ -691,7 +1061,23 @@ class ThothClient0_9_0(ThothClient):
         self._dictionary_append(parameters, 'publishers', publishers)
         self._dictionary_append(parameters, 'seriesTypes', series_types)
 
-        return self._api_request("serieses", parameters, return_raw=raw)
+        return self._api_request("serieses", parameters,
+                                 return_raw=raw, fields=fields,
+                                 profile=profile, with_count=with_count,
+                                 columnar=columnar)
+
+    def iter_serieses(self, page_size: int = 100, prefetch: bool = True,
+                      **kwargs):
+        """
+        Iterates over all series, fetching them page by page
+        @param page_size: the number of results to fetch per request, or
+        None to adapt it to the endpoint
+        @param prefetch: whether to fetch the next page in the background
+        @param kwargs: the other arguments of serieses (search, order...)
+        @return: an iterator of objects
+        """
+        return self.paginate('serieses', page_size=page_size,
+                             prefetch=prefetch, **kwargs)
 
     def series_count(self, search: str = "", publishers: str = None,
                      series_types: str = None, raw: bool = False):
@@ -705,9 +1091,6 @@ class ThothClient0_9_0(ThothClient):
         """
         parameters = {}
 
-        if search and not search.startswith('"'):
-            search = '"{0}"'.format(search)
-
         self._dictionary_append(parameters, 'filter', search)
         self._dictionary_append(parameters, 'publishers', publishers)
         self._dictionary_append(parameters, 'seriesTypes',
@@ -715,22 +1098,31 @@ class ThothClient0_9_0(ThothClient):
 
         return self._api_request("seriesCount", parameters, return_raw=raw)
 
-    def subject(self, subject_id: str, raw: bool = False):
+    def subject(self, subject_id: str, raw: bool = False, fields: list = None,
+                profile: str = None):
         """
         Returns a subject by ID
         @param subject_id: the ID to fetch
         @param raw: whether to return a python object or the raw result
+        @param fields: the fields to select instead of those in QUERIES,
+        or names prefixed with "-" to leave out
+        @param profile: a selection profile declared in QUERIES (e.g. ids,
+        summary or full)
         @return: either an object (default) or raw server response
         """
         parameters = {
-            'subjectId': '"' + subject_id + '"'
+            'subjectId': subject_id
         }
 
-        return self._api_request("subject", parameters, return_raw=raw)
+        return self._api_request("subject", parameters,
+                                 return_raw=raw, fields=fields,
+                                 profile=profile)
 
     def subjects(self, limit: int = 100, offset: int = 0, order: str = None,
                  search: str = "", publishers: str = None, raw: bool = False,
-                 subject_types: str = ""):
+                 subject_types: str = "", fields: list = None,
+                 profile: str = None, with_count: bool = False,
+                 columnar: Union[bool, Sequence[str]] = False):
         """
         Return subjects
         @param limit: a limit on the number of results
@@ -739,6 +1131,14 @@ class ThothClient0_9_0(ThothClient):
         @param search: a search string
         @param publishers: a list of publishers
         @param raw: whether to return a raw result
+        @param fields: the fields to select instead of those in QUERIES,
+        or names prefixed with "-" to leave out
+        @param profile: a selection profile declared in QUERIES (e.g. ids,
+        summary or full)
+        @param with_count: whether to also fetch the total number of results,
+        in the same request, and return a ThothPage with a total attribute
+        @param columnar: True, or a list of dotted field paths, to return
+        a dict of columns (see thothlibrary.columnar) instead of objects
         @param subject_types: the subject type (e.g. BIC)
         @return: subjects
         """
@@ -749,7 +1149,23 @@ class ThothClient0_9_0(ThothClient):
         self._dictionary_append(parameters, 'publishers', publishers)
         self._dictionary_append(parameters, 'subjectTypes', subject_types)
 
-        return self._api_request("subjects", parameters, return_raw=raw)
+        return self._api_request("subjects", parameters,
+                                 return_raw=raw, fields=fields,
+                                 profile=profile, with_count=with_count,
+                                 columnar=columnar)
+
+    def iter_subjects(self, page_size: int = 100, prefetch: bool = True,
+                      **kwargs):
+        """
+        Iterates over all subjects, fetching them page by page
+        @param page_size: the number of results to fetch per request, or
+        None to adapt it to the endpoint
+        @param prefetch: whether to fetch the next page in the background
+        @param kwargs: the other arguments of subjects (search, order...)
+        @return: an iterator of objects
+        """
+        return self.paginate('subjects', page_size=page_size,
+                             prefetch=prefetch, **kwargs)
 
     def subject_count(self, subject_types: str = "", search: str = "",
                       raw: bool = False):
@@ -762,22 +1178,20 @@ class ThothClient0_9_0(ThothClient):
         """
         parameters = {}
 
-        if search and not search.startswith('"'):
-            search = '"{0}"'.format(search)
+        self._dictionary_append(parameters, 'subjectTypes', subject_types)
 
         # there is a bug in this version of Thoth. Filter is REQUIRED.
-        if not search:
-            search = '""'
-
-        self._dictionary_append(parameters, 'subjectTypes', subject_types)
-        self._dictionary_append(parameters, 'filter', search)
+        parameters['filter'] = search or ""
 
         return self._api_request("subjectCount", parameters, return_raw=raw)
 
     def works(self, limit: int = 100, offset: int = 0, search: str = "",
               order: str = None, publishers: str = None, work_types: str = None,
               work_status: str = None, work_statuses: str = None,
-              updated_at_with_relations: str = None, raw: bool = False):
+              updated_at_with_relations: str = None, raw: bool = False,
+              fields: list = None, profile: str = None,
+              with_count: bool = False,
+              columnar: Union[bool, Sequence[str]] = False):
         """
         Returns works
         @param limit: the maximum number of results to return
@@ -790,6 +1204,14 @@ class ThothClient0_9_0(ThothClient):
         @param work_statuses: the work statuses (e.g. [ACTIVE])
         @param updated_at_with_relations: timestamp and choice of greater/less than, for limiting results by last update time
         @param raw: whether to return a python object or the raw server result
+        @param fields: the fields to select instead of those in QUERIES,
+        or names prefixed with "-" to leave out
+        @param profile: a selection profile declared in QUERIES (e.g. ids,
+        summary or full)
+        @param with_count: whether to also fetch the total number of results,
+        in the same request, and return a ThothPage with a total attribute
+        @param columnar: True, or a list of dotted field paths, to return
+        a dict of columns (see thothlibrary.columnar) instead of objects
         @return: either an object (default) or raw server response
         """
         if order is None:
@@ -799,9 +1221,6 @@ class ThothClient0_9_0(ThothClient):
             "limit": limit,
         }
 
-        if search and not search.startswith('"'):
-            search = '"{0}"'.format(search)
-
         self._dictionary_append(parameters, 'filter', search)
         self._dictionary_append(parameters, 'order', order)
         self._dictionary_append(parameters, 'publishers', publishers)
@@ -811,33 +1230,101 @@ class ThothClient0_9_0(ThothClient):
         self._dictionary_append(
             parameters, 'updatedAtWithRelations', updated_at_with_relations)
 
-        return self._api_request("works", parameters, return_raw=raw)
-
-    def work_by_doi(self, doi: str, raw: bool = False):
+        return self._api_request("works", parameters,
+                                 return_raw=raw, fields=fields,
+                                 profile=profile, with_count=with_count,
+                                 columnar=columnar)
+
+    def iter_works(self, page_size: int = 100, prefetch: bool = True,
+                   keyset: bool = False, **kwargs):
+        """
+        Iterates over all works, fetching them page by page
+        @param page_size: the number of results to fetch per request, or
+        None to adapt it to the endpoint
+        @param prefetch: whether to fetch the next page in the background
+        @param keyset: whether to page in order of updatedAtWithRelations
+        rather than by offset, which keeps deep pages fast and stable
+        @param kwargs: the other arguments of works (search, order...), and
+        since (a timestamp) in keyset mode
+        @return: an iterator of objects
+        """
+        if keyset:
+            return self.paginate_keyset('works', page_size=page_size,
+                                        prefetch=prefetch, **kwargs)
+        return self.paginate('works', page_size=page_size,
+                             prefetch=prefetch, **kwargs)
+
+    def changes_since(self, timestamp: str = None, store=None,
+                      name: str = None, endpoint: str = 'works',
+                      page_size: int = 100, prefetch: bool = True, **kwargs):
+        """
+        Returns a ChangeFeed of the works (or books, or bookIds) updated at
+        or after a timestamp, read by keyset pagination on
+        updatedAtWithRelations, so that a sync costs time in proportion to
+        the records changed rather than to the catalogue
+        @param timestamp: the watermark to start from; by default the one
+        saved in store, or the beginning of the catalogue
+        @param store: a FileWatermarkStore or SQLiteWatermarkStore that the
+        feed's commit() saves the new watermark to
+        @param name: the name of the watermark in the store (default endpoint)
+        @param endpoint: works, books or bookIds
+        @param page_size: the number of results to fetch per request, or
+        None to adapt it to the endpoint
+        @param prefetch: whether to fetch the next page in the background
+        @param kwargs: the other filters of the endpoint (publishers...)
+        @return: a ChangeFeed of objects
+        """
+        if endpoint not in ('works', 'books', 'bookIds'):
+            raise ValueError('Changes are only tracked for works, books and '
+                             'bookIds')
+        name = name or endpoint
+        if timestamp is None and store is not None:
+            timestamp = store.load(name)
+
+        paginator = self.paginate_keyset(endpoint, page_size=page_size,
+                                         prefetch=prefetch, since=timestamp,
+                                         **kwargs)
+        return ChangeFeed(paginator, since=timestamp, store=store, name=name)
+
+    def work_by_doi(self, doi: str, raw: bool = False, fields: list = None,
+                    profile: str = None):
         """
         Returns a work by DOI
         @param doi: the DOI to fetch
         @param raw: whether to return a python object or the raw result
+        @param fields: the fields to select instead of those in QUERIES,
+        or names prefixed with "-" to leave out
+        @param profile: a selection profile declared in QUERIES (e.g. ids,
+        summary or full)
         @return: either an object (default) or raw server response
         """
         parameters = {
-            'doi': '"' + doi + '"'
+            'doi': doi
         }
 
-        return self._api_request("workByDoi", parameters, return_raw=raw)
+        return self._api_request("workByDoi", parameters,
+                                 return_raw=raw, fields=fields,
+                                 profile=profile)
 
-    def work_by_id(self, work_id: str, raw: bool = False):
+    def work_by_id(self, work_id: str, raw: bool = False, fields: list = None,
+                   profile: str = None):
         """
         Returns a work by ID
         @param work_id: the ID to fetch
         @param raw: whether to return a python object or the raw result
+        @param fields: the fields to select instead of those in QUERIES,
+        or names prefixed with "-" to leave out
+        @param profile: a selection profile declared in QUERIES (e.g. ids,
+        summary or full)
         @return: either an object (default) or raw server response
         """
         parameters = {
-            'workId': '"' + work_id + '"'
+            'workId': work_id
         }
 
-        return self._api_request("work", parameters, return_raw=raw)
+        return self._api_request("work", parameters,
+                                 return_raw=raw, fields=fields,
+                                 profile=profile)
 
     def work_count(self, search: str = "", publishers: str = None, work_types: str = None,
                    work_status: str = None, work_statuses: str = None,
@@ -855,9 +1342,6 @@ class ThothClient0_9_0(ThothClient):
         """
         parameters = {}
 
-        if search and not search.startswith('"'):
-            search = '"{0}"'.format(search)
-
         self._dictionary_append(parameters, 'filter', search)
         self._dictionary_append(parameters, 'publishers', publishers)
         self._dictionary_append(parameters, 'workTypes', work_types)
@@ -870,7 +1354,10 @@ class ThothClient0_9_0(ThothClient):
 
     def books(self, limit: int = 100, offset: int = 0, search: str = "",
               order: str = None, publishers: str = None, work_status: str = None,
-              work_statuses: str = None, updated_at_with_relations: str = None, raw: bool = False):
+              work_statuses: str = None, updated_at_with_relations: str = None, raw: bool = False,
+              fields: list = None, profile: str = None,
+              with_count: bool = False,
+              columnar: Union[bool, Sequence[str]] = False):
         """
         Returns books
         @param limit: the maximum number of results to return
@@ -882,6 +1369,14 @@ class ThothClient0_9_0(ThothClient):
         @param work_statuses: the work statuses (e.g. [ACTIVE])
         @param updated_at_with_relations: timestamp and choice of greater/less than, for limiting results by last update time
         @param raw: whether to return a python object or the raw server result
+        @param fields: the fields to select instead of those in QUERIES,
+        or names prefixed with "-" to leave out
+        @param profile: a selection profile declared in QUERIES (e.g. ids,
+        summary or full)
+        @param with_count: whether to also fetch the total number of results,
+        in the same request, and return a ThothPage with a total attribute
+        @param columnar: True, or a list of dotted field paths, to return
+        a dict of columns (see thothlibrary.columnar) instead of objects
         @return: either an object (default) or raw server response
         """
         if order is None:
@@ -891,9 +1386,6 @@ class ThothClient0_9_0(ThothClient):
             "limit": limit,
         }
 
-        if search and not search.startswith('"'):
-            search = '"{0}"'.format(search)
-
         self._dictionary_append(parameters, 'filter', search)
         self._dictionary_append(parameters, 'order', order)
         self._dictionary_append(parameters, 'publishers', publishers)
@@ -902,11 +1394,36 @@ class ThothClient0_9_0(ThothClient):
         self._dictionary_append(
             parameters, 'updatedAtWithRelations', updated_at_with_relations)
 
-        return self._api_request("books", parameters, return_raw=raw)
+        return self._api_request("books", parameters,
+                                 return_raw=raw, fields=fields,
+                                 profile=profile, with_count=with_count,
+                                 columnar=columnar)
+
+    def iter_books(self, page_size: int = 100, prefetch: bool = True,
+                   keyset: bool = False, **kwargs):
+        """
+        Iterates over all books, fetching them page by page
+        @param page_size: the number of results to fetch per request, or
+        None to adapt it to the endpoint
+        @param prefetch: whether to fetch the next page in the background
+        @param keyset: whether to page in order of updatedAtWithRelations
+        rather than by offset, which keeps deep pages fast and stable
+        @param kwargs: the other arguments of books (search, order...), and
+        since (a timestamp) in keyset mode
+        @return: an iterator of objects
+        """
+        if keyset:
+            return self.paginate_keyset('books', page_size=page_size,
+                                        prefetch=prefetch, **kwargs)
+        return self.paginate('books', page_size=page_size,
+                             prefetch=prefetch, **kwargs)
 
     def bookIds(self, limit: int = 100, offset: int = 0, search: str = "",
                 order: str = None, publishers: str = None, work_status: str = None,
-                work_statuses: str = None, updated_at_with_relations: str = None, raw: bool = False):
+                work_statuses: str = None, updated_at_with_relations: str = None, raw: bool = False,
+                fields: list = None, profile: str = None,
+                with_count: bool = False,
+                columnar: Union[bool, Sequence[str]] = False):
         """
         Returns books, in a minimal representation containing only workId
         @param limit: the maximum number of results to return
@@ -918,6 +1435,14 @@ class ThothClient0_9_0(ThothClient):
         @param work_statuses: the work statuses (e.g. [ACTIVE])
         @param updated_at_with_relations: timestamp and choice of greater/less than, for limiting results by last update time
         @param raw: whether to return a python object or the raw server result
+        @param fields: the fields to select instead of those in QUERIES,
+        or names prefixed with "-" to leave out
+        @param profile: a selection profile declared in QUERIES (e.g. ids,
+        summary or full)
+        @param with_count: whether to also fetch the total number of results,
+        in the same request, and return a ThothPage with a total attribute
+        @param columnar: True, or a list of dotted field paths, to return
+        a dict of columns (see thothlibrary.columnar) instead of objects
         @return: either an object (default) or raw server response
         """
         if order is None:
@@ -927,9 +1452,6 @@ class ThothClient0_9_0(ThothClient):
             "limit": limit,
         }
 
-        if search and not search.startswith('"'):
-            search = '"{0}"'.format(search)
-
         self._dictionary_append(parameters, 'filter', search)
         self._dictionary_append(parameters, 'order', order)
         self._dictionary_append(parameters, 'publishers', publishers)
@@ -938,7 +1460,29 @@ class ThothClient0_9_0(ThothClient):
         self._dictionary_append(
             parameters, 'updatedAtWithRelations', updated_at_with_relations)
 
-        return self._api_request("bookIds", parameters, return_raw=raw)
+        return self._api_request("bookIds", parameters,
+                                 return_raw=raw, fields=fields,
+                                 profile=profile, with_count=with_count,
+                                 columnar=columnar)
+
+    def iter_book_ids(self, page_size: int = 100, prefetch: bool = True,
+                      keyset: bool = False, **kwargs):
+        """
+        Iterates over all books as workIds, fetching them page by page
+        @param page_size: the number of results to fetch per request, or
+        None to adapt it to the endpoint
+        @param prefetch: whether to fetch the next page in the background
+        @param keyset: whether to page in order of updatedAtWithRelations
+        rather than by offset, which keeps deep pages fast and stable
+        @param kwargs: the other arguments of bookIds (search, order...), and
+        since (a timestamp) in keyset mode
+        @return: an iterator of objects
+        """
+        if keyset:
+            return self.paginate_keyset('bookIds', page_size=page_size,
+                                        prefetch=prefetch, **kwargs)
+        return self.paginate('bookIds', page_size=page_size,
+                             prefetch=prefetch, **kwargs)
 
     def book_count(self, search: str = "", publishers: str = None, work_status: str = None,
                    work_statuses: str = None, updated_at_with_relations: str = None, raw: bool = False):
@@ -954,9 +1498,6 @@ class ThothClient0_9_0(ThothClient):
         """
         parameters = {}
 
-        if search and not search.startswith('"'):
-            search = '"{0}"'.format(search)
-
         self._dictionary_append(parameters, 'filter', search)
         self._dictionary_append(parameters, 'publishers', publishers)
         self._dictionary_append(parameters, 'workStatus', work_status)
@@ -4,6 +4,7 @@ This program is free software; you may redistribute and/or modify
 it under the terms of the Apache License v2.0.
 """
 import collections
+import functools
 
 from munch import Munch
 from datetime import datetime
@@ -11,13 +12,12 @@ from datetime import datetime
 
 def _munch_repr(obj):
     """
-    This is a hacky munch context switcher. It passes the original __repr__
-    pointer back
+    Returns the plain representation of an object, which formatters fall
+    back to for objects they can not format
     @param obj: the object to represent
-    @return: the original munch representation
+    @return: the munch representation
     """
-    Munch.__repr__ = munch_local
-    return obj.__repr__()
+    return Munch.__repr__(obj)
 
 
 def _author_parser(obj):
@@ -69,8 +69,8 @@ def _price_parser(prices):
 
 
 # these are formatting statements for the endpoints
-# they are injected to replace the default dictionary (Munch) __repr__ and
-# __str__ methods. They let us create nice-looking string representations
+# they become the __str__ methods of each endpoint's Munch subclass (see
+# munch_types below). They let us create nice-looking string representations
 # of objects, such as books
 
 def _generic_formatter(format_object, type_name, output):
@@ -87,6 +87,24 @@ def _generic_formatter(format_object, type_name, output):
         return f"{_munch_repr(format_object)}"
 
 
+def _safe_formatter(formatter):
+    """
+    Wraps a formatter so that objects fetched with only some of their fields
+    (see the fields argument of the endpoints) fall back to the plain munch
+    representation rather than failing on a missing field
+    @param formatter: the formatter to wrap
+    @return: the wrapped formatter
+    """
+    @functools.wraps(formatter)
+    def safe_formatter(format_object):
+        try:
+            return formatter(format_object)
+        except (AttributeError, KeyError, TypeError, ValueError):
+            return f"{_munch_repr(format_object)}"
+    return safe_formatter
+
+
+@_safe_formatter
 def _contribution_formatter(contribution):
     """
     A formatting string for contributions
@@ -100,6 +118,7 @@ def _contribution_formatter(contribution):
     return _generic_formatter(contribution, 'Contribution', format_str)
 
 
+@_safe_formatter
 def _contributor_formatter(contributor):
     """
     A formatting string for contributors
@@ -112,6 +131,7 @@ def _contributor_formatter(contributor):
     return _generic_formatter(contributor, 'Contributor', format_str)
 
 
+@_safe_formatter
 def _institution_formatter(institution):
     """
     A formatting string for funders
@@ -124,6 +144,7 @@ def _institution_formatter(institution):
     return _generic_formatter(institution, 'Institution', format_str)
 
 
+@_safe_formatter
 def _funding_formatter(funding):
     """
     A formatting string for fundings
@@ -136,6 +157,7 @@ def _funding_formatter(funding):
     return _generic_formatter(funding, 'Funding', format_str)
 
 
+@_safe_formatter
 def _imprint_formatter(imprint):
     """
     A formatting string for imprints
@@ -148,6 +170,7 @@ def _imprint_formatter(imprint):
     return _generic_formatter(imprint, 'Imprint', format_str)
 
 
+@_safe_formatter
 def _issue_formatter(issues):
     """
     A formatting string for issues
@@ -161,6 +184,7 @@ def _issue_formatter(issues):
     return _generic_formatter(issues, 'Issue', format_str)
 
 
+@_safe_formatter
 def _language_formatter(language):
     """
     A formatting string for languages
@@ -174,6 +198,7 @@ def _language_formatter(language):
     return _generic_formatter(language, 'Language', format_str)
 
 
+@_safe_formatter
 def _price_formatter(price):
     """
     A formatting string for prices
@@ -188,6 +213,7 @@ def _price_formatter(price):
     return _generic_formatter(price, 'Price', format_str)
 
 
+@_safe_formatter
 def _publication_formatter(publication):
     """
     A formatting string for publications
@@ -205,6 +231,7 @@ def _publication_formatter(publication):
     return _generic_formatter(publication, 'Publication', format_str)
 
 
+@_safe_formatter
 def _publisher_formatter(publisher):
     """
     A formatting string for publishers
@@ -215,6 +242,7 @@ def _publisher_formatter(publisher):
     return _generic_formatter(publisher, 'Publisher', format_str)
 
 
+@_safe_formatter
 def _series_formatter(series):
     """
     A formatting string for series
@@ -227,6 +255,7 @@ def _series_formatter(series):
     return _generic_formatter(series, 'Series', format_str)
 
 
+@_safe_formatter
 def _subject_formatter(subject):
     """
     A formatting string for subjects
@@ -241,6 +270,7 @@ def _subject_formatter(subject):
     return _generic_formatter(subject, 'Subject', format_str)
 
 
+@_safe_formatter
 def _work_formatter(work):
     """
     A formatting string for works
@@ -286,9 +316,43 @@ default_fields = {
     "works": _work_formatter,
 }
 
-# this stores the original function pointer of Munch.__repr__ so that we can
-# re-inject it above in "_munch_repr"
-munch_local = Munch.__repr__
+_munch_types = {}
+
+
+def _munch_type(name, formatter):
+    """
+    Creates a Munch subclass whose __str__ and __repr__ are a formatter, so
+    that each endpoint's objects (and lists of them) format themselves
+    without Munch itself being changed
+    @param name: the name of the class
+    @param formatter: the formatting function
+    @return: the class
+    """
+    munch_type = type(name, (Munch,), {'__str__': formatter,
+                                       '__repr__': formatter,
+                                       '__module__': __name__})
+    _munch_types[formatter] = munch_type
+    return munch_type
+
+
+# the classes are module attributes so that their objects can be pickled
+ContributionMunch = _munch_type('ContributionMunch', _contribution_formatter)
+ContributorMunch = _munch_type('ContributorMunch', _contributor_formatter)
+FundingMunch = _munch_type('FundingMunch', _funding_formatter)
+ImprintMunch = _munch_type('ImprintMunch', _imprint_formatter)
+InstitutionMunch = _munch_type('InstitutionMunch', _institution_formatter)
+IssueMunch = _munch_type('IssueMunch', _issue_formatter)
+LanguageMunch = _munch_type('LanguageMunch', _language_formatter)
+PriceMunch = _munch_type('PriceMunch', _price_formatter)
+PublicationMunch = _munch_type('PublicationMunch', _publication_formatter)
+PublisherMunch = _munch_type('PublisherMunch', _publisher_formatter)
+SeriesMunch = _munch_type('SeriesMunch', _series_formatter)
+SubjectMunch = _munch_type('SubjectMunch', _subject_formatter)
+WorkMunch = _munch_type('WorkMunch', _work_formatter)
+
+# the Munch subclass that the objects of each endpoint are built as
+munch_types = {endpoint: _munch_types[formatter]
+               for endpoint, formatter in default_fields.items()}
 
 
 class StructureBuilder:
@@ -297,6 +361,7 @@ class StructureBuilder:
     def __init__(self, structure, data):
         self.structure = structure
         self.data = data
+        self.munch_type = munch_types.get(structure, Munch)
 
     def create_structure(self):
         """
@@ -316,14 +381,9 @@ class StructureBuilder:
 
     def _munch(self, item):
         """
-        Converts our JSON or dict object into an addressable object.
-        Also sets up the Munch __repr__ and __str__ functions.
+        Converts our JSON or dict object into an addressable object, built
+        as the endpoint's Munch subclass for its string representation
         @param item: the item to convert
         @return: a converted object with string representation
         """
-        x = Munch.fromDict(item)
-        if self.structure in default_fields.keys():
-            struct = default_fields[self.structure]
-            Munch.__repr__ = Munch.__str__
-            Munch.__str__ = struct
-        return x
+        return self.munch_type.fromDict(item)
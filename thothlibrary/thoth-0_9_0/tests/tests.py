@@ -3,12 +3,57 @@
 This program is free software; you may redistribute and/or modify
 it under the terms of the Apache License v2.0.
 """
+import asyncio
+import gzip
 import json
+import math
 import os
+import pickle
+import tempfile
+import threading
+import time
 import unittest
+from array import array
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
+import requests
 import requests_mock
-from thothlibrary import ThothClient
+from munch import Munch
+from thothlibrary import AsyncThothClient, ThothClient
+from thothlibrary.changefeed import FileWatermarkStore, SQLiteWatermarkStore
+from thothlibrary.columnar import to_columns
+from thothlibrary.deadline import deadline, timeout
+from thothlibrary.errors import DeadlineExceededError, GraphQLError
+from thothlibrary.errors import HTTPStatusError, ThothError, TransportError
+from thothlibrary.graphql import Transfer, TransferStats, aiohttp
+from thothlibrary.pagination import PageSizer
+from thothlibrary.query import DOCUMENT_CACHE_SIZE, ThothQuery
+from thothlibrary.query import _render_document
+from thothlibrary.query import field_name, parse_graphql_literal
+from thothlibrary.query import split_fields
+from thothlibrary.ratelimit import FileTokenBucket, TokenBucket
+from thothlibrary.retry import RetryPolicy, parse_retry_after
+from thothlibrary.singleflight import SingleFlight
+from thothlibrary.streaming import iter_json_array
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """A local GraphQL server that answers every POST with a fixture"""
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    body = b''
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, *args):
+        pass
 
 
 class Thoth090Tests(unittest.TestCase):
@@ -1145,6 +1190,1457 @@ class Thoth090Tests(unittest.TestCase):
             self._raw_tester(mock_response, thoth_client.books)
         return None
 
+    def test_session_shared_per_endpoint(self):
+        """
+        Tests that clients on the same endpoint share one pooled session
+        @return: None if successful
+        """
+        first = ThothClient(version=self.version, thoth_endpoint=self.endpoint)
+        second = ThothClient(version=self.version, thoth_endpoint=self.endpoint)
+        other = ThothClient(version=self.version,
+                            thoth_endpoint='https://api.other.thoth.pub')
+        small = ThothClient(version=self.version, thoth_endpoint=self.endpoint,
+                            pool_maxsize=2)
+
+        self.assertIs(first.client.session, second.client.session)
+        self.assertIsNot(first.client.session, other.client.session)
+        self.assertIsNot(first.client.session, small.client.session)
+        return None
+
+    def test_session_reused_across_requests(self):
+        """
+        Tests that requests go through the pooled session
+        @return: None if successful
+        """
+        with requests_mock.Mocker() as m:
+            mock_response, thoth_client = self._setup_mocker('works', m)
+            thoth_client.works()
+            thoth_client.works()
+
+            self.assertEqual(2, m.call_count)
+            self.assertEqual('keep-alive',
+                             m.request_history[0].headers['Connection'])
+        return None
+
+    def test_works_sends_variables(self):
+        """
+        Tests that parameters are sent as GraphQL variables
+        @return: None if successful
+        """
+        with requests_mock.Mocker() as m:
+            mock_response, thoth_client = self._setup_mocker('works', m)
+            thoth_client.works(limit=5, search='Open',
+                               order='{field: DOI, direction: ASC}',
+                               publishers='["85fd969a-a16c-480b-b641-'
+                                          'cb9adf979c3b"]',
+                               work_types='[MONOGRAPH, EDITED_BOOK]')
+            body = m.last_request.json()
+
+        self.assertEqual({'offset': 0, 'limit': 5, 'filter': 'Open',
+                          'order': {'field': 'DOI', 'direction': 'ASC'},
+                          'publishers': ['85fd969a-a16c-480b-b641-'
+                                         'cb9adf979c3b'],
+                          'workTypes': ['MONOGRAPH', 'EDITED_BOOK']},
+                         body['variables'])
+        self.assertIn('$publishers: [Uuid!]', body['query'])
+        self.assertNotIn('Open', body['query'])
+        return None
+
+    def test_query_document_is_constant(self):
+        """
+        Tests that the query text does not depend on parameter values
+        @return: None if successful
+        """
+        with requests_mock.Mocker() as m:
+            mock_response, thoth_client = self._setup_mocker('work', m)
+            thoth_client.work_by_id(work_id='e0f748b2-984f-45cc-8b9e-'
+                                            '13989c31dda4')
+            thoth_client.work_by_id(work_id='29e4f46b-851a-4d7b-bb41-'
+                                            'e6f305fc2b11')
+            first, second = [r.json() for r in m.request_history]
+
+        self.assertEqual(first['query'], second['query'])
+        self.assertEqual({'workId': '29e4f46b-851a-4d7b-bb41-e6f305fc2b11'},
+                         second['variables'])
+
+        # enum filters are variables too, so each filter value shares a
+        # document
+        with requests_mock.Mocker() as m:
+            m.register_uri('POST', '{}/graphql'.format(self.endpoint),
+                           json={'data': {'contributions': [],
+                                          'languages': []}})
+            thoth_client.contributions(contribution_type='AUTHOR')
+            thoth_client.contributions(contribution_type='EDITOR')
+            thoth_client.languages(language_relation='ORIGINAL')
+            thoth_client.languages(language_relation='TRANSLATED_INTO')
+            sent = [r.json() for r in m.request_history]
+
+        self.assertEqual(sent[0]['query'], sent[1]['query'])
+        self.assertEqual(sent[2]['query'], sent[3]['query'])
+        self.assertEqual('EDITOR', sent[1]['variables']['contributionType'])
+        self.assertEqual('TRANSLATED_INTO',
+                         sent[3]['variables']['languageRelation'])
+
+        # the cache of rendered documents is bounded
+        _render_document.cache_clear()
+        for index in range(DOCUMENT_CACHE_SIZE + 10):
+            ThothQuery('works', {}, thoth_client.QUERIES,
+                       fields=['workId', 'field{0}'.format(index)])
+        self.assertEqual(DOCUMENT_CACHE_SIZE,
+                         _render_document.cache_info().currsize)
+        return None
+
+    def test_batch(self):
+        """
+        Tests that batched calls are sent as one request and split back
+        @return: None if successful
+        """
+        works = self._read_fixture('works')['data']['works']
+        response = {'data': {'q0': 12, 'q1': 7, 'q2': works}}
+
+        with requests_mock.Mocker() as m:
+            m.register_uri('POST', '{}/graphql'.format(self.endpoint),
+                           json=response)
+            thoth_client = ThothClient(version=self.version,
+                                       thoth_endpoint=self.endpoint)
+
+            with thoth_client.batch() as batch:
+                work_count = batch.work_count(publishers='["85fd969a-a16c-'
+                                                         '480b-b641-cb9adf'
+                                                         '979c3b"]')
+                book_count = batch.book_count(search='Open')
+                found_works = batch.works(limit=2)
+
+            body = m.last_request.json()
+            self.assertEqual(1, m.call_count)
+
+        self.assertEqual(12, work_count.result())
+        self.assertEqual(7, book_count.result())
+        self._pickle_tester('works', found_works.result)
+        self.assertIn('q0: workCount(publishers: $q0_publishers)',
+                      body['query'])
+        self.assertEqual('Open', body['variables']['q1_filter'])
+        self.assertEqual(2, body['variables']['q2_limit'])
+        return None
+
+    def test_batch_errors(self):
+        """
+        Tests that a GraphQL error is only reported by the failing call
+        @return: None if successful
+        """
+        response = {'data': {'q0': None, 'q1': 7},
+                    'errors': [{'message': 'Invalid filter',
+                                'path': ['q0']}]}
+
+        with requests_mock.Mocker() as m:
+            m.register_uri('POST', '{}/graphql'.format(self.endpoint),
+                           json=response)
+            thoth_client = ThothClient(version=self.version,
+                                       thoth_endpoint=self.endpoint)
+
+            with thoth_client.batch() as batch:
+                failing = batch.work_count(search='[')
+                book_count = batch.book_count()
+
+        self.assertRaises(GraphQLError, failing.result)
+        self.assertEqual(7, book_count.result())
+        return None
+
+    def test_loader(self):
+        """
+        Tests that lookups are de-duplicated and sent in aliased chunks
+        @return: None if successful
+        """
+        work = self._read_fixture('work')['data']['work']
+
+        def respond(request, context):
+            aliases = request.json()['variables'].keys()
+            return {'data': {key[:-len('_workId')]: work for key in aliases}}
+
+        with requests_mock.Mocker() as m:
+            m.register_uri('POST', '{}/graphql'.format(self.endpoint),
+                           json=respond)
+            thoth_client = ThothClient(version=self.version,
+                                       thoth_endpoint=self.endpoint)
+
+            ids = ['e0f748b2-984f-45cc-8b9e-13989c31dda4',
+                   '29e4f46b-851a-4d7b-bb41-e6f305fc2b11',
+                   'e0f748b2-984f-45cc-8b9e-13989c31dda4',
+                   '1291208f-fc43-47a4-a8e6-e132477ad57b']
+
+            with thoth_client.loader(max_batch_size=2) as loader:
+                futures = [loader.work_by_id(work_id=work_id)
+                           for work_id in ids]
+
+            self.assertEqual(2, m.call_count)
+            self.assertEqual(2, loader.requests_sent)
+
+        self.assertIs(futures[0], futures[2])
+        for future in futures:
+            self._pickle_tester('work', future.result)
+        return None
+
+    def test_loader_resolves_on_demand(self):
+        """
+        Tests that asking for a result sends the queued lookups
+        @return: None if successful
+        """
+        with requests_mock.Mocker() as m:
+            m.register_uri('POST', '{}/graphql'.format(self.endpoint),
+                           json={'data': {'q0': {'workId': 'a'},
+                                          'q1': {'workId': 'b'}}})
+            thoth_client = ThothClient(version=self.version,
+                                       thoth_endpoint=self.endpoint)
+            loader = thoth_client.loader()
+            first = loader.work_by_id(work_id='a')
+            second = loader.work_by_doi(doi='https://doi.org/10.11647/b')
+
+            self.assertEqual('a', first.result().workId)
+            self.assertEqual('b', second.result().workId)
+            self.assertEqual(1, m.call_count)
+        return None
+
+    def test_loader_failures(self):
+        """
+        Tests that a failed chunk fails its lookups instead of leaving them
+        pending, and that failed lookups are not cached
+        @return: None if successful
+        """
+        with requests_mock.Mocker() as m:
+            thoth_client = ThothClient(version=self.version,
+                                       thoth_endpoint=self.endpoint,
+                                       retry_policy=RetryPolicy(max_retries=0))
+            loader = thoth_client.loader()
+
+            m.register_uri('POST', '{}/graphql'.format(self.endpoint),
+                           status_code=503, text='unavailable')
+            self.assertRaises(HTTPStatusError,
+                              loader.work_by_id(work_id='a').result, 5)
+
+            # a malformed response fails every lookup of the chunk
+            m.register_uri('POST', '{}/graphql'.format(self.endpoint),
+                           json=['not', 'an', 'object'])
+            first = loader.work_by_id(work_id='b')
+            second = loader.work_by_id(work_id='c')
+            loader.dispatch()
+            self.assertIsNotNone(first.exception(5))
+            self.assertIsNotNone(second.exception(5))
+
+            # once the server recovers, the failed lookups are sent again
+            m.register_uri('POST', '{}/graphql'.format(self.endpoint),
+                           json={'data': {'q0': {'workId': 'a'}}})
+            self.assertEqual('a', loader.work_by_id(work_id='a')
+                             .result(5).workId)
+        return None
+
+    def test_single_flight(self):
+        """
+        Tests that concurrent identical queries share one request
+        @return: None if successful
+        """
+        publisher = self._read_fixture('publisher')
+        callers = 5
+        arrived = threading.Event()
+
+        def respond(request, context):
+            # hold the first request until every caller is waiting on it
+            arrived.wait(5)
+            return publisher
+
+        with requests_mock.Mocker() as m:
+            m.register_uri('POST', '{}/graphql'.format(self.endpoint),
+                           json=respond)
+            thoth_client = ThothClient(version=self.version,
+                                       thoth_endpoint=self.endpoint,
+                                       single_flight=True)
+            flight = thoth_client.single_flight
+            results = [None] * callers
+
+            def fetch(index):
+                results[index] = thoth_client.publisher(
+                    publisher_id='85fd969a-a16c-480b-b641-cb9adf979c3b')
+
+            threads = [threading.Thread(target=fetch, args=(index,))
+                       for index in range(callers)]
+            for thread in threads:
+                thread.start()
+            while flight.stats()['calls'] < callers:
+                time.sleep(0.01)
+            arrived.set()
+            for thread in threads:
+                thread.join()
+
+            self.assertEqual(1, m.call_count)
+
+        self.assertEqual({'calls': callers, 'collapsed': callers - 1,
+                          'in_flight': 0}, flight.stats())
+        for result in results:
+            self._pickle_tester('publisher', lambda: result)
+
+        # a shared SingleFlight keeps clients with other credentials or
+        # endpoints apart
+        authed = ThothClient(version=self.version,
+                             thoth_endpoint=self.endpoint,
+                             single_flight=flight)
+        authed.client.inject_token('Bearer secret')
+        other = ThothClient(version=self.version,
+                            thoth_endpoint='https://other.example',
+                            single_flight=flight)
+        keys = {SingleFlight.key('{ works }', None, False,
+                                 *SingleFlight.credentials(client.client))
+                for client in (thoth_client, authed, other)}
+        self.assertEqual(3, len(keys))
+        self.assertNotIn('secret', repr(keys))
+        return None
+
+    def test_single_flight_leader_deadline(self):
+        """
+        Tests that followers are not failed by the leader's own deadline
+        @return: None if successful
+        """
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+        leader_errors = []
+        follower_results = []
+
+        def call():
+            calls.append(None)
+            if len(calls) == 1:
+                started.set()
+                release.wait(5)
+                raise DeadlineExceededError('key', 'Deadline exceeded')
+            return 'result'
+
+        def lead():
+            try:
+                flight.do('key', call)
+            except DeadlineExceededError as error:
+                leader_errors.append(error)
+
+        leader = threading.Thread(target=lead)
+        leader.start()
+        started.wait(5)
+        follower = threading.Thread(
+            target=lambda: follower_results.append(flight.do('key', call)))
+        follower.start()
+        while flight.stats()['collapsed'] < 1:
+            time.sleep(0.01)
+        release.set()
+        leader.join()
+        follower.join()
+
+        self.assertEqual(1, len(leader_errors))
+        self.assertEqual(['result'], follower_results)
+        self.assertEqual(2, len(calls))
+        return None
+
+    def test_retry_policy(self):
+        """
+        Tests that queries back off on 429/5xx and honour Retry-After
+        @return: None if successful
+        """
+        mock_response = json.dumps(self._read_fixture('publisher'))
+        delays = []
+        policy = RetryPolicy(max_retries=3, backoff=1, jitter=False)
+        policy.sleep = delays.append
+
+        with requests_mock.Mocker() as m:
+            m.register_uri('POST', '{}/graphql'.format(self.endpoint),
+                           [{'status_code': 503, 'text': 'unavailable'},
+                            {'status_code': 429, 'text': 'slow down',
+                             'headers': {'Retry-After': '7'}},
+                            {'text': mock_response}])
+            thoth_client = ThothClient(version=self.version,
+                                       thoth_endpoint=self.endpoint,
+                                       retry_policy=policy)
+            self._pickle_tester('publisher',
+                                lambda: thoth_client.publisher(
+                                    publisher_id='85fd969a-a16c-480b-b641-'
+                                                 'cb9adf979c3b'))
+            self.assertEqual(3, m.call_count)
+
+        self.assertEqual([1, 7.0], delays)
+        self.assertEqual({'calls': 1, 'retries': 2, 'failures': 0,
+                          'reasons': {'503': 1, '429': 1}}, policy.stats())
+
+        # a Retry-After beyond max_retry_after is cut down to it
+        stalled = HTTPStatusError('', 'slow down', 429,
+                                  {'Retry-After': '86400'})
+        self.assertEqual(120.0, policy.delay(1, stalled))
+        self.assertEqual(5, RetryPolicy(max_retry_after=5).delay(1, stalled))
+        return None
+
+    def test_retry_policy_mutations(self):
+        """
+        Tests that mutations are not retried when they may have been applied
+        @return: None if successful
+        """
+        policy = RetryPolicy(jitter=False)
+        policy.sleep = lambda delay: None
+
+        with requests_mock.Mocker() as m:
+            m.register_uri('POST', '{}/graphql'.format(self.endpoint),
+                           status_code=500, text='internal error')
+            thoth_client = ThothClient(version=self.version,
+                                       thoth_endpoint=self.endpoint,
+                                       retry_policy=policy)
+            with self.assertRaises(HTTPStatusError) as context:
+                thoth_client.mutation('createLanguage',
+                                      {'workId': 'a',
+                                       'languageCode': 'ENG',
+                                       'languageRelation': 'ORIGINAL',
+                                       'mainLanguage': 'true'})
+            self.assertEqual(500, context.exception.status)
+            self.assertEqual(1, m.call_count)
+
+            m.register_uri('POST', '{}/graphql'.format(self.endpoint),
+                           exc=requests.exceptions.ReadTimeout)
+            self.assertRaises(TransportError, thoth_client.works)
+            self.assertEqual(4, m.call_count)
+
+        self.assertEqual(2, policy.stats()['failures'])
+        self.assertEqual(27.0, parse_retry_after(
+            'Wed, 21 Oct 2015 07:28:00 GMT',
+            now=datetime(2015, 10, 21, 7, 27, 33, tzinfo=timezone.utc)))
+        return None
+
+    def test_rate_limiter(self):
+        """
+        Tests that requests are paced by a token bucket shared by clients
+        @return: None if successful
+        """
+        now = [0.0]
+        delays = []
+        bucket = TokenBucket(rate=10, burst=2)
+        bucket.clock = lambda: now[0]
+        bucket.sleep = delays.append
+
+        with requests_mock.Mocker() as m:
+            mock_response, thoth_client = self._setup_mocker('publisher', m)
+            other_client = ThothClient(version=self.version,
+                                       thoth_endpoint=self.endpoint,
+                                       rate_limiter=bucket)
+            thoth_client.client.rate_limiter = bucket
+
+            for client in (thoth_client, other_client, thoth_client):
+                client.publisher(publisher_id='85fd969a-a16c-480b-b641-'
+                                              'cb9adf979c3b')
+            now[0] = 1.0
+            other_client.publisher(publisher_id='85fd969a-a16c-480b-b641-'
+                                                'cb9adf979c3b')
+            self.assertEqual(4, m.call_count)
+
+            # a wait for a token that would outlast the deadline fails at
+            # once, without taking the token
+            other_client.publisher(publisher_id='85fd969a-a16c-480b-b641-'
+                                                'cb9adf979c3b')
+            with deadline(0.05):
+                self.assertRaises(DeadlineExceededError,
+                                  other_client.publisher,
+                                  publisher_id='85fd969a-a16c-480b-b641-'
+                                               'cb9adf979c3b')
+            self.assertEqual(5, m.call_count)
+
+        self.assertEqual(1, len(delays))
+        self.assertAlmostEqual(0.1, delays[0])
+        self.assertEqual(5, bucket.stats()['acquired'])
+        self.assertAlmostEqual(0.1, bucket.reserve(timeout=0.2))
+        return None
+
+    def test_file_rate_limiter(self):
+        """
+        Tests that file-backed buckets share their tokens
+        @return: None if successful
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'bucket')
+            first = FileTokenBucket(path, rate=1, burst=3)
+            second = FileTokenBucket(path, rate=1, burst=3)
+            first.clock = second.clock = lambda: 100.0
+
+            self.assertEqual(0, first.reserve())
+            self.assertEqual(0, second.reserve())
+            self.assertEqual(0, first.reserve())
+            self.assertEqual(1.0, second.reserve())
+        return None
+
+    def test_compression(self):
+        """
+        Tests gzipped requests and responses and their transfer statistics
+        @return: None if successful
+        """
+        mock_response = json.dumps(self._read_fixture('works')).encode('utf-8')
+        compressed = gzip.compress(mock_response)
+
+        with requests_mock.Mocker() as m:
+            m.register_uri('POST', '{}/graphql'.format(self.endpoint),
+                           content=compressed,
+                           headers={'Content-Encoding': 'gzip'})
+            thoth_client = ThothClient(version=self.version,
+                                       thoth_endpoint=self.endpoint,
+                                       compress_requests=True,
+                                       compress_threshold=64)
+            self._pickle_tester('works', thoth_client.works)
+
+            request = m.last_request
+            self.assertEqual('gzip', request.headers['Content-Encoding'])
+            self.assertIn('gzip', request.headers['Accept-Encoding'])
+            sent = gzip.decompress(request.body)
+            self.assertIn('works(', json.loads(sent)['query'])
+
+        transfer = thoth_client.client.transfers.last
+        self.assertEqual((len(sent), len(request.body),
+                          len(mock_response), len(compressed)), transfer)
+        self.assertEqual(1, thoth_client.client.transfers.totals()['requests'])
+
+        # concurrent coroutines each see the last transfer they made
+        transfers = TransferStats()
+
+        async def send(transfer):
+            transfers.record(transfer)
+            await asyncio.sleep(0)
+            return transfers.last
+
+        async def send_both():
+            return await asyncio.gather(send(Transfer(1, 1, 1, 1)),
+                                        send(Transfer(2, 2, 2, 2)))
+
+        self.assertEqual([Transfer(1, 1, 1, 1), Transfer(2, 2, 2, 2)],
+                         asyncio.run(send_both()))
+        return None
+
+    def test_deadline(self):
+        """
+        Tests that timeouts are sent and that deadlines bound retries
+        @return: None if successful
+        """
+        policy = RetryPolicy(backoff=10, jitter=False)
+        policy.sleep = lambda delay: None
+
+        with requests_mock.Mocker() as m:
+            mock_response, thoth_client = self._setup_mocker('publishers', m)
+            thoth_client.retry_policy = policy
+
+            thoth_client.publishers()
+            self.assertEqual((10.0, 60.0), m.last_request.timeout)
+
+            with timeout(3):
+                thoth_client.publishers()
+            self.assertEqual((3, 3), m.last_request.timeout)
+
+            with deadline(5):
+                thoth_client.publishers()
+                self.assertTrue(all(0 < part <= 5
+                                    for part in m.last_request.timeout))
+
+            m.register_uri('POST', '{}/graphql'.format(self.endpoint),
+                           status_code=503, text='unavailable')
+            with deadline(5):
+                # the first backoff would overrun the deadline
+                self.assertRaises(HTTPStatusError, thoth_client.publishers)
+            self.assertEqual(4, m.call_count)
+
+            with deadline(0):
+                self.assertRaises(DeadlineExceededError,
+                                  thoth_client.publishers)
+            self.assertEqual(4, m.call_count)
+        return None
+
+    def test_iter_works(self):
+        """
+        Tests that iterators walk every page and stop at the last one
+        @return: None if successful
+        """
+        work = self._read_fixture('work')['data']['work']
+        catalogue = [dict(work, workId=str(index)) for index in range(5)]
+
+        def respond(request, context):
+            variables = request.json()['variables']
+            offset, limit = variables['offset'], variables['limit']
+            return {'data': {'works': catalogue[offset:offset + limit]}}
+
+        with requests_mock.Mocker() as m:
+            m.register_uri('POST', '{}/graphql'.format(self.endpoint),
+                           json=respond)
+            thoth_client = ThothClient(version=self.version,
+                                       thoth_endpoint=self.endpoint)
+
+            for prefetch in (True, False):
+                works = thoth_client.iter_works(page_size=2, prefetch=prefetch,
+                                                publishers='["a"]')
+                self.assertEqual(['0', '1', '2', '3', '4'],
+                                 [item.workId for item in works])
+
+            self.assertEqual(6, m.call_count)
+            self.assertEqual(['a'], m.last_request.json()['variables'][
+                'publishers'])
+
+            # a full last page needs one more request to find the end
+            pages = list(thoth_client.iter_works(page_size=5).pages())
+            self.assertEqual([5, 0], [len(page) for page in pages])
+        return None
+
+    def test_fetch_all(self):
+        """
+        Tests that every page is fetched from the count and kept in order
+        @return: None if successful
+        """
+        work = self._read_fixture('work')['data']['work']
+        catalogue = [dict(work, workId=str(index)) for index in range(7)]
+        counted = []
+        count = len(catalogue)
+
+        def respond(request, context):
+            body = request.json()
+            variables = body['variables']
+            if 'workCount' in body['query']:
+                counted.append(variables)
+                return {'data': {'workCount': count}}
+            offset, limit = variables['offset'], variables['limit']
+            return {'data': {'works': catalogue[offset:offset + limit]}}
+
+        with requests_mock.Mocker() as m:
+            m.register_uri('POST', '{}/graphql'.format(self.endpoint),
+                           json=respond)
+            thoth_client = ThothClient(version=self.version,
+                                       thoth_endpoint=self.endpoint)
+
+            works = thoth_client.fetch_all('works', page_size=3,
+                                           max_workers=3, publishers='["a"]',
+                                           order='{field: DOI, '
+                                                 'direction: ASC}')
+            self.assertEqual([str(index) for index in range(7)],
+                             [item.workId for item in works])
+            self.assertEqual([{'publishers': ['a']}], counted)
+            self.assertEqual(4, m.call_count)
+
+            # the catalogue grew after it was counted
+            catalogue.extend(dict(work, workId=str(index))
+                             for index in range(7, 9))
+            works = thoth_client.fetch_all('works', page_size=3)
+            self.assertEqual([str(index) for index in range(9)],
+                             [item.workId for item in works])
+
+            # a count that is too high does not fan out past a short page
+            count = 100
+            calls = m.call_count
+            works = thoth_client.fetch_all('works', page_size=3,
+                                           max_workers=2)
+            self.assertEqual(9, len(works))
+            self.assertLessEqual(m.call_count - calls, 6)
+
+        self.assertRaises(ValueError, thoth_client.fetch_all, 'references')
+        # columns are built from one response, not from pages
+        for paginate in (thoth_client.fetch_all, thoth_client.paginate,
+                         thoth_client.paginate_keyset):
+            self.assertRaises(ValueError, paginate, 'works', columnar=True)
+        self.assertRaises(ValueError, thoth_client.merge_publishers, 'works',
+                          ['a'], columnar=True)
+        self.assertRaises(ValueError, thoth_client.iter_works, columnar=True)
+        self.assertRaises(ValueError, thoth_client.changes_since,
+                          columnar=['workId'])
+        return None
+
+    def test_iter_works_keyset(self):
+        """
+        Tests keyset pagination across pages that split equal timestamps
+        @return: None if successful
+        """
+        stamps = ['2021-01-01T00:00:00.000001Z'] * 4 + \
+                 ['2021-01-01T00:00:00.000002Z'] * 2 + \
+                 ['2021-01-01T00:00:00.000003Z']
+        catalogue = [{'workId': str(index), 'updatedAtWithRelations': stamp,
+                      '__typename': 'Work'}
+                     for index, stamp in enumerate(stamps)]
+        requests_seen = []
+
+        def respond(request, context):
+            variables = request.json()['variables']
+            requests_seen.append(variables)
+            rows = catalogue
+            after = variables.get('updatedAtWithRelations')
+            if after:
+                rows = [row for row in rows
+                        if row['updatedAtWithRelations'] > after['timestamp']]
+            # rows with equal timestamps come back in no particular order
+            direction = -1 if len(requests_seen) % 2 else 1
+            rows = sorted(rows, key=lambda row: (
+                row['updatedAtWithRelations'], direction * int(row['workId'])))
+            offset, limit = variables['offset'], variables['limit']
+            return {'data': {'works': rows[offset:offset + limit]}}
+
+        with requests_mock.Mocker() as m:
+            m.register_uri('POST', '{}/graphql'.format(self.endpoint),
+                           json=respond)
+            thoth_client = ThothClient(version=self.version,
+                                       thoth_endpoint=self.endpoint)
+
+            works = thoth_client.iter_works(page_size=3, keyset=True,
+                                            publishers='["a"]')
+            self.assertEqual([str(index) for index in range(7)],
+                             sorted(work.workId for work in works))
+
+            since = thoth_client.iter_works(
+                page_size=3, keyset=True, prefetch=False,
+                since='2021-01-01T00:00:00.000002Z')
+            self.assertEqual(['4', '5', '6'],
+                             sorted(work.workId for work in since))
+
+        self.assertEqual({'field': 'UPDATED_AT_WITH_RELATIONS',
+                          'direction': 'ASC'}, requests_seen[0]['order'])
+        self.assertNotIn('updatedAtWithRelations', requests_seen[0])
+        self.assertEqual({'timestamp': '2021-01-01T00:00:00.000000Z',
+                          'expression': 'GREATER_THAN'},
+                         requests_seen[1]['updatedAtWithRelations'])
+        # the second page re-reads the three rows seen at the boundary
+        self.assertEqual((0, 6), (requests_seen[1]['offset'],
+                                  requests_seen[1]['limit']))
+        self.assertRaises(ValueError, thoth_client.iter_works, keyset=True,
+                          order='{field: DOI, direction: ASC}')
+        return None
+
+    def test_iter_adaptive_page_size(self):
+        """
+        Tests that adaptive pages are sized by the bytes and time they take,
+        and that learned sizes are kept by the client
+        @return: None if successful
+        """
+        catalogue = [{'workId': '{0:04d}'.format(index), 'doi': 'x' * 1000,
+                      '__typename': 'Work'} for index in range(100)]
+        row_size = len(json.dumps(catalogue[0])) + 2
+        limits = []
+
+        def respond(request, context):
+            variables = request.json()['variables']
+            limits.append(variables['limit'])
+            offset, limit = variables['offset'], variables['limit']
+            return {'data': {'bookIds': catalogue[offset:offset + limit]}}
+
+        with requests_mock.Mocker() as m:
+            m.register_uri('POST', '{}/graphql'.format(self.endpoint),
+                           json=respond)
+            thoth_client = ThothClient(version=self.version,
+                                       thoth_endpoint=self.endpoint)
+            thoth_client.page_sizers['bookIds'] = PageSizer(
+                initial=5, target_seconds=None, target_bytes=20.5 * row_size,
+                minimum=1)
+
+            books = thoth_client.iter_book_ids(page_size=None, prefetch=False)
+            self.assertEqual(catalogue[:100],
+                             [book.toDict() for book in books])
+
+            # the page doubles at most per page, then settles on the target
+            self.assertEqual([5, 10, 20, 20, 20, 20, 20], limits)
+            self.assertEqual(20, thoth_client.page_sizer('bookIds').size)
+
+            # the next iteration starts from the learned size
+            del limits[:]
+            self.assertEqual(100, len(list(thoth_client.iter_book_ids(
+                page_size=None, prefetch=False))))
+            self.assertEqual(20, limits[0])
+
+        # slow pages shrink, bounded by the growth factor and the minimum
+        sizer = PageSizer(initial=100, target_seconds=2.0, minimum=10)
+        self.assertEqual(50, sizer.observe(100, 10.0))
+        self.assertEqual(25, sizer.observe(50, 10.0))
+        self.assertEqual(25, sizer.observe(0, 10.0))
+        sizer.size = 12
+        self.assertEqual(10, sizer.observe(12, 10.0))
+        self.assertRaises(ValueError, PageSizer, minimum=0)
+        return None
+
+    def test_changes_since(self):
+        """
+        Tests that a change feed only reads records changed since the stored
+        watermark, and that file and SQLite stores keep watermarks
+        @return: None if successful
+        """
+        catalogue = [{'workId': str(index), '__typename': 'Work',
+                      'updatedAtWithRelations':
+                          '2021-01-0{0}T00:00:00.000000Z'.format(index + 1)}
+                     for index in range(5)]
+        requests_seen = []
+
+        def respond(request, context):
+            variables = request.json()['variables']
+            requests_seen.append(variables)
+            rows = catalogue
+            after = variables.get('updatedAtWithRelations')
+            if after:
+                rows = [row for row in rows
+                        if row['updatedAtWithRelations'] > after['timestamp']]
+            offset, limit = variables['offset'], variables['limit']
+            return {'data': {'works': rows[offset:offset + limit]}}
+
+        with tempfile.TemporaryDirectory() as directory, \
+                requests_mock.Mocker() as m:
+            m.register_uri('POST', '{}/graphql'.format(self.endpoint),
+                           json=respond)
+            thoth_client = ThothClient(version=self.version,
+                                       thoth_endpoint=self.endpoint)
+            store = FileWatermarkStore(os.path.join(directory, 'marks.json'))
+
+            feed = thoth_client.changes_since(store=store, page_size=2)
+            self.assertEqual(5, len(list(feed)))
+            self.assertEqual('2021-01-05T00:00:00.000000Z', feed.commit())
+            self.assertEqual(feed.watermark, store.load('works'))
+
+            # the next run starts at the watermark and only sees the churn
+            catalogue[1]['updatedAtWithRelations'] = \
+                '2021-01-06T00:00:00.000000Z'
+            catalogue.append(catalogue.pop(1))
+            del requests_seen[:]
+            feed = thoth_client.changes_since(store=store, page_size=2)
+            self.assertEqual(['4', '1'], [work.workId for work in feed])
+            self.assertEqual(2, len(requests_seen))
+            self.assertEqual('2021-01-04T23:59:59.999999Z',
+                             requests_seen[0]['updatedAtWithRelations']
+                             ['timestamp'])
+            feed.commit()
+            self.assertEqual('2021-01-06T00:00:00.000000Z',
+                             FileWatermarkStore(store.path).load('works'))
+
+            # replacing the file keeps its permissions
+            os.chmod(store.path, 0o640)
+            store.save('books', '2021-01-01T00:00:00Z')
+            self.assertEqual(0o640, os.stat(store.path).st_mode & 0o777)
+
+            sqlite_store = SQLiteWatermarkStore(
+                os.path.join(directory, 'mirror.db'))
+            self.assertIsNone(sqlite_store.load('books'))
+            sqlite_store.save('books', '2021-01-01T00:00:00Z')
+            sqlite_store.save('books', '2021-01-02T00:00:00Z')
+            self.assertEqual('2021-01-02T00:00:00Z', SQLiteWatermarkStore(
+                sqlite_store.path).load('books'))
+
+        self.assertRaises(ValueError, thoth_client.changes_since,
+                          endpoint='publishers')
+        return None
+
+    def test_stream(self):
+        """
+        Tests that list responses are parsed item by item as they arrive
+        @return: None if successful
+        """
+        works = [{'workId': str(index), 'fullTitle': 'Título {0}'.format(index),
+                  'pageCount': 10 ** index, '__typename': 'Work'}
+                 for index in range(5)]
+        body = json.dumps({'data': {'works': works}},
+                          ensure_ascii=False).encode('utf-8')
+
+        # every split of the body, including inside characters and numbers
+        chunks_read = []
+
+        def chunks(size):
+            for start in range(0, len(body), size):
+                chunks_read.append(start)
+                yield body[start:start + size]
+
+        for size in (1, 3, 7, len(body)):
+            self.assertEqual(works, list(iter_json_array(chunks(size),
+                                                         ('data', 'works'))))
+
+        # the first item is available before the rest of the body is read
+        del chunks_read[:]
+        items = iter_json_array(chunks(8), ('data', 'works'))
+        next(items)
+        self.assertLess(len(chunks_read) * 8, len(body) / 2)
+
+        with requests_mock.Mocker() as m:
+            m.register_uri('POST', '{}/graphql'.format(self.endpoint),
+                           content=body)
+            thoth_client = ThothClient(version=self.version,
+                                       thoth_endpoint=self.endpoint)
+            streamed = thoth_client.stream('works', limit=5)
+            self.assertEqual(['0', '1', '2', '3', '4'],
+                             [work.workId for work in streamed])
+            self.assertEqual(works[4]['fullTitle'],
+                             list(thoth_client.stream('works'))[4].fullTitle)
+            self.assertEqual(len(body),
+                             thoth_client.client.transfers.last.received)
+            self.assertIn('$limit: Int',
+                          m.request_history[0].json()['query'])
+
+            m.register_uri('POST', '{}/graphql'.format(self.endpoint),
+                           json={'data': None,
+                                 'errors': [{'message': 'bad'}]})
+            self.assertRaises(GraphQLError, list, thoth_client.stream('works'))
+
+            m.register_uri('POST', '{}/graphql'.format(self.endpoint),
+                           content=body[:len(body) // 2])
+            self.assertRaises(ThothError, list, thoth_client.stream('works'))
+
+        self.assertRaises(ValueError, thoth_client.stream, 'works', raw=True)
+        return None
+
+    def test_fields(self):
+        """
+        Tests that the fields argument replaces or trims the selection of a
+        query, and that the results still build into structures
+        @return: None if successful
+        """
+        works = [{'workId': 'a', 'doi': 'https://doi.org/10.1/a',
+                  '__typename': 'Work'}]
+
+        with requests_mock.Mocker() as m:
+            m.register_uri('POST', '{}/graphql'.format(self.endpoint),
+                           json={'data': {'works': works}})
+            thoth_client = ThothClient(version=self.version,
+                                       thoth_endpoint=self.endpoint)
+
+            result = thoth_client.works(fields=['workId', 'doi'])
+            query = m.last_request.json()['query']
+            self.assertEqual(['workId', 'doi', '__typename'],
+                             query.split('{')[2].split('}')[0].split())
+            self.assertEqual('a', result[0].workId)
+            # the work formatter needs fields that were not fetched
+            self.assertIn('workId', str(result[0]))
+
+            # a declared name brings its nested selection
+            thoth_client.works(fields='workId, imprint')
+            query = m.last_request.json()['query']
+            self.assertIn('publisher { publisherName', query)
+            self.assertNotIn('fullTitle', query)
+
+            thoth_client.works(fields=['-contributions', '-longAbstract'])
+            query = m.last_request.json()['query']
+            self.assertNotIn('contributions', query)
+            self.assertNotIn('longAbstract', query)
+            self.assertIn('shortAbstract', query)
+
+            list(thoth_client.iter_works(keyset=True, fields=['doi']))
+            query = m.last_request.json()['query']
+            self.assertIn('workId', query)
+            self.assertIn('updatedAtWithRelations', query)
+
+            self.assertEqual('a', next(thoth_client.stream(
+                'works', fields=['workId'])).workId)
+            self.assertNotIn('doi', m.last_request.json()['query'])
+
+            self.assertRaises(ValueError, thoth_client.works,
+                              fields=['-notAField'])
+            self.assertRaises(ValueError, thoth_client.works,
+                              fields=['workId', '-doi'])
+
+        self.assertEqual(['a', 'b { c, d }', 'e(x: {y: 1}) { f }'],
+                         split_fields('a, b { c, d }, e(x: {y: 1}) { f }'))
+        return None
+
+    def test_profiles(self):
+        """
+        Tests the selection profiles declared in QUERIES
+        @return: None if successful
+        """
+        thoth_client = ThothClient(version=self.version,
+                                   thoth_endpoint=self.endpoint)
+
+        # every profile names fields that the query declares
+        for name, query in thoth_client.QUERIES.items():
+            declared = [field_name(field) for field in query.get('fields', [])]
+            for profile, fields in query.get('profiles', {}).items():
+                for field in fields:
+                    self.assertIn(field, declared,
+                                  '{0}.{1}'.format(name, profile))
+
+        with requests_mock.Mocker() as m:
+            m.register_uri('POST', '{}/graphql'.format(self.endpoint),
+                           json={'data': {'works': []}})
+
+            thoth_client.works(profile='ids')
+            query = m.last_request.json()['query']
+            self.assertEqual(['workId', 'updatedAtWithRelations',
+                              '__typename'],
+                             query.split('{')[2].split('}')[0].split())
+
+            thoth_client.works(profile='summary', fields=['-license'])
+            query = m.last_request.json()['query']
+            self.assertIn('fullTitle', query)
+            self.assertNotIn('license', query)
+            self.assertNotIn('longAbstract', query)
+
+            thoth_client.works(profile='full')
+            self.assertIn('longAbstract', m.last_request.json()['query'])
+
+            m.register_uri('POST', '{}/graphql'.format(self.endpoint),
+                           json={'data': {'q0': []}})
+            with thoth_client.batch() as batch:
+                result = batch.works(profile='ids')
+            self.assertNotIn('fullTitle', m.last_request.json()['query'])
+            self.assertEqual([], result.result())
+
+        self.assertRaises(ValueError, thoth_client.works, profile='tiny')
+        self.assertRaises(ValueError, thoth_client.bookIds, profile='ids')
+        return None
+
+    def test_with_count(self):
+        """
+        Tests that a list page and its total are fetched in one request
+        @return: None if successful
+        """
+        works = [{'workId': str(index), '__typename': 'Work'}
+                 for index in range(10)]
+
+        with requests_mock.Mocker() as m:
+            m.register_uri('POST', '{}/graphql'.format(self.endpoint),
+                           json={'data': {'q0': works, 'q1': 95}})
+            thoth_client = ThothClient(version=self.version,
+                                       thoth_endpoint=self.endpoint)
+
+            page = thoth_client.works(limit=10, offset=20, profile='ids',
+                                      publishers='["a"]', with_count=True)
+
+            self.assertEqual(1, m.call_count)
+            self.assertEqual(['0', '1'], [work.workId for work in page[:2]])
+            self.assertEqual((95, 3, 10), (page.total, page.page, page.pages))
+
+            request = m.last_request.json()
+            self.assertIn('q0: works(', request['query'])
+            self.assertIn('q1: workCount(', request['query'])
+            self.assertNotIn('fullTitle', request['query'])
+            # the count takes the filters but not the page
+            self.assertEqual(['a'], request['variables']['q1_publishers'])
+            self.assertNotIn('q1_limit', request['variables'])
+
+            page = pickle.loads(pickle.dumps(page))
+            self.assertEqual((95, 10), (page.total, len(page)))
+
+            # filters that only some list endpoints take reach the count
+            m.register_uri('POST', '{}/graphql'.format(self.endpoint),
+                           json={'data': {'q0': [], 'q1': 0}})
+            for method, arguments in (
+                    (thoth_client.contributions,
+                     {'contribution_type': 'EDITOR'}),
+                    (thoth_client.languages,
+                     {'language_relation': 'ORIGINAL'})):
+                page = method(with_count=True, **arguments)
+                self.assertEqual(0, page.total)
+                count = m.last_request.json()['variables']
+                self.assertEqual(1, len([key for key in count
+                                         if key.startswith('q1_')]))
+
+            # a filter that the count query can not take is refused rather
+            # than dropped from the total
+            calls = m.call_count
+            self.assertRaises(ValueError, thoth_client.prices,
+                              publishers='["a"]', with_count=True)
+            self.assertRaises(ValueError, thoth_client.fetch_all, 'fundings',
+                              publishers='["a"]')
+            self.assertEqual(calls, m.call_count)
+
+        self.assertRaises(ValueError, thoth_client.works, raw=True,
+                          with_count=True)
+        return None
+
+    def test_merge_publishers(self):
+        """
+        Tests that the works of several publishers are fetched in parallel
+        and merged, in arrival order or in order of a field
+        @return: None if successful
+        """
+        catalogues = {
+            'a': [{'workId': 'a{0}'.format(index), '__typename': 'Work',
+                   'publicationDate': '2020-0{0}-01'.format(index + 1)}
+                  for index in range(0, 6, 2)],
+            'b': [{'workId': 'b{0}'.format(index), '__typename': 'Work',
+                   'publicationDate': '2020-0{0}-01'.format(index + 1)}
+                  for index in range(1, 6, 2)] +
+                 [{'workId': 'b-undated', '__typename': 'Work',
+                   'publicationDate': None}],
+            'c': [],
+        }
+        lock = threading.Lock()
+        in_flight = [0, 0]
+        requests_seen = []
+
+        def respond(request, context):
+            variables = request.json()['variables']
+            with lock:
+                requests_seen.append(request.json())
+                in_flight[0] += 1
+                in_flight[1] = max(in_flight)
+            time.sleep(0.02)
+            with lock:
+                in_flight[0] -= 1
+            rows = catalogues[variables['publishers'][0]]
+            offset, limit = variables['offset'], variables['limit']
+            return {'data': {'works': rows[offset:offset + limit]}}
+
+        with requests_mock.Mocker() as m:
+            m.register_uri('POST', '{}/graphql'.format(self.endpoint),
+                           json=respond)
+            thoth_client = ThothClient(version=self.version,
+                                       thoth_endpoint=self.endpoint)
+
+            works = thoth_client.merge_publishers('works', ['a', 'b', 'c'],
+                                                  page_size=2, max_workers=2)
+            self.assertEqual(sorted(['a0', 'a2', 'a4', 'b1', 'b3', 'b5',
+                                     'b-undated']),
+                             sorted(work.workId for work in works))
+            self.assertLessEqual(in_flight[1], 2)
+
+            del requests_seen[:]
+            in_flight[1] = 0
+            works = thoth_client.merge_publishers(
+                'works', ['a', 'b', 'c'], order_by='publicationDate',
+                page_size=2, max_workers=2, fields=['workId'])
+            self.assertEqual(['a0', 'b1', 'a2', 'b3', 'a4', 'b5',
+                              'b-undated'], [work.workId for work in works])
+            self.assertLessEqual(in_flight[1], 2)
+            self.assertEqual({'field': 'PUBLICATION_DATE', 'direction': 'ASC'},
+                             requests_seen[0]['variables']['order'])
+            self.assertIn('publicationDate', requests_seen[0]['query'])
+
+            # an abandoned merge stops its streams
+            works = thoth_client.merge_publishers('works', ['a', 'b'],
+                                                  page_size=1)
+            next(works)
+            works.close()
+
+        self.assertRaises(ValueError, thoth_client.merge_publishers, 'works',
+                          ['a'], offset=5)
+        self.assertRaises(ValueError, thoth_client.merge_publishers, 'works',
+                          ['a'], order_by='publicationDate',
+                          order={'field': 'DOI', 'direction': 'ASC'})
+        return None
+
+    def test_records(self):
+        """
+        Tests that record results read like the Munch results they replace
+        @return: None if successful
+        """
+        with requests_mock.Mocker() as m:
+            mock_response, thoth_client = self._setup_mocker('works', m)
+            records_client = ThothClient(version=self.version,
+                                         thoth_endpoint=self.endpoint,
+                                         records=True)
+            works = thoth_client.works()
+            records = records_client.works()
+
+        self.assertEqual(len(works), len(records))
+        record = records[0]
+        self.assertEqual('Work', type(record).__name__)
+        self.assertFalse(hasattr(record, '__dict__'))
+        self.assertEqual('Work', record['__typename'])
+        self.assertEqual(works[0].imprint.publisher.publisherName,
+                         record.imprint.publisher.publisherName)
+        self.assertEqual(works[0].contributions[0].contributor.fullName,
+                         record['contributions'][0]['contributor']['fullName'])
+        self.assertIn('workId', record)
+        self.assertNotIn('notAField', record)
+        self.assertIsNone(record.get('notAField'))
+        self.assertRaises(AttributeError, getattr, record, 'notAField')
+        self.assertEqual(str(works[0]), str(record))
+        self.assertEqual(json.loads(json.dumps(works)),
+                         [item.toDict() for item in records])
+        # records of the same selection and type share a class
+        self.assertIs(type(record.imprint), type(records[1].imprint))
+
+        # records survive pickling with their class and formatting
+        unpickled = pickle.loads(pickle.dumps(records))
+        self.assertIs(type(record), type(unpickled[0]))
+        self.assertEqual(records, unpickled)
+        self.assertEqual(str(record), str(unpickled[0]))
+
+        # fields that QUERIES does not declare get slots of their own
+        extra = records_client._build_structure(
+            'works', {'workId': '1', 'extraField': 2, '__typename': 'Work'})
+        self.assertEqual(2, extra.extraField)
+        self.assertEqual({'workId', 'extraField', '__typename'},
+                         set(extra.keys()))
+        return None
+
+    def test_structure_types(self):
+        """
+        Tests that each endpoint's objects format themselves, from any
+        thread, without Munch itself being changed
+        @return: None if successful
+        """
+        munch_str, munch_repr = Munch.__str__, Munch.__repr__
+        thoth_client = ThothClient(version=self.version,
+                                   thoth_endpoint=self.endpoint)
+        fixtures = {endpoint: self._read_fixture(endpoint)['data'][endpoint]
+                    for endpoint in ('works', 'contributions', 'publishers')}
+        expected = {endpoint: [str(item) for item in
+                               thoth_client._build_structure(endpoint, data)]
+                    for endpoint, data in fixtures.items()}
+        failures = []
+
+        def build(endpoint):
+            for _ in range(20):
+                items = thoth_client._build_structure(endpoint,
+                                                      fixtures[endpoint])
+                if [str(item) for item in items] != expected[endpoint]:
+                    failures.append(endpoint)
+
+        threads = [threading.Thread(target=build, args=(endpoint,))
+                   for endpoint in fixtures for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual([], failures)
+        self.assertIs(munch_str, Munch.__str__)
+        self.assertIs(munch_repr, Munch.__repr__)
+
+        work = thoth_client._build_structure('works', fixtures['works'])[0]
+        self.assertIsInstance(work, Munch)
+        self.assertIsInstance(work.imprint, Munch)
+        self.assertIn(work.workId, str(work))
+        # lists of objects print formatted, as print(client.works()) shows
+        self.assertEqual(str(work), repr(work))
+        self.assertEqual('[{0}]'.format(work), str([work]))
+        self.assertEqual(work, pickle.loads(pickle.dumps(work)))
+        self.assertEqual(str(work), str(pickle.loads(pickle.dumps(work))))
+        return None
+
+    def test_lazy(self):
+        """
+        Tests that lazy results convert nested objects only when read and
+        otherwise behave as the Munch results they replace
+        @return: None if successful
+        """
+        with requests_mock.Mocker() as m:
+            mock_response, thoth_client = self._setup_mocker('works', m)
+            lazy_client = ThothClient(version=self.version,
+                                      thoth_endpoint=self.endpoint,
+                                      lazy=True)
+            works = thoth_client.works()
+            lazy = lazy_client.works()
+
+        self.assertEqual(works, lazy)
+
+        work = lazy[0]
+        self.assertIsInstance(work, Munch)
+        self.assertIs(dict, type(dict.__getitem__(work, 'imprint')))
+        publisher = work.imprint.publisher
+        self.assertEqual(works[0].imprint.publisher.publisherName,
+                         publisher.publisherName)
+        self.assertIsInstance(dict.__getitem__(work, 'imprint'), Munch)
+        self.assertIs(publisher, work.imprint.publisher)
+        self.assertIs(list, type(dict.__getitem__(work, 'contributions')))
+        self.assertEqual(str(works[0]), str(work))
+        self.assertEqual(works[0].contributions[0].contributor.fullName,
+                         work.get('contributions')[0]['contributor'].fullName)
+        self.assertEqual(works[0].toDict(), work.toDict())
+        self.assertEqual(json.loads(json.dumps(works)),
+                         json.loads(json.dumps(lazy)))
+
+        restored = pickle.loads(pickle.dumps(lazy))
+        self.assertEqual(works, restored)
+        self.assertEqual(str(works[1]), str(restored[1]))
+
+        # copies and concatenations of unread items convert them too
+        def unread():
+            return lazy_client._build_structure(
+                'works', self._read_fixture('works')['data']['works'])
+
+        for copy in (dict, lambda work: {**work}, lambda work: work.copy()):
+            copied = copy(unread()[1])
+            self.assertIsInstance(copied['imprint'], Munch)
+        for join in (lambda items: items[:1] + items[1:],
+                     lambda items: [] + items, lambda items: items + []):
+            joined = join(unread())
+            self.assertEqual(works, joined)
+            self.assertIsInstance(joined[1].imprint, Munch)
+            self.assertEqual(str(works[1]), str(joined[1]))
+        # printing a list formats its unread items
+        self.assertEqual(str(works), str(unread()))
+
+        self.assertRaises(ValueError, ThothClient, version=self.version,
+                          records=True, lazy=True)
+        return None
+
+    def test_normalize(self):
+        """
+        Tests that normalised results share repeated entities and strings
+        but are otherwise equal to the Munch results they replace
+        @return: None if successful
+        """
+        works = [{'workId': str(index), 'imprintId': 'i1', 'workType':
+                  'MONOGRAPH', '__typename': 'Work',
+                  'imprint': {'imprintId': 'i1', '__typename': 'Imprint',
+                              'publisher': {'publisherId': 'p1',
+                                            'publisherName': 'Press'}},
+                  'contributions': [{'contributionId': str(index),
+                                     'contributorId': 'c1',
+                                     'contributor': {'contributorId': 'c1',
+                                                     'fullName': 'A. N.'}}]}
+                 for index in range(3)]
+        # decoded separately, so that no two items share a string
+        works = json.loads(json.dumps(works))
+        works[2]['imprint']['imprintId'] = 'i2'
+        works[2]['imprint']['publisher']['publisherUrl'] = 'https://press'
+
+        with requests_mock.Mocker() as m:
+            m.register_uri('POST', '{}/graphql'.format(self.endpoint),
+                           json={'data': {'works': works}})
+            thoth_client = ThothClient(version=self.version,
+                                       thoth_endpoint=self.endpoint,
+                                       normalize=True)
+            normalized = thoth_client.works()
+            plain = ThothClient(version=self.version,
+                                thoth_endpoint=self.endpoint).works()
+
+        self.assertEqual(plain, normalized)
+        self.assertEqual(type(plain[0]), type(normalized[0]))
+        self.assertEqual(str(plain[0]), str(normalized[0]))
+        # entities are shared when their IDs and fields are the same
+        self.assertIs(normalized[0].imprint, normalized[1].imprint)
+        self.assertIs(normalized[0].contributions[0].contributor,
+                      normalized[1].contributions[0].contributor)
+        self.assertIsNot(normalized[0].imprint, normalized[2].imprint)
+        self.assertIsNot(normalized[0].imprint.publisher,
+                         normalized[2].imprint.publisher)
+        # references to other entities are not
+        self.assertIsNot(normalized[0].contributions[0],
+                         normalized[1].contributions[0])
+        self.assertIsNot(normalized[0], normalized[1])
+        self.assertIs(normalized[0].workType, normalized[2].workType)
+
+        self.assertRaises(ValueError, ThothClient, version=self.version,
+                          lazy=True, normalize=True)
+        return None
+
+    def test_columnar(self):
+        """
+        Tests that columnar results hold one typed column per field
+        @return: None if successful
+        """
+        works = [{'workId': str(index), 'workType': 'MONOGRAPH',
+                  'pageCount': 100 + index, 'imageCount': index or None,
+                  'publicationDate': '2020-01-0{0}'.format(index + 1),
+                  'imprint': {'publisher': {'publisherName': 'Press'}},
+                  'contributions': [{'fullName': 'A'}, {'fullName': 'B'}],
+                  '__typename': 'Work'}
+                 for index in range(3)]
+        del works[1]['imprint']
+
+        with requests_mock.Mocker() as m:
+            m.register_uri('POST', '{}/graphql'.format(self.endpoint),
+                           json={'data': {'works': works}})
+            thoth_client = ThothClient(version=self.version,
+                                       thoth_endpoint=self.endpoint)
+            columns = thoth_client.works(columnar=True)
+            selected = thoth_client.works(
+                columnar=['pageCount', 'contributions.fullName', 'missing'])
+            streamed = thoth_client.stream('works', columnar=True)
+            m.register_uri('POST', '{}/graphql'.format(self.endpoint),
+                           json={'data': {'references': [
+                               {'referenceId': 'r1', 'referenceOrdinal': 1},
+                               {'referenceId': 'r2', 'referenceOrdinal': 2}]}})
+            references = thoth_client.references(columnar=['referenceId'])
+
+        self.assertEqual(['r1', 'r2'], list(references['referenceId']))
+        self.assertEqual(['workId', 'workType', 'pageCount', 'imageCount',
+                          'publicationDate', 'imprint.publisher.publisherName',
+                          '__typename'], list(columns))
+        self.assertEqual([100, 101, 102], list(columns['pageCount']))
+        self.assertEqual(['Press', None, 'Press'],
+                         list(columns['imprint.publisher.publisherName']))
+        # a column of integers with nulls is a column of floats with NaN
+        self.assertTrue(math.isnan(columns['imageCount'][0]))
+        self.assertEqual([1.0, 2.0], list(columns['imageCount'][1:]))
+        self.assertEqual([['A', 'B']] * 3,
+                         list(selected['contributions.fullName']))
+        self.assertEqual([None] * 3, list(selected['missing']))
+        self.assertEqual(list(columns), list(streamed))
+        self.assertEqual(list(columns['workId']), list(streamed['workId']))
+
+        plain = to_columns(works, use_numpy=False)
+        self.assertEqual(array('q', [100, 101, 102]), plain['pageCount'])
+        self.assertEqual('d', plain['imageCount'].typecode)
+        self.assertEqual(['MONOGRAPH'] * 3, plain['workType'])
+
+        self.assertRaises(ValueError, thoth_client.works, columnar=True,
+                          raw=True)
+        self.assertRaises(ValueError, thoth_client.works, columnar=True,
+                          with_count=True)
+        return None
+
+    def test_parse_graphql_literal(self):
+        """
+        Tests the conversion of GraphQL literals into variable values
+        @return: None if successful
+        """
+        self.assertEqual(
+            {'timestamp': '2024-01-01T00:00:00Z', 'expression': 'GREATER_THAN'},
+            parse_graphql_literal('{timestamp: "2024-01-01T00:00:00Z", '
+                                  'expression: GREATER_THAN}'))
+        self.assertEqual(['a', 'b'], parse_graphql_literal('["a" "b"]'))
+        self.assertEqual([1, -2.5, True, None],
+                         parse_graphql_literal('[1, -2.5, true, null]'))
+        self.assertRaises(ValueError, parse_graphql_literal, '[ACTIVE')
+        return None
+
+    @unittest.skipIf(aiohttp is None, 'aiohttp is not installed')
+    def test_async_works(self):
+        """
+        Tests that concurrent async calls produce saved good output
+        @return: None if successful
+        """
+        server, endpoint = self._start_stub_server('works')
+
+        async def fetch():
+            async with AsyncThothClient(thoth_endpoint=endpoint,
+                                        version=self.version) as client:
+                return await asyncio.gather(
+                    *[client.works(limit=2) for _ in range(20)])
+
+        try:
+            results = asyncio.run(fetch())
+        finally:
+            server.shutdown()
+
+        self.assertEqual(20, len(results))
+        for result in results:
+            self._pickle_tester('works', lambda: result)
+        return None
+
+    @unittest.skipIf(aiohttp is None, 'aiohttp is not installed')
+    def test_async_work_by_id_raw(self):
+        """
+        A test to ensure valid passthrough of raw json on the async client
+        @return: None if successful
+        """
+        server, endpoint = self._start_stub_server('work')
+
+        async def fetch():
+            async with AsyncThothClient(thoth_endpoint=endpoint,
+                                        version=self.version) as client:
+                return await client.work_by_id(
+                    work_id='e0f748b2-984f-45cc-8b9e-13989c31dda4', raw=True)
+
+        try:
+            response = asyncio.run(fetch())
+        finally:
+            server.shutdown()
+
+        self.assertEqual(_StubHandler.body.decode('utf-8'), response)
+        return None
+
+    @unittest.skipIf(aiohttp is None, 'aiohttp is not installed')
+    def test_async_helpers(self):
+        """
+        Tests that only endpoint methods are offered as coroutines
+        @return: None if successful
+        """
+        client = AsyncThothClient(thoth_endpoint=self.endpoint,
+                                  version=self.version)
+        for name in ('fetch_all', 'paginate', 'paginate_keyset', 'stream',
+                     'merge_publishers', 'iter_works', 'changes_since',
+                     'batch', 'loader'):
+            with self.assertRaises(AttributeError):
+                getattr(client, name)
+        self.assertTrue(asyncio.iscoroutinefunction(client.works))
+        self.assertTrue(asyncio.iscoroutinefunction(client.create_work))
+        self.assertRaises(AttributeError, getattr,
+                          ThothClient(version=self.version).batch(),
+                          'fetch_all')
+        return None
+
     def _raw_tester(self, mock_response, method_to_call, lambda_mode=False):
         """
         An echo test that ensures the client returns accurate raw responses
@@ -1181,6 +2677,35 @@ class Thoth090Tests(unittest.TestCase):
             else:
                 self.assertNotEqual(loaded_response, response)
 
+    @staticmethod
+    def _read_fixture(endpoint):
+        """
+        Reads a json fixture
+        @param endpoint: the file to read in the fixtures dir (no extension)
+        @return: the decoded fixture
+        """
+        script_dir = os.path.dirname(__file__)
+        path = os.path.join(script_dir, "fixtures", "{0}.json".format(endpoint))
+        with open(path, "r") as input_file:
+            return json.load(input_file)
+
+    @staticmethod
+    def _start_stub_server(endpoint):
+        """
+        Starts a local GraphQL server that replies with a json fixture
+        @param endpoint: the file to read in the fixtures dir (no extension)
+        @return: the server and its URL
+        """
+        script_dir = os.path.dirname(__file__)
+        path = os.path.join(script_dir, "fixtures", "{0}.json".format(endpoint))
+        with open(path, "rb") as input_file:
+            _StubHandler.body = input_file.read()
+
+        server = ThreadingHTTPServer(('127.0.0.1', 0), _StubHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+        return server, 'http://127.0.0.1:{0}'.format(server.server_port)
+
     def _setup_mocker(self, endpoint, m):
         """
         Sets up a mocker object by reading a json fixture
@@ -9,19 +9,25 @@ import requests
 from .errors import ThothRESTError
 import importlib
 
+# (connect, read) timeouts in seconds
+DEFAULT_TIMEOUT = (10.0, 60.0)
+
 
 class ThothRESTClient:
     """A client for Thoth's REST API"""
     endpoint = 'https://export.thoth.pub'
     version = '042'
 
-    def __init__(self, endpoint='https://export.thoth.pub', version='0.4.2'):
+    def __init__(self, endpoint='https://export.thoth.pub', version='0.4.2',
+                 timeout=DEFAULT_TIMEOUT):
         """
         A REST client for Thoth
         @param endpoint: the endpoint of the server instance to use
         @param version: the version of the API to use
+        @param timeout: the (connect, read) timeouts in seconds, or None
         """
         self.endpoint = endpoint
+        self.timeout = timeout
         self.version = version.replace('.', '_')
 
         # this is the only magic part
@@ -35,6 +41,7 @@ class ThothRESTClient:
             version_endpoints = \
                 getattr(endpoints,
                         'ThothRESTClient{0}'.format(self.version))()
+            version_endpoints.timeout = self.timeout
 
             [setattr(self,
                      x,
@@ -80,7 +87,8 @@ class ThothRESTClient:
         @return: a requests response object
         """
         try:
-            resp = requests.get(self.endpoint + url_suffix)
+            resp = requests.get(self.endpoint + url_suffix,
+                                timeout=self.timeout)
 
             if resp.status_code != 200:
                 raise ThothRESTError('GET {0}{1}'.format(self.endpoint,